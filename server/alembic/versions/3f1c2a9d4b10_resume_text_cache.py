@@ -0,0 +1,36 @@
+"""resume text cache
+
+Revision ID: 3f1c2a9d4b10
+Revises: 5b0e2c7f9d31
+Create Date: 2026-10-17 09:12:40.118302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a9d4b10"
+down_revision: Union[str, None] = "5b0e2c7f9d31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "resume_texts",
+        sa.Column("content_hash", sa.String(length=64), primary_key=True),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("tokens", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    op.add_column("resumes", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.create_index("ix_resumes_content_hash", "resumes", ["content_hash"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resumes_content_hash", table_name="resumes")
+    op.drop_column("resumes", "content_hash")
+    op.drop_table("resume_texts")
@@ -0,0 +1,38 @@
+"""application status counts
+
+Revision ID: 4d81b6e2a05c
+Revises: e7b3f0a91c26
+Create Date: 2026-10-17 14:41:08.207615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d81b6e2a05c"
+down_revision: Union[str, None] = "e7b3f0a91c26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "application_status_counts",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("status", sa.String(50), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # seed from the existing rows; the API keeps it current from here on
+    op.execute(
+        "INSERT INTO application_status_counts (user_id, status, count) "
+        "SELECT user_id, status, COUNT(*) FROM applications "
+        "WHERE user_id IS NOT NULL AND status IS NOT NULL "
+        "GROUP BY user_id, status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("application_status_counts")
@@ -0,0 +1,66 @@
+"""baseline schema
+
+Revision ID: 5b0e2c7f9d31
+Revises:
+Create Date: 2026-10-17 09:05:00.000000
+
+The tables the app had before migrations were introduced. A database that
+was created back then with `Base.metadata.create_all` already has them;
+mark it as being at this revision before upgrading:
+
+    alembic stamp 5b0e2c7f9d31
+    alembic upgrade head
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b0e2c7f9d31"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False, unique=True),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "resumes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("filename", sa.String(255)),
+        sa.Column("file_path", sa.Text()),
+        sa.Column("uploaded_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("title", sa.String(255)),
+        sa.Column("description", sa.Text()),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "applications",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("job_id", sa.Integer(), sa.ForeignKey("jobs.id", ondelete="CASCADE")),
+        sa.Column("resume_id", sa.Integer(), sa.ForeignKey("resumes.id", ondelete="CASCADE")),
+        sa.Column("status", sa.String(50), server_default="draft"),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("applications")
+    op.drop_table("jobs")
+    op.drop_table("resumes")
+    op.drop_table("users")
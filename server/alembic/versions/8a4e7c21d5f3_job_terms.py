@@ -0,0 +1,41 @@
+"""job terms
+
+Revision ID: 8a4e7c21d5f3
+Revises: 3f1c2a9d4b10
+Create Date: 2026-10-17 10:02:15.530914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4e7c21d5f3"
+down_revision: Union[str, None] = "3f1c2a9d4b10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "terms",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("term", sa.Text(), nullable=False, unique=True),
+    )
+    op.create_table(
+        "job_terms",
+        sa.Column("job_id", sa.Integer(), sa.ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("term_id", sa.Integer(), sa.ForeignKey("terms.id", ondelete="CASCADE"), primary_key=True),
+    )
+    op.create_index("ix_job_terms_term_id", "job_terms", ["term_id"])
+    op.add_column("jobs", sa.Column("keyword_count", sa.Integer(), nullable=True))
+    # existing rows: run `python -m scripts.backfill_job_terms`
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "keyword_count")
+    op.drop_index("ix_job_terms_term_id", table_name="job_terms")
+    op.drop_table("job_terms")
+    op.drop_table("terms")
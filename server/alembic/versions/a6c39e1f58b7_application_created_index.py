@@ -0,0 +1,26 @@
+"""application created_at index
+
+Revision ID: a6c39e1f58b7
+Revises: f2a7d84c1e93
+Create Date: 2026-10-17 17:10:41.302117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6c39e1f58b7"
+down_revision: Union[str, None] = "f2a7d84c1e93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # analytics' weekly_submissions range-scans a user's applications by created_at
+    op.create_index("ix_applications_user_created", "applications", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_applications_user_created", table_name="applications")
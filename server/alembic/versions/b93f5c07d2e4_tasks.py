@@ -0,0 +1,44 @@
+"""tasks
+
+Revision ID: b93f5c07d2e4
+Revises: 4d81b6e2a05c
+Create Date: 2026-10-17 15:20:33.918472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b93f5c07d2e4"
+down_revision: Union[str, None] = "4d81b6e2a05c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.String(32), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("dedup_key", sa.String(64), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="queued"),
+        sa.Column("result", sa.Text()),
+        sa.Column("error", sa.Text()),
+        sa.Column("status_code", sa.Integer()),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now()),
+        sa.Column("started_at", sa.TIMESTAMP()),
+        sa.Column("finished_at", sa.TIMESTAMP()),
+    )
+    op.create_index("ix_tasks_user_id", "tasks", ["user_id"])
+    op.create_index("ix_tasks_dedup_key", "tasks", ["dedup_key"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_dedup_key", table_name="tasks")
+    op.drop_index("ix_tasks_user_id", table_name="tasks")
+    op.drop_table("tasks")
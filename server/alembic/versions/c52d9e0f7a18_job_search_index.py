@@ -0,0 +1,45 @@
+"""job search index
+
+Revision ID: c52d9e0f7a18
+Revises: 8a4e7c21d5f3
+Create Date: 2026-10-17 11:26:51.204776
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c52d9e0f7a18"
+down_revision: Union[str, None] = "8a4e7c21d5f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_postings",
+        sa.Column("term_id", sa.Integer(), sa.ForeignKey("terms.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("job_id", sa.Integer(), sa.ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("tf", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_job_postings_job_id", "job_postings", ["job_id"])
+    op.add_column("jobs", sa.Column("search_length", sa.Integer(), nullable=True))
+
+    if op.get_bind().dialect.name == "postgresql":
+        # native full-text index used when SEARCH_BACKEND resolves to postgres
+        op.execute(
+            "CREATE INDEX ix_jobs_fts ON jobs USING gin "
+            "(to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, '')))"
+        )
+    # existing rows (BM25 backend): run `python -m scripts.backfill_search_index`
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_jobs_fts")
+    op.drop_column("jobs", "search_length")
+    op.drop_index("ix_job_postings_job_id", table_name="job_postings")
+    op.drop_table("job_postings")
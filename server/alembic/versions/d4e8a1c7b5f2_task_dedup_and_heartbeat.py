@@ -0,0 +1,38 @@
+"""task dedup index and heartbeat
+
+Revision ID: d4e8a1c7b5f2
+Revises: a6c39e1f58b7
+Create Date: 2026-10-17 18:02:17.550913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e8a1c7b5f2"
+down_revision: Union[str, None] = "a6c39e1f58b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ACTIVE = sa.text("status IN ('queued', 'running')")
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("heartbeat_at", sa.TIMESTAMP()))
+    # two identical submits racing past the dedup SELECT: the second INSERT fails
+    op.create_index(
+        "ux_tasks_active_dedup",
+        "tasks",
+        ["user_id", "dedup_key"],
+        unique=True,
+        sqlite_where=_ACTIVE,
+        postgresql_where=_ACTIVE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_tasks_active_dedup", table_name="tasks")
+    op.drop_column("tasks", "heartbeat_at")
@@ -0,0 +1,29 @@
+"""list pagination indexes
+
+Revision ID: e7b3f0a91c26
+Revises: c52d9e0f7a18
+Create Date: 2026-10-17 13:02:40.518342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b3f0a91c26"
+down_revision: Union[str, None] = "c52d9e0f7a18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_jobs_user_created", "jobs", ["user_id", "created_at", "id"])
+    op.create_index("ix_resumes_user_uploaded", "resumes", ["user_id", "uploaded_at", "id"])
+    op.create_index("ix_applications_user_id", "applications", ["user_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_applications_user_id", table_name="applications")
+    op.drop_index("ix_resumes_user_uploaded", table_name="resumes")
+    op.drop_index("ix_jobs_user_created", table_name="jobs")
@@ -0,0 +1,32 @@
+"""collection versions
+
+Revision ID: f2a7d84c1e93
+Revises: b93f5c07d2e4
+Create Date: 2026-10-17 16:05:12.480391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a7d84c1e93"
+down_revision: Union[str, None] = "b93f5c07d2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # no seeding: a missing row reads as version 0 and the first write creates it
+    op.create_table(
+        "collection_versions",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("collection", sa.String(50), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("collection_versions")
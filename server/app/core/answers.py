@@ -0,0 +1,137 @@
+# server/app/core/answers.py
+"""
+Answer drafting behind a pluggable async generator.
+
+The backend is anything with `async generate(question, job) -> str`; the
+default is a deterministic template so the API works (and can be tested)
+without a model. Calls are fanned out under a concurrency cap, identical
+(question, job contents) requests share one in-flight call, and finished
+drafts are kept in an LRU. The cap and the in-flight calls are kept per event
+loop (there is one per worker in production); the LRU is process-wide.
+"""
+import asyncio
+import hashlib
+import importlib
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Protocol
+from weakref import WeakKeyDictionary
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class JobContext:
+    title: str
+    description: str
+
+
+class AnswerGenerator(Protocol):
+    async def generate(self, question: str, job: JobContext) -> str: ...
+
+
+class TemplateGenerator:
+    """Tiny, deterministic STAR template; the stand-in until a model is plugged in."""
+
+    async def generate(self, question: str, job: JobContext) -> str:
+        return (
+            f"**Question:** {question}\n\n"
+            f"**Draft:** For the {job.title} role, I’d use a concise STAR structure:\n"
+            f"- **Situation/Task:** Briefly set context relevant to the question.\n"
+            f"- **Action:** 2–3 concrete actions I took (tools, frameworks, teamwork).\n"
+            f"- **Result:** Quantify impact if possible (time saved, defects reduced, revenue gained).\n"
+            f"- **Tie-back:** Close by aligning with the {job.title} responsibilities."
+        )
+
+
+class GenerationError(Exception):
+    """The backend failed or timed out for one prompt."""
+
+
+def _load(spec: str) -> AnswerGenerator:
+    """'template' or 'package.module:ClassName' (instantiated with no arguments)."""
+    if spec == "template":
+        return TemplateGenerator()
+    module, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module), attr)()
+
+
+@dataclass
+class _LoopState:
+    """Concurrency cap and in-flight calls; asyncio objects only work on the loop that made them."""
+    slots: asyncio.Semaphore
+    inflight: dict[tuple, asyncio.Future] = field(default_factory=dict)
+
+
+_generator: AnswerGenerator | None = None
+_cache = LRUCache(settings.ANSWER_CACHE_SIZE)
+# per event loop (a restarted lifespan or a second TestClient gets a new one)
+_loops: "WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = WeakKeyDictionary()
+_loops_lock = Lock()
+
+
+def _state() -> _LoopState:
+    loop = asyncio.get_running_loop()
+    with _loops_lock:
+        state = _loops.get(loop)
+        if state is None:
+            state = _loops[loop] = _LoopState(asyncio.Semaphore(settings.ANSWER_CONCURRENCY))
+        return state
+
+
+def get_generator() -> AnswerGenerator:
+    global _generator
+    if _generator is None:
+        _generator = _load(settings.ANSWER_GENERATOR)
+    return _generator
+
+
+def set_generator(generator: AnswerGenerator | None) -> None:
+    """Swap the backend (None goes back to ANSWER_GENERATOR). Clears cached drafts."""
+    global _generator
+    _generator = generator
+    _cache.clear()
+
+
+def _key(question: str, job: JobContext) -> tuple:
+    digest = hashlib.sha256(f"{job.title}\x00{job.description}".encode("utf-8")).hexdigest()
+    return (question.strip(), digest)
+
+
+async def _generate(state: _LoopState, key: tuple, question: str, job: JobContext) -> str:
+    try:
+        async with state.slots:
+            draft = await asyncio.wait_for(
+                get_generator().generate(question, job),
+                timeout=settings.ANSWER_TIMEOUT_S,
+            )
+    except asyncio.TimeoutError:
+        raise GenerationError("Answer generation timed out")
+    except Exception as e:
+        raise GenerationError(f"Answer generation failed: {e!s}")
+    finally:
+        state.inflight.pop(key, None)
+    _cache.set(key, draft)
+    return draft
+
+
+async def draft(question: str, job: JobContext) -> str:
+    """Draft an answer, reusing a cached or in-flight result for the same inputs."""
+    key = _key(question, job)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+    state = _state()
+    fut = state.inflight.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(_generate(state, key, question.strip(), job))
+        state.inflight[key] = fut
+    # shield: one caller going away must not cancel the call others wait on
+    return await asyncio.shield(fut)
+
+
+def stats() -> dict:
+    with _loops_lock:
+        in_flight = sum(len(state.inflight) for state in _loops.values())
+    return {**_cache.stats(), "in_flight": in_flight}
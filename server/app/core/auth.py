@@ -1,16 +1,52 @@
 # server/app/core/auth.py
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 import jwt
 from jwt import ExpiredSignatureError, InvalidTokenError
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import LRUCache
 from app.core.config import settings
-from app.db.database import get_db
+from app.core.metrics import span
+from app.db.database import get_async_db
 from app.db.models import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_PREFIX}/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller; enough for handlers that only scope queries by user id."""
+    id: int
+    email: str
+
+
+# token subject (email) -> Principal, so cheap endpoints skip the users-table lookup
+_principals = LRUCache(settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL_S)
+
+
+def invalidate_principal(email: str) -> None:
+    _principals.pop(email)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target: User) -> None:
+    invalidate_principal(target.email)
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    email = state.attrs.email.history
+    if email.has_changes() or state.attrs.password_hash.history.has_changes():
+        for old in email.deleted or ():
+            invalidate_principal(old)
+        invalidate_principal(target.email)
+
+
+async def get_current_principal(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> Principal:
     auth_err = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid or missing credentials",
@@ -18,14 +54,59 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     )
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=["HS256"])
-        sub = payload.get("sub")
-        if not sub:
-            raise auth_err
-        user = db.query(User).filter(User.email == sub).first()
-        if not user:
-            raise auth_err
-        return user
     except ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired", headers={"WWW-Authenticate": "Bearer"})
     except InvalidTokenError:
         raise auth_err
+
+    sub = payload.get("sub")
+    uid = payload.get("uid")
+    if not sub:
+        raise auth_err
+
+    principal = _principals.get(sub)
+    if principal is not None and (uid is None or principal.id == uid):
+        return principal
+
+    # tokens carrying the user id resolve by primary key
+    with span("auth.user_lookup"):
+        if isinstance(uid, int):
+            user = await db.get(User, uid)
+            if user and user.email != sub:
+                user = None
+        else:
+            user = (await db.execute(select(User).where(User.email == sub))).scalar_one_or_none()
+    if not user:
+        raise auth_err
+
+    principal = Principal(id=user.id, email=user.email)
+    _principals.set(sub, principal)
+    return principal
+
+
+def require_admin(principal: Principal = Depends(get_current_principal)) -> Principal:
+    """Callers listed in ADMIN_EMAILS; everyone else gets a 403."""
+    admins = {e.strip().lower() for e in settings.ADMIN_EMAILS.split(",") if e.strip()}
+    if principal.email.lower() not in admins:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
+    return principal
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """Full ORM row for handlers that need more than the id."""
+    user = await db.get(User, principal.id)
+    if not user:
+        invalidate_principal(principal.email)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+def stats() -> dict:
+    return _principals.stats()
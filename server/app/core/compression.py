@@ -0,0 +1,41 @@
+# server/app/core/compression.py
+"""
+Starlette's GZipMiddleware, minus byte-addressed and event-stream responses.
+
+These go out exactly as the app sent them:
+
+- a response that advertises Accept-Ranges (file downloads): ranges are
+  offsets into the uncompressed bytes, resumes are mostly PDF/DOCX (already
+  compressed), and the stock responder would drop the zero-copy `pathsend` /
+  `zerocopysend` messages;
+- text/event-stream (streamed answer drafts): the gzip stream only flushes
+  when the response ends, so every event would arrive at once.
+"""
+from starlette.datastructures import Headers
+from starlette.middleware import gzip
+from starlette.types import Message, Receive, Scope, Send
+
+
+class _Responder(gzip.GZipResponder):
+    passthrough = False
+
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "accept-ranges" in headers
+                or headers.get("content-type", "").startswith("text/event-stream")
+            )
+        if self.passthrough:
+            await self.send(message)
+        else:
+            await super().send_with_gzip(message)
+
+
+class GZipMiddleware(gzip.GZipMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _Responder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
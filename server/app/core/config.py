@@ -5,7 +5,66 @@ class Settings(BaseSettings):
     API_PREFIX: str = "/api"
     JWT_SECRET: str = "change-me"
     JWT_EXPIRES_MIN: int = 60 * 24 * 30  # 30 days
+    JWT_INCLUDE_UID: bool = True  # put the numeric user id in tokens as `uid`
+    AUTH_CACHE_SIZE: int = 10_000   # authenticated principals kept per process
+    AUTH_CACHE_TTL_S: float = 60.0
+    # password hashing
+    BCRYPT_ROUNDS: int = 12       # cost; existing hashes are upgraded on next login
+    HASH_WORKERS: int = 4         # dedicated bcrypt threads
+    HASH_MAX_QUEUE: int = 64      # hashes allowed to wait before register/login return 503
+    HASH_RETRY_AFTER_S: int = 2
     DATABASE_URL: str   # <-- add this
+    ASYNC_DATABASE_URL: str | None = None  # default: DATABASE_URL with the asyncpg / aiosqlite driver
+    SEARCH_BACKEND: str = "auto"  # auto | bm25 | postgres (native full-text)
+    UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024  # resume uploads larger than this get a 413
+    UPLOAD_DIR: str | None = None  # blob store + temp files; default: server/uploads
+    RESUME_TEXT_CACHE_SIZE: int = 256  # in-process LRU entries in front of resume_texts
+    SCORE_CACHE_SIZE: int = 10_000  # in-process LRU of score results
+    SCORE_CACHE_SHARED: str = "none"  # none | memory (stand-in for a shared store)
+    SCORE_CACHE_TTL_S: float = 7 * 24 * 3600  # shared-tier entry lifetime
+    # PDF/DOCX extraction process pool
+    EXTRACT_WORKERS: int = 2
+    EXTRACT_MAX_QUEUE: int = 16      # documents allowed to wait for a worker before 503
+    EXTRACT_TIMEOUT_S: float = 15.0  # per-document deadline
+    EXTRACT_POISON_TTL_S: float = 600.0  # a document that overran is refused this long, then tried again
+    EXTRACT_MAX_PAGES: int = 20
+    EXTRACT_MAX_CHARS: int = 200_000
+    WARM_UP: bool = False  # load the PDF/DOCX parsers (in the pool) and numpy at startup, not on first use
+    # job URL ingestion (shared outbound client)
+    FETCH_HTTP2: bool = True
+    FETCH_TIMEOUT_S: float = 10.0
+    FETCH_MAX_CONNECTIONS: int = 100
+    FETCH_MAX_KEEPALIVE: int = 20
+    FETCH_MAX_BYTES: int = 2 * 1024 * 1024  # job pages are cut off past this
+    FETCH_CACHE_SIZE: int = 1024  # pages kept with their ETag / Last-Modified
+    # answer drafting
+    ANSWER_GENERATOR: str = "template"  # template | package.module:ClassName
+    ANSWER_CONCURRENCY: int = 8  # generator calls in flight per event loop (one per worker process)
+    ANSWER_TIMEOUT_S: float = 60.0
+    ANSWER_CACHE_SIZE: int = 2048  # drafts kept per (question, job contents)
+    # background tasks (deferred scoring / job analysis)
+    TASK_WORKER: str = "local"  # local (runs on the app's event loop) | manual (only when drained)
+    TASK_WORKERS: int = 4
+    TASK_HEARTBEAT_S: float = 30.0  # how often the process running a task says it is still alive
+    TASK_STALE_S: float = 600.0  # a "running" task silent this long is assumed orphaned and requeued at startup
+    # bulk job import
+    JOB_IMPORT_BATCH_SIZE: int = 200  # rows per INSERT ... RETURNING
+    JOB_IMPORT_MAX_ITEM_BYTES: int = 1024 * 1024  # larger records are reported and skipped
+    # response compression
+    GZIP_MIN_BYTES: int = 1024  # smaller bodies go out uncompressed
+    GZIP_LEVEL: int = 6
+    # instrumentation (/metrics)
+    SLOW_QUERY_MS: float = 200.0  # statements slower than this are logged on "app.sql"
+    # per-request profiling; when off the middleware isn't installed at all
+    PROFILE_ENABLED: bool = False
+    PROFILE_SAMPLE_RATE: float = 0.0  # fraction of requests profiled without the signed header
+    PROFILE_SECRET: str | None = None  # signs X-Profile tokens; default: JWT_SECRET
+    PROFILE_INTERVAL_MS: float = 5.0  # stack sampling period
+    PROFILE_MAX_CONCURRENT: int = 2  # profiled requests in flight at once; extra ones run unprofiled
+    PROFILE_DIR: str | None = None  # default: server/profiles
+    PROFILE_MAX_FILES: int = 200
+    PROFILE_RETENTION_S: float = 7 * 24 * 3600
+    ADMIN_EMAILS: str = ""  # comma-separated; may list and download profiles
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,246 @@
+# server/app/core/downloads.py
+"""
+Conditional and byte-range file downloads.
+
+`file_response` answers a GET/HEAD for a stored file the way a static file
+server would:
+
+- validators: a strong ETag supplied by the caller (derived from the stored
+  content hash, so it only changes when the bytes do) and Last-Modified from
+  the file's mtime;
+- If-None-Match (or, without it, If-Modified-Since) that matches -> 304;
+- Range: bytes=... -> 206 with one part, or multipart/byteranges for
+  several (overlapping and adjacent ranges are merged); 416 when none of
+  them overlaps the file; If-Range that doesn't match -> the full 200.
+
+The body goes out through the server's zero-copy path when it advertises
+one: `http.response.pathsend` for a whole file, `http.response.zerocopysend`
+(sendfile from an open descriptor) for whole files and single ranges.
+Otherwise the file is read in CHUNK_SIZE pieces on a worker thread.
+
+Zero-copy is NOT active under the server this app ships with: uvicorn 0.30
+advertises neither extension, and ASGI gives the app no socket to call
+os.sendfile on, so every download takes the chunked-read path there.
+"""
+import os
+import secrets
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Mapping
+from urllib.parse import quote
+
+import anyio
+from fastapi import Request, Response
+from starlette.types import Receive, Scope, Send
+
+# more ranges than this in one request and the whole file is sent instead
+MAX_RANGES = 16
+CHUNK_SIZE = 256 * 1024
+
+# downloads are per user: the browser keeps a copy but revalidates it, so a
+# deleted resume or a revoked session stops being served
+CACHE_CONTROL = "private, no-cache"
+
+
+def _opaque(tag: str) -> str:
+    return tag.strip().removeprefix("W/")
+
+
+def _none_match(header: str, etag: str) -> bool:
+    """If-None-Match uses the weak comparison."""
+    if header.strip() == "*":
+        return True
+    return any(_opaque(t) == _opaque(etag) for t in header.split(","))
+
+
+def _not_modified_since(header: str, mtime: float) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since is None or since.tzinfo is None:
+        return False
+    return int(mtime) <= since.timestamp()
+
+
+def _if_range(header: str, etag: str, last_modified: str) -> bool:
+    """If-Range uses the strong comparison: weak tags and inexact dates never match."""
+    header = header.strip()
+    if header.startswith(('"', "W/")):
+        return header == etag and not etag.startswith("W/")
+    return header == last_modified
+
+
+def _content_disposition(filename: str) -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def parse_ranges(header: str, size: int) -> list[tuple[int, int]] | None:
+    """
+    Sorted, merged (start, end) pairs (end inclusive) of a `bytes=` Range
+    header. None when the header should be ignored (malformed, another unit,
+    too many ranges); [] when no range overlaps a file of `size` bytes.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+    parts = spec.split(",")
+    if len(parts) > MAX_RANGES:
+        return None
+    ranges = []
+    for part in parts:
+        first, dash, last = part.strip().partition("-")
+        if not dash or not (first.isdigit() or last.isdigit()):
+            return None
+        if (first and not first.isdigit()) or (last and not last.isdigit()):
+            return None
+        if not first:  # suffix: the last N bytes
+            n = int(last)
+            if n == 0:
+                continue
+            start, end = max(size - n, 0), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            if last and int(last) < start:
+                return None
+        if start < size:
+            ranges.append((start, end))
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class FileRangeResponse(Response):
+    """Sends `segments` (bytes, or (offset, count) slices of `path`) after the headers."""
+
+    def __init__(
+        self,
+        path: Path,
+        segments: list,
+        status_code: int,
+        headers: Mapping[str, str],
+        media_type: str,
+        whole_file: bool = False,
+    ):
+        self.path = path
+        self.segments = segments
+        self.whole_file = whole_file
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.body = b""
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        extensions = scope.get("extensions") or {}
+        if self.whole_file and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+            return
+        zerocopy = "http.response.zerocopysend" in extensions and len(self.segments) == 1
+        async with await anyio.open_file(self.path, "rb") as f:
+            for i, segment in enumerate(self.segments):
+                more = i < len(self.segments) - 1
+                if isinstance(segment, bytes):
+                    await send({"type": "http.response.body", "body": segment, "more_body": more})
+                    continue
+                offset, count = segment
+                if zerocopy:
+                    await send({
+                        "type": "http.response.zerocopysend",
+                        "file": f.wrapped,
+                        "offset": offset,
+                        "count": count,
+                        "more_body": more,
+                    })
+                    continue
+                await f.seek(offset)
+                while True:  # at least one message, so an empty file still ends the response
+                    chunk = await f.read(min(CHUNK_SIZE, count)) if count else b""
+                    if count and not chunk:  # truncated underneath us; Content-Length is already out
+                        raise RuntimeError(f"{self.path} ended {count} bytes early")
+                    count -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more or count > 0})
+                    if not count:
+                        break
+
+
+def file_response(
+    request: Request,
+    path: Path,
+    etag: str,
+    filename: str | None = None,
+    media_type: str = "application/octet-stream",
+) -> Response:
+    """304 / 206 / 416 / 200 for `path`, whose contents `etag` (a strong, quoted tag) identifies."""
+    st = os.stat(path)
+    if not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(path)
+    size = st.st_size
+    last_modified = formatdate(st.st_mtime, usegmt=True)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        unchanged = _none_match(if_none_match, etag)
+    else:
+        unchanged = if_modified_since is not None and _not_modified_since(if_modified_since, st.st_mtime)
+    if unchanged:
+        return Response(status_code=304, headers={k: headers[k] for k in ("ETag", "Last-Modified", "Cache-Control")})
+
+    if filename is not None:
+        headers["Content-Disposition"] = _content_disposition(filename)
+
+    ranges = None
+    range_header = request.headers.get("range")
+    if range_header is not None:
+        if_range = request.headers.get("if-range")
+        if if_range is None or _if_range(if_range, etag, last_modified):
+            ranges = parse_ranges(range_header, size)
+
+    if ranges == []:
+        headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=416, headers=headers)
+
+    if not ranges:
+        headers["Content-Length"] = str(size)
+        return FileRangeResponse(path, [(0, size)], 200, headers, media_type, whole_file=True)
+
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return FileRangeResponse(path, [(start, end - start + 1)], 206, headers, media_type)
+
+    boundary = secrets.token_hex(16)
+    segments: list = []
+    length = 0
+    for start, end in ranges:
+        head = (
+            f"\r\n--{boundary}\r\nContent-Type: {media_type}\r\n"
+            f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+        ).encode("latin-1")
+        segments += [head, (start, end - start + 1)]
+        length += len(head) + end - start + 1
+    tail = f"\r\n--{boundary}--\r\n".encode("latin-1")
+    segments.append(tail)
+    headers["Content-Length"] = str(length + len(tail))
+    return FileRangeResponse(path, segments, 206, headers, f"multipart/byteranges; boundary={boundary}")
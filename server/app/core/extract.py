@@ -0,0 +1,296 @@
+# server/app/core/extract.py
+"""
+Document text extraction off the request threadpool.
+
+PDF/DOCX parsing is CPU-bound and holds the GIL, so it runs in a small
+process pool instead of in the thread that serves the request. Each document
+gets a page cap, a text-length cap and a deadline that starts when a worker
+picks it up, not while it waits in line; a pathological file fails fast and
+is remembered for EXTRACT_POISON_TTL_S so retries don't tie up a worker
+again. Plain-text files are cheap and are still read inline.
+"""
+import asyncio
+import signal
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+from multiprocessing import get_context
+from pathlib import Path
+from threading import BoundedSemaphore, Lock
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.metrics import span
+from app.core.text import read_text_from_path, warm_up as load_readers
+
+_POOLED = {".pdf", ".docx"}
+
+
+class ExtractionBusy(Exception):
+    """Too many documents are already waiting for a worker."""
+
+
+class ExtractionTimeout(Exception):
+    """The document took longer than EXTRACT_TIMEOUT_S to parse."""
+
+
+class _Deadline(BaseException):
+    # BaseException so the parsers' `except Exception` blocks don't swallow it
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise _Deadline()
+
+
+# in a pool worker: the parent's _picked_up array (see below)
+_worker_picked_up = None
+
+
+def _init_worker(picked_up) -> None:
+    global _worker_picked_up
+    _worker_picked_up = picked_up
+
+
+def _extract_in_worker(path: str, ticket: int, max_pages: int, max_chars: int, timeout: float) -> str | None:
+    """Runs in the child process. Returns None when the deadline hits."""
+    _worker_picked_up[ticket] = time.time()
+    use_alarm = hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return read_text_from_path(Path(path), max_pages=max_pages)[:max_chars]
+    except _Deadline:
+        return None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class _Stats:
+    def __init__(self):
+        self.lock = Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            done = self.completed + self.failed + self.timeouts
+            return {
+                "workers": settings.EXTRACT_WORKERS,
+                "in_flight": self.in_flight,
+                "queue_depth": max(0, self.in_flight - settings.EXTRACT_WORKERS),
+                "completed": self.completed,
+                "failed": self.failed,
+                "timeouts": self.timeouts,
+                "rejected": self.rejected,
+                "latency_ms_avg": round(self.latency_total / done * 1000, 1) if done else 0.0,
+                "latency_ms_max": round(self.latency_max * 1000, 1),
+            }
+
+
+_stats = _Stats()
+_capacity = settings.EXTRACT_WORKERS + settings.EXTRACT_MAX_QUEUE
+_slots = BoundedSemaphore(_capacity)
+# paths that timed out; fail immediately on retry until the entry expires
+_poisoned = LRUCache(1024, ttl=settings.EXTRACT_POISON_TTL_S)
+# one cell per slot: when a worker picked that document up (time.time(), 0 while
+# it is still queued), so the backstop doesn't count time spent waiting in line
+_picked_up = get_context("spawn").Array("d", _capacity, lock=False)
+_tickets = list(range(_capacity))  # free cells; guarded by _stats.lock
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.EXTRACT_WORKERS,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(_picked_up,),
+            )
+        return _pool
+
+
+def _reset_pool() -> None:
+    """Kill a pool whose worker ignored its deadline and start fresh on next use."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        for proc in list(getattr(pool, "_processes", {}).values()):
+            proc.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def warm_up() -> None:
+    """Start the pool's workers and have each load its parsers now rather than on the first document."""
+    pool = _get_pool()
+    futures = [pool.submit(load_readers, tuple(_POOLED)) for _ in range(settings.EXTRACT_WORKERS)]
+    await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+
+
+def shutdown() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _Job:
+    """A document handed to the pool; its slot goes back when the pool is done with it."""
+
+    def __init__(self, path: Path, ticket: int):
+        self.path = path
+        self.ticket = ticket
+        self.started = time.perf_counter()
+        self.overran = False
+        self.fut: Future | None = None
+
+    def deadline(self) -> float | None:
+        """When the backstop fires (time.time()); None until a worker picks the document up."""
+        picked_up = _picked_up[self.ticket]
+        return picked_up + _grace() if picked_up else None
+
+
+def _submit(path: Path) -> _Job:
+    key = str(path)
+    if _poisoned.get(key):
+        raise ExtractionTimeout(key)
+    if not _slots.acquire(blocking=False):
+        with _stats.lock:
+            _stats.rejected += 1
+        raise ExtractionBusy()
+    with _stats.lock:
+        _stats.in_flight += 1
+        job = _Job(path, _tickets.pop())
+    _picked_up[job.ticket] = 0.0
+    try:
+        job.fut = _get_pool().submit(
+            _extract_in_worker,
+            key,
+            job.ticket,
+            settings.EXTRACT_MAX_PAGES,
+            settings.EXTRACT_MAX_CHARS,
+            settings.EXTRACT_TIMEOUT_S,
+        )
+    except BaseException:
+        _release(job, None)
+        raise
+    # released from here, not by the caller, so a waiter that goes away (a
+    # cancelled request) can't leak the slot
+    job.fut.add_done_callback(lambda fut: _release(job, _outcome(job, fut)))
+    return job
+
+
+def _outcome(job: _Job, fut: Future) -> str:
+    if job.overran:
+        return "timeouts"
+    if fut.cancelled() or fut.exception() is not None:
+        return "failed"
+    return "timeouts" if fut.result() is None else "completed"
+
+
+def _release(job: _Job, outcome: str | None) -> None:
+    _slots.release()
+    with _stats.lock:
+        _tickets.append(job.ticket)
+        _stats.in_flight -= 1
+        if outcome is None:
+            return
+        elapsed = time.perf_counter() - job.started
+        _stats.latency_total += elapsed
+        _stats.latency_max = max(_stats.latency_max, elapsed)
+        setattr(_stats, outcome, getattr(_stats, outcome) + 1)
+
+
+def _finish(job: _Job) -> str:
+    try:
+        text = job.fut.result(timeout=0)
+    except Exception:  # parser crash, BrokenProcessPool, cancelled by _reset_pool
+        return ""
+    if text is None:
+        _poisoned.set(str(job.path), True)
+        raise ExtractionTimeout(str(job.path))
+    return text
+
+
+# how often a waiter checks whether its document has reached a worker yet
+_POLL_S = 0.25
+
+
+def _grace() -> float:
+    # the worker enforces the deadline itself; this backstop, counted from the
+    # moment a worker picks the document up, only fires if it can't
+    return settings.EXTRACT_TIMEOUT_S + 5
+
+
+def _wait_for(job: _Job) -> float | None:
+    """Seconds to wait before checking `job` again; None once its worker has overrun."""
+    deadline = job.deadline()
+    if deadline is None:
+        return _POLL_S  # still queued behind other documents: no clock running
+    remaining = deadline - time.time()
+    return remaining if remaining > 0 else None
+
+
+def _timed_out(job: _Job) -> None:
+    """A worker has held this document past its deadline; only killing the pool frees it."""
+    job.overran = True
+    _poisoned.set(str(job.path), True)
+    _reset_pool()
+    raise ExtractionTimeout(str(job.path))
+
+
+def extract_text(path: Path) -> str:
+    """
+    Extract text from `path`, blocking the calling thread (not the GIL).
+    Raises ExtractionBusy when the queue is full and ExtractionTimeout when
+    the document exceeds its deadline.
+    """
+    ext = path.suffix.lower()
+    with span(f"extract{ext}"):
+        if ext not in _POOLED:
+            return read_text_from_path(path)[: settings.EXTRACT_MAX_CHARS]
+        job = _submit(path)
+        while not job.fut.done():
+            timeout = _wait_for(job)
+            if timeout is None:
+                _timed_out(job)
+            try:
+                job.fut.exception(timeout=timeout)
+            except FutureTimeout:
+                pass
+            except Exception:
+                break  # cancelled; reported by _finish
+        return _finish(job)
+
+
+async def extract_text_async(path: Path) -> str:
+    """Same as extract_text, awaited from the event loop."""
+    ext = path.suffix.lower()
+    with span(f"extract{ext}"):
+        if ext not in _POOLED:
+            return read_text_from_path(path)[: settings.EXTRACT_MAX_CHARS]
+        job = _submit(path)
+        waiter = asyncio.wrap_future(job.fut)
+        while not waiter.done():
+            timeout = _wait_for(job)
+            if timeout is None:
+                _timed_out(job)
+            # asyncio.wait leaves the future running when it times out or we're cancelled
+            await asyncio.wait({waiter}, timeout=timeout)
+        return _finish(job)
+
+
+def stats() -> dict:
+    return _stats.snapshot()
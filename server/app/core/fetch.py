@@ -0,0 +1,144 @@
+# server/app/core/fetch.py
+"""
+Outbound page fetches for job URL ingestion.
+
+One AsyncClient lives for the whole process, so connections (and their TLS
+sessions) are pooled across requests, with HTTP/2 where the server offers it.
+Bodies are streamed straight into the HTML text extractor; the download stops
+at FETCH_MAX_BYTES or as soon as enough text has been extracted. Pages are
+remembered by URL together with their ETag / Last-Modified validators; the
+next fetch of a popular posting is a conditional GET and a 304 reuses the
+stored text. httpx is imported when the first client is created, not at boot.
+"""
+from __future__ import annotations
+
+import codecs
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.html_text import HTMLTextExtractor
+
+
+class FetchError(Exception):
+    """The page could not be fetched; the message is safe to show the caller."""
+
+
+@dataclass(frozen=True)
+class Page:
+    url: str
+    text: str
+    truncated: bool
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+_client: httpx.AsyncClient | None = None
+_pages = LRUCache(settings.FETCH_CACHE_SIZE)  # (url, max_chars) -> Page with validators
+_revalidated = 0  # conditional GETs answered with 304
+
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        import httpx
+
+        _client = httpx.AsyncClient(
+            http2=settings.FETCH_HTTP2,
+            timeout=httpx.Timeout(settings.FETCH_TIMEOUT_S, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=settings.FETCH_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.FETCH_MAX_KEEPALIVE,
+                keepalive_expiry=30.0,
+            ),
+            follow_redirects=True,
+            headers={"User-Agent": f"{settings.APP_NAME}/1.0", "Accept": "text/html,*/*;q=0.8"},
+        )
+    return _client
+
+
+async def aclose() -> None:
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _decoder(resp: httpx.Response):
+    try:
+        return codecs.getincrementaldecoder(resp.charset_encoding or "utf-8")(errors="replace")
+    except LookupError:  # bogus charset in Content-Type
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+async def _extract(resp: httpx.Response, max_bytes: int, max_chars: int) -> tuple[str, bool]:
+    """Feed the body to the extractor chunk by chunk; stop at either cap."""
+    decoder = _decoder(resp)
+    parser = HTMLTextExtractor(max_chars)
+    size = 0
+    truncated = False
+    async for chunk in resp.aiter_bytes():
+        room = max_bytes - size
+        if len(chunk) >= room:
+            chunk, truncated = chunk[:room], len(chunk) > room
+        size += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.done or size >= max_bytes:
+            truncated = truncated or parser.done
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.text, truncated
+
+
+async def fetch_page(url: str, max_chars: int) -> Page:
+    """
+    GET `url` (revalidating a cached copy when we have validators for it) and
+    return up to `max_chars` of its visible text.
+    Raises FetchError on network errors and non-200 answers.
+    """
+    global _revalidated
+    key = (url, max_chars)
+    cached: Page | None = _pages.get(key)
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    client = get_client()
+    import httpx  # already loaded by get_client
+
+    try:
+        async with client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304 and cached is not None:
+                _revalidated += 1
+                return cached
+            if resp.status_code != 200:
+                raise FetchError(f"Failed to fetch URL (status {resp.status_code})")
+            text, truncated = await _extract(resp, settings.FETCH_MAX_BYTES, max_chars)
+    except httpx.HTTPError as e:
+        raise FetchError(f"Error fetching URL: {e!s}")
+
+    page = Page(
+        url=url,
+        text=text,
+        truncated=truncated,
+        etag=resp.headers.get("etag"),
+        last_modified=resp.headers.get("last-modified"),
+    )
+    if page.etag or page.last_modified:
+        _pages.set(key, page)
+    else:
+        _pages.pop(key)
+    return page
+
+
+def stats() -> dict:
+    return {**_pages.stats(), "revalidated": _revalidated}
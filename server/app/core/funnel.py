@@ -0,0 +1,132 @@
+# server/app/core/funnel.py
+"""
+Application funnel counters.
+
+`application_status_counts` holds, per user, how many applications sit in
+each status. Every write path that creates, moves or removes applications
+adjusts it in the same transaction, so the dashboard reads a handful of rows
+instead of counting the user's whole history.
+"""
+from collections import Counter
+from typing import Mapping
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db.models import Application, ApplicationStatusCount
+
+# pipeline order of the allowed statuses; "rejected" can follow any of them
+PIPELINE = ("draft", "submitted", "received", "interview_requested", "onsite_requested", "offer")
+REJECTED = "rejected"
+
+
+def bump(db: Session, user_id: int, deltas: Mapping[str, int]) -> None:
+    """Add `deltas` (status -> +/-n) to the user's counters. Caller commits."""
+    rows = [{"user_id": user_id, "status": s, "count": n} for s, n in deltas.items() if n]
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = pg_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert(ApplicationStatusCount)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "status"],
+                set_={"count": ApplicationStatusCount.count + stmt.excluded.count},
+            ),
+            rows,
+        )
+        return
+    for row in rows:  # no portable upsert; read-modify-write under the row lock
+        counter = db.get(ApplicationStatusCount, (user_id, row["status"]), with_for_update=True)
+        if counter is None:
+            db.add(ApplicationStatusCount(**row))
+        else:
+            counter.count += row["count"]
+
+
+def move(db: Session, user_id: int, ids: set[int], status: str) -> None:
+    """Switch applications `ids` to `status` and adjust the counters. Caller commits."""
+    # lock the rows (where the database can), then move one old status at a
+    # time: each UPDATE's rowcount is exactly what left that status, so a
+    # concurrent move of the same rows can't be counted twice
+    rows = db.execute(
+        select(Application.id, Application.status)
+        .where(Application.id.in_(ids), Application.status != status)
+        .with_for_update()
+    ).all()
+    by_status: dict[str, list[int]] = {}
+    for app_id, old in rows:
+        by_status.setdefault(old, []).append(app_id)
+    deltas: Counter = Counter()
+    for old, app_ids in by_status.items():
+        n = db.execute(
+            update(Application)
+            .where(Application.id.in_(app_ids), Application.status == old)
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        deltas[old] -= n
+        deltas[status] += n
+    bump(db, user_id, deltas)
+
+
+def remove(db: Session, user_id: int, *criteria) -> None:
+    """Delete the user's applications matching `criteria` and their counts. Caller commits."""
+    where = (Application.user_id == user_id, *criteria)
+    gone = db.execute(
+        select(Application.status, func.count()).where(*where).group_by(Application.status)
+    ).all()
+    if not gone:
+        return
+    bump(db, user_id, {status: -n for status, n in gone})
+    db.query(Application).filter(*where).delete(synchronize_session=False)
+
+
+def status_counts(db: Session, user_id: int) -> dict[str, int]:
+    rows = db.execute(
+        select(ApplicationStatusCount.status, ApplicationStatusCount.count)
+        .where(ApplicationStatusCount.user_id == user_id)
+    ).all()
+    return {status: n for status, n in rows if n}
+
+
+def _week_start(db: Session):
+    if db.get_bind().dialect.name == "sqlite":
+        # Monday of the row's week
+        return func.date(Application.created_at, "weekday 0", "-6 days")
+    return func.date(func.date_trunc("week", Application.created_at))
+
+
+def weekly_submissions(db: Session, user_id: int, since) -> list[tuple]:
+    """(week start, applications created that week) for weeks since `since`, oldest first."""
+    week = _week_start(db).label("week")
+    return db.execute(
+        select(week, func.count())
+        .where(
+            Application.user_id == user_id,
+            Application.created_at >= since,
+            Application.status != "draft",
+        )
+        .group_by(week)
+        .order_by(week)
+    ).all()
+
+
+def funnel(counts: Mapping[str, int]) -> list[dict]:
+    """
+    Applications that reached each pipeline stage (currently there or further
+    along) and the conversion from the previous stage. Rejected applications
+    only count toward the total; the stage they dropped out at isn't stored.
+    """
+    out = []
+    reached = sum(counts.get(s, 0) for s in PIPELINE)
+    prev = None
+    for stage in PIPELINE:
+        rate = round(reached / prev, 4) if prev else None
+        out.append({"stage": stage, "reached": reached, "conversion": rate})
+        prev = reached
+        reached -= counts.get(stage, 0)
+    return out
@@ -0,0 +1,146 @@
+# server/app/core/html_text.py
+"""
+Single-pass HTML → text for job pages.
+
+The extractor is fed chunks as they arrive from the network and walks each
+byte once: text runs are found with str.find, tags are matched in place, and
+<script>/<style>/<noscript> bodies are skipped with one search for their end
+tag, keeping only a few characters of them in memory. Tag boundaries become a
+single space, runs of whitespace collapse, and character references are
+decoded per text run. Once `max_chars` of text have been produced the
+extractor reports `done` and ignores further input, so the caller can stop
+downloading.
+"""
+import re
+from html import unescape
+
+# <name or </name (a "<" followed by anything else is literal text)
+_TAG_OPEN = re.compile(r"</?([A-Za-z][^\s/>]*)")
+# rest of the tag up to ">", quoted attribute values may contain ">"
+_TAG_REST = re.compile(r"""[^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*>""")
+# content is raw text up to the matching end tag
+_RAW = {name: re.compile(rf"</{name}\s*>", re.I) for name in ("script", "style", "noscript")}
+# content is markup but never visible text
+_NESTED = {"template", "svg"}
+_RAW_TAIL = 16  # kept from a skipped body in case its end tag spans two chunks
+
+
+class HTMLTextExtractor:
+    def __init__(self, max_chars: int | None = None):
+        self.max_chars = max_chars
+        self.done = False
+        self._buf = ""
+        self._parts: list[str] = []
+        self._size = 0
+        self._raw: re.Pattern | None = None  # end-tag pattern while inside a raw element
+        self._skip = 0  # depth inside _NESTED elements
+        self._space = False  # a separator is owed before the next word
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, data: str) -> None:
+        if self.done:
+            return
+        self._buf += data
+        self._scan(final=False)
+
+    def close(self) -> None:
+        if not self.done:
+            self._scan(final=True)
+        self._buf = ""
+
+    def _scan(self, final: bool) -> None:
+        buf = self._buf
+        n = len(buf)
+        pos = 0
+        while pos < n and not self.done:
+            if self._raw is not None:
+                m = self._raw.search(buf, pos)
+                if m is None:
+                    pos = n if final else max(pos, n - _RAW_TAIL)
+                    break
+                pos = m.end()
+                self._raw = None
+                self._space = True
+                continue
+
+            lt = buf.find("<", pos)
+            if lt < 0:
+                # the run may continue (or end in half an entity) in the next chunk
+                if final:
+                    self._text(buf[pos:])
+                    pos = n
+                break
+            if lt > pos:
+                self._text(buf[pos:lt])
+                pos = lt
+            if not final and buf.find(">", lt) < 0:
+                break  # no markup can be complete yet
+
+            if buf.startswith("<!--", lt):
+                end = buf.find("-->", lt + 4)
+                if end < 0:
+                    pos = n if final else lt
+                    break
+                pos = end + 3
+                continue
+
+            m = _TAG_OPEN.match(buf, lt)
+            if m is None:
+                if buf[lt + 1 : lt + 2] in ("!", "?"):  # doctype, CDATA, processing instruction
+                    end = buf.find(">", lt)
+                    if end < 0:
+                        pos = n if final else lt
+                        break
+                    pos = end + 1
+                    self._space = True
+                else:
+                    self._text("<")
+                    pos = lt + 1
+                continue
+
+            rest = _TAG_REST.match(buf, m.end())
+            if rest is None:
+                pos = n if final else lt
+                break
+            pos = rest.end()
+            self._space = True
+            name = m.group(1).lower()
+            closing = buf[lt + 1] == "/"
+            if name in _RAW and not closing and buf[pos - 2] != "/":
+                self._raw = _RAW[name]
+            elif name in _NESTED:
+                if closing:
+                    self._skip = max(0, self._skip - 1)
+                elif buf[pos - 2] != "/":
+                    self._skip += 1
+        self._buf = buf[pos:]
+
+    def _text(self, data: str) -> None:
+        if self._skip:
+            return
+        if "&" in data:
+            data = unescape(data)
+        words = data.split()
+        if not words:
+            self._space = self._space or bool(data)
+            return
+        chunk = " ".join(words)
+        if self._size and (self._space or data[0].isspace()):
+            chunk = " " + chunk
+        self._space = data[-1].isspace()
+        if self.max_chars is not None:
+            chunk = chunk[: self.max_chars - self._size]
+        self._parts.append(chunk)
+        self._size += len(chunk)
+        if self.max_chars is not None and self._size >= self.max_chars:
+            self.done = True
+
+
+def html_to_text(html: str, max_chars: int | None = None) -> str:
+    parser = HTMLTextExtractor(max_chars)
+    parser.feed(html)
+    parser.close()
+    return parser.text
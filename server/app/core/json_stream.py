@@ -0,0 +1,139 @@
+# server/app/core/json_stream.py
+"""
+Incremental parsing of request bodies that carry many JSON records, either
+newline-delimited (NDJSON) or as one top-level array.
+
+Records are yielded as soon as they are complete, so a large import never
+has to be buffered whole. A bad NDJSON line is reported and skipped; inside
+an array there is no way to resynchronise after malformed JSON, so the error
+is reported and the rest of the body ignored.
+"""
+import codecs
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+_WS = " \t\r\n"
+
+
+@dataclass
+class Record:
+    index: int  # 1-based line number (NDJSON) or array position
+    value: Any = None
+    error: str | None = None
+
+
+def _parse(index: int, raw: bytes) -> Record:
+    try:
+        return Record(index, json.loads(raw))
+    except ValueError as e:  # JSONDecodeError, UnicodeDecodeError
+        return Record(index, error=f"Invalid JSON: {e}")
+
+
+async def _ndjson(buf: bytes, chunks: AsyncIterator[bytes], max_item_bytes: int) -> AsyncIterator[Record]:
+    line = 0
+    skipping = False  # inside an oversize line, dropping bytes up to its newline
+    eof = False
+    while True:
+        start = 0
+        while (nl := buf.find(b"\n", start)) >= 0:
+            raw = buf[start:nl]
+            start = nl + 1
+            line += 1
+            if skipping:
+                skipping = False
+            elif len(raw) > max_item_bytes:
+                yield Record(line, error=f"Line exceeds {max_item_bytes} bytes")
+            elif raw.strip():
+                yield _parse(line, raw)
+        buf = buf[start:]
+        if not skipping and len(buf) > max_item_bytes:
+            yield Record(line + 1, error=f"Line exceeds {max_item_bytes} bytes")
+            skipping = True
+        if skipping:
+            buf = b""
+        if eof:
+            break
+        try:
+            buf += await chunks.__anext__()
+        except StopAsyncIteration:
+            eof = True
+            buf += b"\n"  # flush a last line without a trailing newline
+
+
+async def _array(head: bytes, chunks: AsyncIterator[bytes], max_item_bytes: int) -> AsyncIterator[Record]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = json.JSONDecoder()
+    try:
+        text = decoder.decode(head)
+    except UnicodeDecodeError as e:
+        yield Record(1, error=f"Invalid UTF-8: {e}")
+        return
+    pos = 1  # past the "["
+    index = 0
+    expect_item = True  # False once an item was read and "," or "]" must follow
+    eof = False
+    while True:
+        while True:
+            while pos < len(text) and text[pos] in _WS:
+                pos += 1
+            if pos >= len(text):
+                break
+            if not expect_item:
+                if text[pos] == ",":
+                    pos, expect_item = pos + 1, True
+                    continue
+                if text[pos] == "]":
+                    return
+                yield Record(index + 1, error=f"Expected ',' or ']' at item {index + 1}")
+                return
+            if text[pos] == "]" and index == 0:
+                return
+            try:
+                value, end = parser.raw_decode(text, pos)
+            except ValueError as e:
+                if eof:
+                    yield Record(index + 1, error=f"Invalid JSON: {e}")
+                    return
+                if len(text) - pos > max_item_bytes:
+                    yield Record(index + 1, error=f"Item exceeds {max_item_bytes} bytes")
+                    return
+                break  # probably incomplete; wait for more of the body
+            index += 1
+            pos, expect_item = end, False
+            yield Record(index, value)
+        if eof:
+            yield Record(index + 1, error="Unexpected end of body (unterminated array)")
+            return
+        text = text[pos:]
+        pos = 0
+        try:
+            text += decoder.decode(await chunks.__anext__())
+        except StopAsyncIteration:
+            eof = True
+            text += decoder.decode(b"", final=True)
+        except UnicodeDecodeError as e:
+            yield Record(index + 1, error=f"Invalid UTF-8: {e}")
+            return
+
+
+async def iter_records(body: AsyncIterator[bytes], max_item_bytes: int) -> AsyncIterator[Record]:
+    """
+    Yield the records of a streamed body. The format is sniffed from the
+    first non-blank byte: "[" means a JSON array, anything else NDJSON.
+    """
+    chunks = body.__aiter__()
+    buf = b""
+    async for chunk in chunks:
+        buf += chunk
+        if buf.strip():
+            break
+    head = buf.lstrip()
+    if not head:
+        return
+    if head[:1] == b"[":
+        records = _array(head, chunks, max_item_bytes)
+    else:
+        records = _ndjson(buf, chunks, max_item_bytes)
+    async for rec in records:
+        yield rec
@@ -0,0 +1,249 @@
+# server/app/core/metrics.py
+"""
+In-process instrumentation, exported in the Prometheus text format.
+
+- `MetricsMiddleware` times every request per route template (not per raw
+  path, so ids don't explode the label space), tracks requests in flight,
+  and attaches a per-request SQL tally that engine events fill in.
+- `instrument_engine` hooks an Engine's cursor events: statement counts and
+  durations go to the current request's tally and to global histograms;
+  statements slower than SLOW_QUERY_MS are logged on "app.sql".
+- `span(name)` times a block (text extraction, tokenization, ...).
+- `render()` writes all of it, plus any plain stats dicts passed in (the
+  existing cache / pool / worker snapshots) as gauges.
+
+Everything is process-local; with several workers, scrape each one.
+"""
+import logging
+import re
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Iterator, Mapping, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+log = logging.getLogger("app.sql")
+
+
+def _labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name, self.help, self.label_names = name, help, tuple(labels)
+        self._values: dict[tuple, float] = {}
+        self._lock = Lock()
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_labels(self.label_names, labels)} {value:g}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name, self.help, self.label_names = name, help, tuple(labels)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._series: dict[tuple, list] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labels) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][i] += 1
+            series[1] += value
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1])) for k, v in self._series.items())
+        names = self.label_names + ("le",)
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                yield f"{self.name}_bucket{_labels(names, labels + (le,))} {cumulative}"
+            base = _labels(self.label_names, labels)
+            yield f"{self.name}_sum{base} {total:g}"
+            yield f"{self.name}_count{base} {cumulative}"
+
+
+REQUESTS = Counter("http_requests_total", "Requests handled.", ("method", "route", "status"))
+REQUEST_LATENCY = Histogram("http_request_duration_seconds", "Request latency.", ("method", "route"))
+IN_FLIGHT = Gauge("http_requests_in_flight", "Requests currently being handled.", ("method",))
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements executed per request.", ("method", "route"), COUNT_BUCKETS
+)
+REQUEST_SQL_TIME = Histogram(
+    "http_request_db_seconds", "Time spent in SQL per request.", ("method", "route"), QUERY_BUCKETS
+)
+QUERY_LATENCY = Histogram("db_query_duration_seconds", "SQL statement latency.", ("engine", "verb"), QUERY_BUCKETS)
+SLOW_QUERIES = Counter("db_slow_queries_total", "Statements slower than SLOW_QUERY_MS.", ("engine", "verb"))
+SPANS = Histogram("app_span_duration_seconds", "Time spent in instrumented blocks.", ("span",))
+
+_METRICS = (REQUESTS, REQUEST_LATENCY, IN_FLIGHT, REQUEST_QUERIES, REQUEST_SQL_TIME, QUERY_LATENCY, SLOW_QUERIES, SPANS)
+
+
+@dataclass
+class RequestTally:
+    queries: int = 0
+    sql_seconds: float = 0.0
+
+
+# set by the middleware; sync routes see it too (the threadpool copies the context)
+_tally: ContextVar[RequestTally | None] = ContextVar("request_tally", default=None)
+
+
+@contextmanager
+def span(name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        SPANS.observe(time.perf_counter() - t0, name)
+
+
+_VERB_RE = re.compile(r"\s*(\w+)")
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Count and time every statement on `engine` (pass `async_engine.sync_engine` for async)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        m = _VERB_RE.match(statement)
+        verb = m.group(1).upper() if m else "OTHER"
+        QUERY_LATENCY.observe(elapsed, name, verb)
+        tally = _tally.get()
+        if tally is not None:
+            tally.queries += 1
+            tally.sql_seconds += elapsed
+        if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            SLOW_QUERIES.inc(name, verb)
+            log.warning("slow query (%.1f ms, %s): %s", elapsed * 1000, name, " ".join(statement.split())[:500])
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        # after_cursor_execute doesn't fire for a failed statement
+        starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+        if starts:
+            starts.pop()
+
+
+class MetricsMiddleware:
+    """Pure ASGI, so streaming responses are timed until their last chunk."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        status = 500
+        tally = RequestTally()
+        token = _tally.set(tally)
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc(method)
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - t0
+            IN_FLIGHT.dec(method)
+            _tally.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            REQUESTS.inc(method, path, str(status))
+            REQUEST_LATENCY.observe(elapsed, method, path)
+            REQUEST_QUERIES.observe(tally.queries, method, path)
+            REQUEST_SQL_TIME.observe(tally.sql_seconds, method, path)
+
+
+def _numeric(stats: Mapping, prefix: str = "") -> Iterator[tuple[str, float]]:
+    for key, value in stats.items():
+        if isinstance(value, Mapping):
+            yield from _numeric(value, f"{prefix}{key}_")
+        elif isinstance(value, (int, float)):  # bools included
+            yield f"{prefix}{key}", float(value)
+
+
+def _gauges(group: str, snapshots: Sequence[tuple[Mapping[str, str], Mapping]]) -> Iterator[str]:
+    """Numeric fields of plain stats dicts as `app_<group>_<field>{labels}` gauges."""
+    by_field: dict[str, list[str]] = {}
+    for labels, stats in snapshots:
+        lbl = _labels(tuple(labels), tuple(labels.values()))
+        for key, value in _numeric(stats):
+            name = f"app_{group}_{key}"
+            by_field.setdefault(name, []).append(f"{name}{lbl} {value:g}")
+    for name, lines in by_field.items():
+        yield f"# TYPE {name} gauge"
+        yield from lines
+
+
+def render(stats: Mapping[str, Sequence[tuple[Mapping[str, str], Mapping]]] | None = None) -> str:
+    """
+    The exposition text. `stats` maps a group name to (labels, stats dict)
+    pairs, e.g. {"cache": [({"cache": "scores"}, score_cache.stats())]}.
+    """
+    lines: list[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    for group, snapshots in (stats or {}).items():
+        lines.extend(_gauges(group, snapshots))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,112 @@
+# server/app/core/pagination.py
+"""
+Keyset (cursor) pagination for the newest-first list endpoints.
+
+A page is "the next `limit` rows ordered by (sort columns..., id) DESC that
+come strictly after the cursor", which the composite (user_id, <sort>, id)
+indexes answer with one index range scan no matter how deep the page is.
+The cursor is the sort key of the last row served, base64-encoded; the next
+one goes back in the X-Next-Cursor response header so list bodies keep their
+existing shape.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Sequence
+
+from fastapi import HTTPException, Response
+from sqlalchemy import String, literal, select, tuple_, type_coerce
+from sqlalchemy.orm import Query, Session
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _is_datetime(column) -> bool:
+    return column.type.python_type is datetime
+
+
+def _stored_key(session: Session, columns: Sequence, row) -> list:
+    """
+    The sort key of `row` as the database compares it. SQLite keeps
+    timestamps as text in two shapes: CURRENT_TIMESTAMP (the server default)
+    writes "YYYY-MM-DD HH:MM:SS", the ORM "YYYY-MM-DD HH:MM:SS.ffffff", and
+    ORDER BY compares those strings. Carrying the stored text keeps the cursor
+    comparison consistent with that order whichever shape a row has.
+    """
+    values = [getattr(row, c.key) for c in columns]
+    if session.get_bind().dialect.name != "sqlite" or not any(_is_datetime(c) for c in columns):
+        return values
+    stored = session.execute(
+        select(*(type_coerce(c, String) if _is_datetime(c) else c for c in columns))
+        .where(columns[-1] == values[-1])
+    ).one()
+    return list(stored)
+
+
+def cursor_for(session: Session, columns: Sequence, row) -> str:
+    """The cursor whose page starts right after `row`."""
+    return encode_cursor(_stored_key(session, columns, row))
+
+
+def _decode(cursor: str, columns: Sequence, dialect: str) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [_value(v, col, dialect) for v, col in zip(values, columns)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _value(value, column, dialect: str):
+    if not _is_datetime(column):
+        return column.type.python_type(value)
+    parsed = datetime.fromisoformat(value)
+    if dialect != "sqlite":
+        return parsed
+    # compare as stored text (see _stored_key); an isoformat() cursor differs
+    # from the stored shape only by its "T" separator
+    return literal(value.replace("T", " "), String)
+
+
+def _after(columns: Sequence, values: Sequence):
+    """Row-value comparison, so the (user_id, <sort>, id) index serves it as a range seek."""
+    if len(columns) == 1:
+        return columns[0] < values[0]
+    return tuple_(*columns) < tuple_(*values)
+
+
+def paginate(
+    query: Query,
+    columns: Sequence,
+    response: Response,
+    limit: int | None,
+    cursor: str | None,
+) -> list:
+    """
+    Order `query` by `columns` DESC (the last one must be unique, e.g. the id)
+    and return one page. With neither `limit` nor `cursor` the whole list is
+    returned, as before pagination existed.
+    """
+    query = query.order_by(*(c.desc() for c in columns))
+    if cursor:
+        dialect = query.session.get_bind().dialect.name
+        query = query.filter(_after(columns, _decode(cursor, columns, dialect)))
+    if limit is None:
+        if not cursor:
+            return query.all()
+        limit = DEFAULT_LIMIT
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = cursor_for(query.session, columns, rows[-1])
+    return rows
@@ -0,0 +1,223 @@
+# server/app/core/profiling.py
+"""
+Opt-in, per-request sampling profiler.
+
+With PROFILE_ENABLED, `ProfilerMiddleware` profiles a request when it
+carries a valid signed `X-Profile` header (see `sign`) or, failing that,
+with probability PROFILE_SAMPLE_RATE. A profiled request gets a sampler
+thread that snapshots stacks every PROFILE_INTERVAL_MS until the response
+is sent, and the result is written as collapsed stacks (one
+`frame;frame;frame count` line per distinct stack; feed it to flamegraph.pl
+or speedscope) to a directory capped by PROFILE_MAX_FILES and
+PROFILE_RETENTION_S. The response carries the file name in `X-Profile-Id`.
+
+Samples come from the event-loop thread (async handlers; time spent parked
+in the selector is I/O wait) and from any other thread that is running app
+code (sync handlers in the threadpool). Requests served concurrently on the
+same threads show up too, so profile under the load you care about, or
+alone.
+"""
+import hashlib
+import hmac
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+ID_HEADER = "X-Profile-Id"
+SUFFIX = ".collapsed"
+
+_APP_DIR = str(Path(__file__).resolve().parents[1])
+_NAME_RE = re.compile(r"^[\w.-]+\.collapsed$")
+_active = 0
+_active_lock = threading.Lock()
+
+
+def profile_dir() -> Path:
+    return Path(settings.PROFILE_DIR) if settings.PROFILE_DIR else Path(__file__).resolve().parents[2] / "profiles"
+
+
+def _secret() -> bytes:
+    return (settings.PROFILE_SECRET or settings.JWT_SECRET).encode("utf-8")
+
+
+def sign(ttl_s: int = 600) -> str:
+    """Header value that asks for a profile of any request sent in the next `ttl_s` seconds."""
+    expires = str(int(time.time()) + ttl_s)
+    mac = hmac.new(_secret(), expires.encode(), hashlib.sha256).hexdigest()
+    return f"{expires}.{mac}"
+
+
+def verify(token: str) -> bool:
+    expires, _, mac = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    expected = hmac.new(_secret(), expires.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(mac, expected)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Sampler(threading.Thread):
+    """Collects collapsed stacks for the loop thread and app-code threads until stopped."""
+
+    def __init__(self, loop_thread: int, interval_s: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.loop_thread = loop_thread
+        self.interval_s = interval_s
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        me = threading.get_ident()
+        while not self._done.wait(self.interval_s):
+            self.samples += 1
+            for tid, frame in sys._current_frames().items():
+                if tid == me:
+                    continue
+                stack = []
+                in_app = False
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    in_app = in_app or frame.f_code.co_filename.startswith(_APP_DIR)
+                    frame = frame.f_back
+                if tid == self.loop_thread:
+                    stack.append("event-loop")
+                elif in_app:
+                    stack.append("worker-thread")
+                else:
+                    continue  # idle pool threads, the extraction pool's feeders, ...
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+
+
+def _slug(path: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_")[:60] or "root"
+
+
+def _write(name: str, stacks: Counter, meta: dict) -> None:
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    body = "".join(f"{stack} {n}\n" for stack, n in stacks.most_common())
+    (directory / f"{name}.json").write_text(json.dumps(meta), encoding="utf-8")
+    tmp = directory / f".{name}.tmp"
+    tmp.write_text(body, encoding="utf-8")
+    tmp.replace(directory / name)
+    prune()
+
+
+def prune() -> None:
+    """Enforce PROFILE_MAX_FILES (newest kept) and PROFILE_RETENTION_S."""
+    directory = profile_dir()
+    if not directory.is_dir():
+        return
+    files = sorted(directory.glob(f"*{SUFFIX}"), key=lambda p: p.stat().st_mtime, reverse=True)
+    cutoff = time.time() - settings.PROFILE_RETENTION_S
+    for i, path in enumerate(files):
+        if i >= settings.PROFILE_MAX_FILES or path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+            path.with_name(f"{path.name}.json").unlink(missing_ok=True)
+
+
+def list_profiles() -> list[dict]:
+    """Stored profiles, newest first, with what was recorded about their request."""
+    directory = profile_dir()
+    if not directory.is_dir():
+        return []
+    out = []
+    for path in directory.glob(f"*{SUFFIX}"):
+        try:
+            meta = json.loads(path.with_name(f"{path.name}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = {}
+        out.append({"name": path.name, "size": path.stat().st_size, **meta})
+    return sorted(out, key=lambda p: (p.get("created_at") or "", p["name"]), reverse=True)
+
+
+def profile_path(name: str) -> Path | None:
+    """The stored profile called `name`, or None (also for anything that isn't a plain file name)."""
+    if not _NAME_RE.match(name):
+        return None
+    path = profile_dir() / name
+    return path if path.is_file() else None
+
+
+def _acquire() -> bool:
+    global _active
+    with _active_lock:
+        if _active >= settings.PROFILE_MAX_CONCURRENT:
+            return False
+        _active += 1
+        return True
+
+
+def _release() -> None:
+    global _active
+    with _active_lock:
+        _active -= 1
+
+
+class ProfilerMiddleware:
+    """Only installed when PROFILE_ENABLED; unprofiled requests pay one header scan."""
+
+    def __init__(self, app):
+        self.app = app
+
+    def _wanted(self, scope) -> bool:
+        for key, value in scope["headers"]:
+            if key == b"x-profile" and verify(value.decode("latin-1")):
+                return True
+        return settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wanted(scope) or not _acquire():
+            return await self.app(scope, receive, send)
+
+        started = datetime.now(timezone.utc)
+        name = f"{started:%Y%m%dT%H%M%S}Z-{scope['method']}-{_slug(scope['path'])}-{uuid4().hex[:8]}{SUFFIX}"
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [*message.get("headers", []), (ID_HEADER.lower().encode(), name.encode())]
+            await send(message)
+
+        sampler = Sampler(threading.get_ident(), settings.PROFILE_INTERVAL_MS / 1000)
+        sampler.start()
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            _release()
+            meta = {
+                "created_at": started.isoformat(),
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(scope.get("route"), "path", None),
+                "status": status,
+                "duration_ms": round((time.perf_counter() - t0) * 1000, 1),
+                "samples": sampler.samples,
+            }
+            if sampler.stacks:
+                await run_in_threadpool(_write, name, sampler.stacks, meta)
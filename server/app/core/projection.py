@@ -0,0 +1,52 @@
+# server/app/core/projection.py
+"""
+Sparse fieldsets for list endpoints.
+
+`?fields=id,title` picks a subset of the route's output schema; only those
+columns (plus whatever pagination orders by) are selected, rows come back as
+plain tuples instead of ORM objects, and the payload is encoded with orjson
+without a per-row pydantic round trip.
+"""
+from typing import Sequence
+
+from fastapi import HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from app.core.pagination import NEXT_CURSOR_HEADER
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> list[str]:
+    """Requested field names in request order; all of `schema`'s fields when omitted."""
+    allowed = list(schema.model_fields)
+    if not fields:
+        return allowed
+    wanted = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in wanted if f not in allowed]
+    if unknown or not wanted:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown) or '(none given)'}; allowed: {', '.join(allowed)}",
+        )
+    return wanted
+
+
+def columns(entity, names: Sequence[str], *extra) -> list:
+    """Mapped columns for `names`, plus `extra` (e.g. sort keys) not already included."""
+    cols = [getattr(entity, n) for n in names]
+    cols += [c for c in extra if c.key not in names]
+    return cols
+
+
+# set on the injected Response by paginate / versions.not_modified
+_CARRIED_HEADERS = (NEXT_CURSOR_HEADER, "ETag", "Cache-Control")
+
+
+def json_rows(rows: Sequence, names: Sequence[str], response: Response | None = None) -> ORJSONResponse:
+    """Encode projected rows, carrying over the cursor and validators set on `response`."""
+    out = ORJSONResponse([{n: getattr(row, n) for n in names} for row in rows])
+    if response is not None:
+        for header in _CARRIED_HEADERS:
+            if header in response.headers:
+                out.headers[header] = response.headers[header]
+    return out
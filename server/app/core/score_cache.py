@@ -0,0 +1,141 @@
+# server/app/core/score_cache.py
+"""
+Memoized resume/job scores.
+
+A score depends only on the resume's contents, the job description and the
+scoring code, so results are keyed by (resume content hash, description
+hash, SCORING_VERSION) and shared by every user and row with the same
+contents. Lookups try an in-process LRU first, then an optional shared
+backend so that workers reuse each other's results. Deleting a resume or a
+job drops the entries that mention its hash; anything still needed is
+simply recomputed.
+"""
+import hashlib
+from fnmatch import fnmatchcase
+from threading import Lock
+from typing import Protocol
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.scoring import SCORING_VERSION
+from app.schemas.analysis import ScoreOut
+
+
+class ScoreBackend(Protocol):
+    """Shared tier: string keys and values, glob-style bulk delete (Redis-shaped)."""
+
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, value: str) -> None: ...
+
+    def delete_matching(self, pattern: str) -> None: ...
+
+
+class MemoryBackend:
+    """In-process stand-in for a shared store; same interface, nothing shared."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self._data = LRUCache(maxsize, ttl=ttl)
+
+    def get(self, key: str) -> str | None:
+        return self._data.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        self._data.set(key, value)
+
+    def delete_matching(self, pattern: str) -> None:
+        for key in self._data.keys():
+            if fnmatchcase(key, pattern):
+                self._data.pop(key)
+
+
+def _default_backend() -> ScoreBackend | None:
+    if settings.SCORE_CACHE_SHARED == "memory":
+        return MemoryBackend(settings.SCORE_CACHE_SIZE * 4, ttl=settings.SCORE_CACHE_TTL_S)
+    return None
+
+
+_lru = LRUCache(settings.SCORE_CACHE_SIZE)
+_shared: ScoreBackend | None = _default_backend()
+_lock = Lock()
+_shared_hits = 0
+_shared_errors = 0
+
+
+def set_backend(backend: ScoreBackend | None) -> None:
+    """Plug in a shared tier (or None to run on the in-process LRU alone)."""
+    global _shared
+    _shared = backend
+
+
+def description_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _key(resume_hash: str, job_hash: str) -> str:
+    return f"{resume_hash}:{job_hash}:v{SCORING_VERSION}"
+
+
+def _shared_call(fn, *args):
+    """A shared-tier outage degrades to a miss instead of failing the request."""
+    global _shared_errors
+    try:
+        return fn(*args)
+    except Exception:
+        with _lock:
+            _shared_errors += 1
+        return None
+
+
+def get(resume_hash: str, job_hash: str) -> ScoreOut | None:
+    global _shared_hits
+    key = _key(resume_hash, job_hash)
+    out = _lru.get(key)
+    if out is not None or _shared is None:
+        return out
+    raw = _shared_call(_shared.get, key)
+    if raw is None:
+        return None
+    out = ScoreOut.model_validate_json(raw)
+    _lru.set(key, out)
+    with _lock:
+        _shared_hits += 1
+    return out
+
+
+def put(resume_hash: str, job_hash: str, out: ScoreOut) -> None:
+    key = _key(resume_hash, job_hash)
+    _lru.set(key, out)
+    if _shared is not None:
+        _shared_call(_shared.set, key, out.model_dump_json())
+
+
+def _drop(pattern: str) -> None:
+    for key in _lru.keys():
+        if fnmatchcase(key, pattern):
+            _lru.pop(key)
+    if _shared is not None:
+        _shared_call(_shared.delete_matching, pattern)
+
+
+def invalidate_resume(content_hash: str) -> None:
+    _drop(f"{content_hash}:*")
+
+
+def invalidate_job(job_hash: str) -> None:
+    _drop(f"*:{job_hash}:*")
+
+
+def stats() -> dict:
+    local = _lru.stats()
+    lookups = local["hits"] + local["misses"]
+    hits = local["hits"] + _shared_hits
+    return {
+        "local": local,
+        "shared": {
+            "backend": type(_shared).__name__ if _shared is not None else None,
+            "hits": _shared_hits,
+            "errors": _shared_errors,
+        },
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+    }
@@ -0,0 +1,67 @@
+# server/app/core/scoring.py
+# numpy is imported inside the functions: it's only needed for batch scoring
+# and would otherwise add to every worker's startup.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# bump whenever scores or the ScoreOut detail change; cached results are keyed by it
+SCORING_VERSION = 1
+
+
+def overlap_matrix(
+    resume_kws: Sequence[frozenset[str] | set[str]],
+    job_kws: Sequence[frozenset[str] | set[str]],
+) -> np.ndarray:
+    """
+    Count |job_keywords ∩ resume_keywords| for every (resume, job) pair in one pass.
+
+    Jobs are laid out CSR-style (concatenated term ids + row offsets) over a
+    vocabulary built from the job side only; resumes become a dense boolean
+    membership matrix over that vocabulary. Gathering the membership columns
+    for every job term and summing each job's segment gives the overlap
+    counts as an (n_resumes, n_jobs) int matrix.
+    Every job must have at least one keyword.
+    """
+    import numpy as np
+
+    vocab: dict[str, int] = {}
+    indices: list[int] = []
+    indptr = [0]
+    for kw in job_kws:
+        for term in kw:
+            indices.append(vocab.setdefault(term, len(vocab)))
+        indptr.append(len(indices))
+
+    member = np.zeros((len(resume_kws), len(vocab)), dtype=np.int32)
+    for row, kw in enumerate(resume_kws):
+        cols = [vocab[t] for t in kw if t in vocab]
+        member[row, cols] = 1
+
+    if not indices:
+        return np.zeros((len(resume_kws), len(job_kws)), dtype=np.int32)
+    gathered = member[:, np.asarray(indices, dtype=np.intp)]
+    return np.add.reduceat(gathered, np.asarray(indptr[:-1], dtype=np.intp), axis=1)
+
+
+def score_matrix(overlap: np.ndarray, job_sizes: Sequence[int]) -> np.ndarray:
+    """Same formula as the single-pair score: round(overlap / |job_keywords| * 100)."""
+    import numpy as np
+
+    sizes = np.maximum(np.asarray(job_sizes, dtype=np.float64), 1.0)
+    return np.rint(overlap / sizes * 100).astype(np.int32)
+
+
+def top_pairs(scores: np.ndarray, k: int) -> list[tuple[int, int]]:
+    """(row, col) of the `k` highest scores, best first; ties keep row-major order."""
+    import numpy as np
+
+    order = np.argsort(-scores, axis=None, kind="stable")[:k]
+    return [divmod(flat, scores.shape[1]) for flat in order.tolist()]
+
+
+def warm_up() -> None:
+    import numpy  # noqa: F401
@@ -0,0 +1,156 @@
+# server/app/core/search.py
+"""
+Ranked search over a user's saved jobs.
+
+Default backend is BM25 over an inverted index (`job_postings`: term id ->
+job id + term frequency) built from title + description with the same
+tokenizer the scorer uses. Postings are written when a job is created and
+removed when it is deleted, so the index is never rebuilt.
+
+With Postgres the native full-text index can be used instead
+(SEARCH_BACKEND=postgres, or "auto" on a postgresql URL); the matching GIN
+expression index is created by the migration.
+"""
+import math
+from collections import Counter, defaultdict
+from typing import Sequence
+
+from sqlalchemy import func, insert, literal_column
+from sqlalchemy.dialects import postgresql  # noqa: F401  (registers the to_tsvector/ts_rank_cd types)
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import span
+from app.core.terms import intern_terms, lookup_terms
+from app.core.text import tokenize
+from app.db.models import Job, JobPosting
+
+# BM25 parameters (the usual defaults)
+_K1 = 1.2
+_B = 0.75
+
+# must match the expression index in the migration
+_TS_DOC = func.to_tsvector(
+    literal_column("'english'"),
+    func.coalesce(Job.title, "") + " " + func.coalesce(Job.description, ""),
+)
+
+
+def use_native(db: Session) -> bool:
+    if settings.SEARCH_BACKEND == "postgres":
+        return True
+    if settings.SEARCH_BACKEND == "auto":
+        return db.get_bind().dialect.name == "postgresql"
+    return False
+
+
+def index_jobs(db: Session, jobs: Sequence[Job]) -> None:
+    """Add `jobs` to the inverted index with one intern + one insert. Caller commits."""
+    if use_native(db):
+        return
+    if any(job.id is None for job in jobs):
+        db.flush()
+    with span("tokenize.search_index"):
+        tokens = [tokenize(f"{job.title or ''} {job.description or ''}") for job in jobs]
+    tfs = [Counter(t) for t in tokens]
+    ids = intern_terms(db, set().union(*tfs))
+    rows = [
+        {"job_id": job.id, "term_id": ids[t], "tf": n}
+        for job, tf in zip(jobs, tfs)
+        for t, n in tf.items()
+    ]
+    if rows:
+        db.execute(insert(JobPosting), rows)
+    for job, toks in zip(jobs, tokens):
+        job.search_length = len(toks)
+
+
+def index_job(db: Session, job: Job) -> None:
+    """Add `job` to the inverted index. Caller commits."""
+    index_jobs(db, [job])
+
+
+def unindex_job(db: Session, job_id: int) -> None:
+    db.query(JobPosting).filter(JobPosting.job_id == job_id).delete(synchronize_session=False)
+
+
+def _bm25(db: Session, user_id: int, q: str, limit: int, offset: int) -> tuple[int, list[tuple[Job, float]]]:
+    term_ids = lookup_terms(db, set(tokenize(q)))
+    if not term_ids:
+        return 0, []
+
+    n_docs, avgdl = (
+        db.query(func.count(Job.id), func.avg(Job.search_length))
+        .filter(Job.user_id == user_id, Job.search_length.isnot(None))
+        .one()
+    )
+    if not n_docs:
+        return 0, []
+    avgdl = float(avgdl or 0) or 1.0
+
+    rows = (
+        db.query(JobPosting.job_id, JobPosting.term_id, JobPosting.tf, Job.search_length)
+        .join(Job, Job.id == JobPosting.job_id)
+        .filter(Job.user_id == user_id, JobPosting.term_id.in_(list(term_ids.values())))
+        .all()
+    )
+
+    df: Counter = Counter(term_id for _, term_id, _, _ in rows)
+    scores: dict[int, float] = defaultdict(float)
+    for job_id, term_id, tf, dl in rows:
+        idf = math.log(1 + (n_docs - df[term_id] + 0.5) / (df[term_id] + 0.5))
+        norm = tf + _K1 * (1 - _B + _B * (dl or 0) / avgdl)
+        scores[job_id] += idf * tf * (_K1 + 1) / norm
+
+    ranked = sorted(scores.items(), key=lambda kv: (-kv[1], -kv[0]))
+    page = ranked[offset:offset + limit]
+    jobs = {j.id: j for j in db.query(Job).filter(Job.id.in_([job_id for job_id, _ in page])).all()}
+    return len(ranked), [(jobs[job_id], score) for job_id, score in page]
+
+
+def _native(db: Session, user_id: int, q: str, limit: int, offset: int) -> tuple[int, list[tuple[Job, float]]]:
+    words = sorted(set(tokenize(q)))
+    if not words:
+        return 0, []
+    # OR the tokens together so ranking behaves like the BM25 path
+    tsq = func.to_tsquery(literal_column("'english'"), " | ".join(f"'{w}'" for w in words))
+    match = _TS_DOC.op("@@")(tsq)
+    rank = func.ts_rank_cd(_TS_DOC, tsq).label("rank")
+
+    total = db.query(func.count(Job.id)).filter(Job.user_id == user_id, match).scalar() or 0
+    rows = (
+        db.query(Job, rank)
+        .filter(Job.user_id == user_id, match)
+        .order_by(rank.desc(), Job.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    return total, [(job, float(score)) for job, score in rows]
+
+
+def search_jobs(db: Session, user_id: int, q: str, limit: int, offset: int) -> tuple[int, list[tuple[Job, float]]]:
+    """Return (total matches, one page of (job, score)) best first."""
+    if use_native(db):
+        return _native(db, user_id, q, limit, offset)
+    return _bm25(db, user_id, q, limit, offset)
+
+
+def backfill(db: Session, batch_size: int = 200) -> int:
+    """Index jobs that predate job_postings. Returns the number of jobs indexed."""
+    if use_native(db):
+        return 0
+    done = 0
+    while True:
+        batch = (
+            db.query(Job)
+            .filter(Job.search_length.is_(None))
+            .order_by(Job.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return done
+        index_jobs(db, batch)
+        db.commit()
+        done += len(batch)
@@ -1,9 +1,26 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from threading import BoundedSemaphore
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 import jwt
 from app.core.config import settings
 
-_pwd = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Pinning min == max == default makes any hash at another cost "need update",
+# so changing BCRYPT_ROUNDS migrates users transparently on their next login.
+_pwd = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt gets its own small pool so a login burst can't take over the
+# threadpool that serves every other sync route
+_hash_pool = ThreadPoolExecutor(max_workers=settings.HASH_WORKERS, thread_name_prefix="bcrypt")
+_hash_slots = BoundedSemaphore(settings.HASH_WORKERS + settings.HASH_MAX_QUEUE)
 
 def hash_password(p: str) -> str:
     return _pwd.hash(p[:72])  # ensure bcrypt-safe
@@ -12,6 +29,44 @@ def hash_password(p: str) -> str:
 def verify_password(p: str, h: str) -> bool:
     return _pwd.verify(p[:72], h)
 
-def create_access_token(sub: str) -> str:
+
+def _verify_and_update(p: str, h: str) -> tuple[bool, str | None]:
+    return _pwd.verify_and_update(p[:72], h)
+
+
+async def _run_hashing(fn, *args):
+    if not _hash_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-in requests, try again shortly",
+            headers={"Retry-After": str(settings.HASH_RETRY_AFTER_S)},
+        )
+    try:
+        future = _hash_pool.submit(fn, *args)
+    except BaseException:
+        _hash_slots.release()
+        raise
+    # the slot is held until the pool is done with the job: a cancelled request
+    # leaves it queued or running, and that still counts against the queue
+    future.add_done_callback(lambda _: _hash_slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(p: str) -> str:
+    """hash_password on the bcrypt pool; 503 when its queue is full."""
+    return await _run_hashing(hash_password, p)
+
+
+async def verify_password_async(p: str, h: str) -> tuple[bool, str | None]:
+    """
+    Verify on the bcrypt pool; 503 when its queue is full.
+    Returns (ok, new_hash) -- new_hash is set when `h` used an outdated cost.
+    """
+    return await _run_hashing(_verify_and_update, p, h)
+
+def create_access_token(sub: str, uid: int | None = None) -> str:
     exp = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_EXPIRES_MIN)
-    return jwt.encode({"sub": sub, "exp": exp}, settings.JWT_SECRET, algorithm="HS256")
+    claims = {"sub": sub, "exp": exp}
+    if uid is not None and settings.JWT_INCLUDE_UID:
+        claims["uid"] = uid  # lets auth resolve the user by primary key
+    return jwt.encode(claims, settings.JWT_SECRET, algorithm="HS256")
@@ -0,0 +1,240 @@
+# server/app/core/tasks.py
+"""
+Background tasks for work too slow to hold a request open for.
+
+A submit writes a `tasks` row and returns its id; a worker claims the row
+(queued -> running, guarded so only one process wins), runs the handler
+registered for its kind, and stores the JSON result or the error. An
+identical task (same user, kind and payload) that is still queued or running
+is returned instead of starting a second one; a partial unique index on the
+active rows settles two identical submits racing each other.
+
+While a handler runs, its process refreshes the row's heartbeat_at every
+TASK_HEARTBEAT_S. At startup a worker requeues "running" rows whose heartbeat
+is older than TASK_STALE_S: their process died mid-run. Rows another live
+process is running keep beating and are left alone.
+
+`LocalWorker` runs tasks on the app's event loop with a fixed number of
+runner coroutines. With TASK_WORKER=manual nothing runs until `drain()` is
+awaited, which processes every queued task in submit order — what tests use.
+"""
+import asyncio
+import hashlib
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import Principal
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.models import Task, User
+
+Handler = Callable[[dict, Principal], Awaitable[Any]]
+
+ACTIVE = ("queued", "running")
+
+_handlers: dict[str, Handler] = {}
+
+
+def handler(kind: str) -> Callable[[Handler], Handler]:
+    """Register the coroutine that runs tasks of `kind`; it returns a JSON-able result."""
+    def wrap(fn: Handler) -> Handler:
+        _handlers[kind] = fn
+        return fn
+    return wrap
+
+
+def _dedup_key(user_id: int, kind: str, payload: dict) -> str:
+    raw = json.dumps([user_id, kind, payload], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def _active(db: AsyncSession, user_id: int, key: str) -> Task | None:
+    return (
+        await db.execute(
+            select(Task)
+            .where(Task.dedup_key == key, Task.user_id == user_id, Task.status.in_(ACTIVE))
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+
+
+async def submit(user_id: int, kind: str, payload: dict) -> Task:
+    """Queue a task, or return the identical one that is already queued/running."""
+    if kind not in _handlers:
+        raise ValueError(f"No handler registered for task kind {kind!r}")
+    key = _dedup_key(user_id, kind, payload)
+    async with AsyncSessionLocal() as db:
+        existing = await _active(db, user_id, key)
+        if existing is not None:
+            return existing
+        task = Task(
+            id=uuid.uuid4().hex,
+            user_id=user_id,
+            kind=kind,
+            dedup_key=key,
+            payload=json.dumps(payload),
+            status="queued",
+        )
+        db.add(task)
+        try:
+            await db.commit()
+        except IntegrityError:
+            # an identical submit inserted between our SELECT and INSERT
+            await db.rollback()
+            existing = await _active(db, user_id, key)
+            if existing is None:  # ... and already finished
+                raise
+            return existing
+        await db.refresh(task)
+    worker.enqueue(task.id)
+    return task
+
+
+async def get(task_id: str, user_id: int) -> Task | None:
+    async with AsyncSessionLocal() as db:
+        return (
+            await db.execute(select(Task).where(Task.id == task_id, Task.user_id == user_id))
+        ).scalar_one_or_none()
+
+
+async def _finish(task_id: str, **values) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Task).where(Task.id == task_id).values(finished_at=datetime.utcnow(), **values)
+        )
+        await db.commit()
+
+
+async def _heartbeat(task_id: str) -> None:
+    while True:
+        await asyncio.sleep(settings.TASK_HEARTBEAT_S)
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(Task)
+                    .where(Task.id == task_id, Task.status == "running")
+                    .values(heartbeat_at=datetime.utcnow())
+                )
+                await db.commit()
+        except Exception:
+            pass  # database unreachable; try again next beat
+
+
+async def execute(task_id: str) -> None:
+    """Claim and run one task; a task another worker already claimed is skipped."""
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        claimed = await db.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.status == "queued")
+            .values(status="running", started_at=now, heartbeat_at=now)
+        )
+        await db.commit()
+        if claimed.rowcount != 1:
+            return
+        task = await db.get(Task, task_id)
+        user = await db.get(User, task.user_id) if task.user_id is not None else None
+        kind, payload = task.kind, json.loads(task.payload)
+
+    if user is None:
+        await _finish(task_id, status="failed", error="User no longer exists", status_code=401)
+        return
+    beat = asyncio.create_task(_heartbeat(task_id))
+    try:
+        result = await _handlers[kind](payload, Principal(id=user.id, email=user.email))
+    except HTTPException as e:
+        values = {"status": "failed", "error": str(e.detail), "status_code": e.status_code}
+    except Exception as e:
+        values = {"status": "failed", "error": f"{type(e).__name__}: {e}", "status_code": 500}
+    else:
+        values = {"status": "succeeded", "result": json.dumps(result)}
+    finally:
+        beat.cancel()
+    await _finish(task_id, **values)
+
+
+async def requeue_stale() -> int:
+    """Put "running" tasks whose process stopped beating back in the queue. Returns how many."""
+    stale = datetime.utcnow() - timedelta(seconds=settings.TASK_STALE_S)
+    async with AsyncSessionLocal() as db:
+        requeued = await db.execute(
+            update(Task)
+            .where(Task.status == "running", func.coalesce(Task.heartbeat_at, Task.started_at) < stale)
+            .values(status="queued")
+        )
+        await db.commit()
+    return requeued.rowcount
+
+
+async def _queued_ids() -> list[str]:
+    async with AsyncSessionLocal() as db:
+        rows = await db.execute(
+            select(Task.id).where(Task.status == "queued").order_by(Task.created_at, Task.id)
+        )
+        return list(rows.scalars())
+
+
+class LocalWorker:
+    """In-process worker: an asyncio queue of task ids and `concurrency` runners."""
+
+    def __init__(self, concurrency: int, manual: bool = False):
+        self.concurrency = concurrency
+        self.manual = manual
+        self._queue: asyncio.Queue | None = None
+        self._runners: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self.manual or self._runners:
+            return
+        await requeue_stale()
+        self._queue = asyncio.Queue()
+        for task_id in await _queued_ids():
+            self._queue.put_nowait(task_id)
+        self._runners = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._runners = []
+        self._queue = None
+
+    def enqueue(self, task_id: str) -> None:
+        if self._queue is not None:
+            self._queue.put_nowait(task_id)
+
+    def stats(self) -> dict:
+        return {
+            "runners": len(self._runners),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "manual": self.manual,
+        }
+
+    async def drain(self) -> int:
+        """Run every queued task to completion on the caller's loop. Returns how many ran."""
+        done = 0
+        while ids := await _queued_ids():
+            for task_id in ids:
+                await execute(task_id)
+                done += 1
+        return done
+
+    async def _run(self) -> None:
+        while True:
+            task_id = await self._queue.get()
+            try:
+                await execute(task_id)
+            except Exception:
+                pass  # bookkeeping failed (database down); the row stays queued/running
+            finally:
+                self._queue.task_done()
+
+
+worker = LocalWorker(settings.TASK_WORKERS, manual=settings.TASK_WORKER == "manual")
@@ -0,0 +1,131 @@
+# server/app/core/terms.py
+"""
+Precomputed job keyword sets.
+
+A job's description never changes after it is written, so its keyword set is
+tokenized once at insert time and stored as interned term ids in `job_terms`.
+Scoring then only has to tokenize the resume side.
+"""
+from typing import Iterable, Iterator, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.metrics import span
+from app.core.text import keywords
+from app.db.models import Job, JobTerm, Term
+
+_IN_CHUNK = 500  # keep IN (...) lists under SQLite's bound-parameter limit
+
+
+def _chunks(items: Sequence, size: int = _IN_CHUNK) -> Iterator[Sequence]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def lookup_terms(db: Session, words: Iterable[str]) -> dict[str, int]:
+    """Term ids for the words that are already interned."""
+    found: dict[str, int] = {}
+    for chunk in _chunks(sorted(words)):
+        found.update(db.query(Term.term, Term.id).filter(Term.term.in_(chunk)).all())
+    return found
+
+
+class TermInternError(RuntimeError):
+    """Some words still had no term id after every retry."""
+
+
+_INTERN_ATTEMPTS = 3
+
+
+def intern_terms(db: Session, words: Iterable[str]) -> dict[str, int]:
+    """Map every word to its term id, inserting the ones we haven't seen yet."""
+    words = set(words)
+    if not words:
+        return {}
+    ids = lookup_terms(db, words)
+    for _ in range(_INTERN_ATTEMPTS):
+        missing = words - ids.keys()
+        if not missing:
+            return ids
+        try:
+            with db.begin_nested():
+                db.execute(insert(Term), [{"term": w} for w in missing])
+        except IntegrityError:
+            pass  # a concurrent writer interned some of them; re-read and retry the rest
+        ids.update(lookup_terms(db, missing))
+    missing = words - ids.keys()
+    if missing:
+        # callers index and count keywords from these ids; failing the write
+        # beats storing an index that disagrees with keyword_count
+        raise TermInternError(f"could not intern {len(missing)} terms after {_INTERN_ATTEMPTS} attempts")
+    return ids
+
+
+def index_jobs(db: Session, jobs: Sequence[Job]) -> None:
+    """Store the description keyword sets for `jobs` in one pass. Caller commits."""
+    if any(job.id is None for job in jobs):
+        db.flush()
+    with span("tokenize.job_terms"):
+        kws = [keywords(job.description or "") for job in jobs]
+    ids = intern_terms(db, set().union(*kws))
+    rows = [{"job_id": job.id, "term_id": ids[w]} for job, kw in zip(jobs, kws) for w in kw]
+    if rows:
+        db.execute(insert(JobTerm), rows)
+    for job, kw in zip(jobs, kws):
+        job.keyword_count = len(kw)
+
+
+def index_job(db: Session, job: Job) -> None:
+    """Store the description's keyword set for `job`. Caller commits."""
+    index_jobs(db, [job])
+
+
+def unindex_job(db: Session, job_id: int) -> None:
+    """Drop a job's stored keywords (SQLite doesn't enforce ON DELETE CASCADE)."""
+    db.query(JobTerm).filter(JobTerm.job_id == job_id).delete(synchronize_session=False)
+
+
+def job_keywords(db: Session, jobs: Sequence[Job]) -> dict[int, set[str]]:
+    """
+    Keyword sets for `jobs`, keyed by job id. Rows written before job_terms
+    existed (keyword_count is NULL) are tokenized on the fly until backfilled.
+    """
+    out: dict[int, set[str]] = {}
+    indexed: list[int] = []
+    for job in jobs:
+        if job.keyword_count is None:
+            out[job.id] = keywords(job.description or "")
+        else:
+            out[job.id] = set()
+            indexed.append(job.id)
+
+    for chunk in _chunks(indexed):
+        rows = (
+            db.query(JobTerm.job_id, Term.term)
+            .join(Term, Term.id == JobTerm.term_id)
+            .filter(JobTerm.job_id.in_(chunk))
+            .all()
+        )
+        for job_id, term in rows:
+            out[job_id].add(term)
+    return out
+
+
+def backfill(db: Session, batch_size: int = 200) -> int:
+    """Index every job that predates job_terms. Returns the number of jobs indexed."""
+    done = 0
+    while True:
+        batch = (
+            db.query(Job)
+            .filter(Job.keyword_count.is_(None))
+            .order_by(Job.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return done
+        index_jobs(db, batch)
+        db.commit()
+        done += len(batch)
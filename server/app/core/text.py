@@ -0,0 +1,112 @@
+# server/app/core/text.py
+from pathlib import Path
+import re
+from typing import Callable
+
+# a tiny stopword list to avoid scoring on very common words
+STOPWORDS = {
+    "the","and","of","to","a","in","for","on","with","at","by","an","be",
+    "as","is","are","that","this","from","or","it","you","your","our","we",
+    "will","have","has","i","he","she","they","them","their","his","her"
+}
+
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9_\-\+\.]*")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase tokenization; filters short/common words."""
+    words = [w.lower() for w in _WORD_RE.findall(text)]
+    return [w for w in words if len(w) > 2 and w not in STOPWORDS]
+
+
+def keywords(text: str) -> set[str]:
+    """Turn text into a keyword set."""
+    return set(tokenize(text))
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace so cached text is compact and stable."""
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+# Document readers by file suffix. The parsing libraries are heavy to import,
+# so each backend is registered as a loader and only imported on the first
+# document of its type (or by warm_up).
+Reader = Callable[[Path, int], str]  # (path, max_pages) -> text
+_loaders: dict[str, Callable[[], Reader]] = {}
+_readers: dict[str, Reader] = {}
+
+
+def register_reader(suffix: str, loader: Callable[[], Reader]) -> None:
+    """Register `loader`, which imports its backend and returns the reader for `suffix`."""
+    _loaders[suffix] = loader
+    _readers.pop(suffix, None)
+
+
+def _reader(suffix: str) -> Reader | None:
+    reader = _readers.get(suffix)
+    if reader is None and suffix in _loaders:
+        reader = _readers[suffix] = _loaders[suffix]()
+    return reader
+
+
+def warm_up(suffixes: tuple[str, ...] | None = None) -> list[str]:
+    """Import the backends for `suffixes` (default: all) now. Returns the ones loaded."""
+    loaded = []
+    for suffix in suffixes or tuple(_loaders):
+        if _reader(suffix) is not None:
+            loaded.append(suffix)
+    return loaded
+
+
+def _docx_reader() -> Reader:
+    from docx import Document
+
+    def read(path: Path, max_pages: int) -> str:
+        doc = Document(str(path))
+        return "\n".join(p.text for p in doc.paragraphs)
+    return read
+
+
+def _pdf_reader() -> Reader:
+    from pdfminer.high_level import extract_text
+
+    def read(path: Path, max_pages: int) -> str:
+        return extract_text(str(path), maxpages=max_pages) or ""
+    return read
+
+
+register_reader(".docx", _docx_reader)
+register_reader(".pdf", _pdf_reader)
+
+
+def read_text_from_path(path: Path, max_pages: int = 0) -> str:
+    """
+    Extract text from a resume at `path`.
+    - .txt   -> UTF-8 text
+    - .docx  -> read with python-docx
+    - .pdf   -> read with pdfminer.six (first `max_pages` pages; 0 = all)
+    - else   -> best-effort utf-8 decode (may be empty)
+    """
+    if not path.exists():
+        return ""
+
+    try:
+        ext = path.suffix.lower()
+
+        if ext == ".txt":
+            return path.read_text(encoding="utf-8", errors="ignore")
+
+        reader = _reader(ext)
+        if reader is not None:
+            try:
+                return reader(path, max_pages)
+            except Exception:
+                return ""
+
+        # Fallback (rarely useful for binaries)
+        return path.read_bytes().decode("utf-8", errors="ignore")
+
+    except Exception:
+        return ""
@@ -0,0 +1,129 @@
+# server/app/core/text_cache.py
+"""
+Extracted-text cache for resumes, keyed by the SHA-256 of the file contents.
+
+Lookups go through a size-bounded in-process LRU first, then the
+`resume_texts` table (shared by all workers, survives restarts), and only
+then fall back to parsing the document.
+"""
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.extract import extract_text
+from app.core.metrics import span
+from app.core.text import normalize_text, tokenize
+from app.db.models import Resume, ResumeText
+
+_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachedText:
+    text: str
+    keywords: frozenset[str]
+
+
+_lru = LRUCache(settings.RESUME_TEXT_CACHE_SIZE)
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _from_row(row: ResumeText) -> CachedText:
+    return CachedText(text=row.text, keywords=frozenset(row.tokens.split()))
+
+
+def _persist(db: Session, content_hash: str, entry: CachedText) -> None:
+    db.add(ResumeText(
+        content_hash=content_hash,
+        text=entry.text,
+        tokens=" ".join(sorted(entry.keywords)),
+    ))
+    try:
+        db.commit()
+    except IntegrityError:
+        # another request filled the same hash first; theirs is identical
+        db.rollback()
+
+
+def lookup(db: Session, content_hash: str) -> CachedText | None:
+    """Cached entry for a hash, or None if it has never been extracted."""
+    entry = _lru.get(content_hash)
+    if entry is not None:
+        return entry
+
+    row = db.get(ResumeText, content_hash)
+    if row is None:
+        return None
+    entry = _from_row(row)
+    _lru.set(content_hash, entry)
+    return entry
+
+
+def store(db: Session, content_hash: str, raw_text: str) -> CachedText:
+    """Normalize + tokenize freshly extracted text and persist it (if non-empty)."""
+    with span("tokenize.resume"):
+        text = normalize_text(raw_text)
+        entry = CachedText(text=text, keywords=frozenset(tokenize(text)))
+    if text:
+        _persist(db, content_hash, entry)
+        _lru.set(content_hash, entry)
+    return entry
+
+
+def get_text(db: Session, content_hash: str, path: Path) -> CachedText:
+    """
+    Return normalized text + keyword set for the document at `path`.
+    Unreadable documents come back empty and are not persisted.
+    Extraction errors (ExtractionBusy / ExtractionTimeout) propagate.
+    """
+    entry = lookup(db, content_hash)
+    if entry is not None:
+        return entry
+    return store(db, content_hash, extract_text(path))
+
+
+def get_resume_text(db: Session, resume: Resume) -> CachedText:
+    """
+    Cached text for a resume row. Rows uploaded before the cache existed
+    get their content hash computed and stored on first use.
+    """
+    path = Path(resume.file_path)
+    if not resume.content_hash:
+        if not path.exists():
+            return CachedText(text="", keywords=frozenset())
+        resume.content_hash = file_hash(path)
+        db.commit()
+    return get_text(db, resume.content_hash, path)
+
+
+def evict(db: Session, content_hash: str) -> None:
+    """
+    Drop a hash from both tiers unless another resume still points at it.
+    Caller commits.
+    """
+    still_used = (
+        db.query(Resume.id)
+        .filter(Resume.content_hash == content_hash)
+        .first()
+    )
+    if still_used:
+        return
+    _lru.pop(content_hash)
+    db.query(ResumeText).filter(ResumeText.content_hash == content_hash).delete()
+
+
+def stats() -> dict:
+    return _lru.stats()
@@ -0,0 +1,217 @@
+# server/app/core/uploads.py
+"""
+Streaming, content-addressed storage for uploaded resumes.
+
+The multipart body is parsed as it arrives; file bytes are hashed and written
+to a temp file in a worker thread chunk by chunk, and the upload is aborted as
+soon as it passes UPLOAD_MAX_BYTES. Once the Resume row is committed the file
+is moved to <UPLOAD_DIR>/blobs/<aa>/<sha256><ext>, so identical uploads share
+one blob and Resume rows simply point at it. A blob is removed when its last
+Resume goes.
+
+Placing a blob and removing an unreferenced one both happen under a lock file
+in the blob directory (shared by every worker process on the host). An upload
+commits its row before it places the blob, so a removal either sees that row
+or runs first, and then the upload puts the file back.
+"""
+import fcntl
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from multipart.multipart import MultipartParser, parse_options_header
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import Resume
+
+# default: uploads directory at project root (…/server/uploads)
+UPLOAD_DIR = Path(settings.UPLOAD_DIR or Path(__file__).resolve().parents[2] / "uploads").resolve()
+BLOB_DIR = UPLOAD_DIR / "blobs"
+TMP_DIR = UPLOAD_DIR / "tmp"
+for _d in (UPLOAD_DIR, BLOB_DIR, TMP_DIR):
+    _d.mkdir(parents=True, exist_ok=True)
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class BlobWriter:
+    """Temp file + running SHA-256; all methods are blocking (call off-loop)."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._sha = hashlib.sha256()
+        self._fh = tempfile.NamedTemporaryFile(dir=TMP_DIR, delete=False)
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLarge()
+        self._sha.update(chunk)
+        self._fh.write(chunk)
+
+    def close(self) -> tuple[str, Path]:
+        """Finish writing; the digest and the temp file, which `StoredUpload.store` moves later."""
+        self._fh.close()
+        return self._sha.hexdigest(), Path(self._fh.name)
+
+    def discard(self) -> None:
+        self._fh.close()
+        try:
+            os.unlink(self._fh.name)
+        except FileNotFoundError:
+            pass
+
+
+@contextmanager
+def _blob_lock():
+    with open(BLOB_DIR / ".lock", "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+@dataclass
+class StoredUpload:
+    filename: str
+    content_type: str
+    content_hash: str
+    path: Path  # where the blob lives once stored
+    size: int
+    tmp_path: Path
+
+    def store(self) -> None:
+        """Move the upload into the blob store (or drop it if the blob exists). Blocking."""
+        # only after the row pointing at `path` is committed: release_blob then either
+        # sees that row or has already run, and the exists() check below puts the file back
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with _blob_lock():
+            if self.path.exists():
+                self.discard()
+            else:
+                os.replace(self.tmp_path, self.path)
+
+    def discard(self) -> None:
+        self.tmp_path.unlink(missing_ok=True)
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds {settings.UPLOAD_MAX_BYTES} bytes",
+    )
+
+
+async def receive_file(request: Request, field: str, allowed_types: set[str]) -> StoredUpload:
+    """
+    Stream the multipart file part named `field` to a temp file; the caller
+    commits its row, then calls `store()` (or `discard()` if that fails).
+    Other form fields are ignored.
+    """
+    declared = request.headers.get("content-length")
+    # multipart framing adds a little on top of the file itself
+    if declared and declared.isdigit() and int(declared) > settings.UPLOAD_MAX_BYTES + 64 * 1024:
+        raise _too_large()
+
+    ctype, params = parse_options_header(request.headers.get("content-type", ""))
+    if ctype != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=422, detail="Expected multipart/form-data with a file")
+
+    events: list[tuple] = []
+    headers: dict[bytes, bytes] = {}
+    partial = {"name": b"", "value": b""}
+
+    def on_header_field(data, start, end):
+        partial["name"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        partial["value"] += data[start:end]
+
+    def on_header_end():
+        headers[partial["name"].lower()] = partial["value"]
+        partial["name"] = partial["value"] = b""
+
+    def on_headers_finished():
+        _, disp = parse_options_header(headers.get(b"content-disposition", b""))
+        events.append(("begin", disp, headers.get(b"content-type", b"").decode("latin-1")))
+        headers.clear()
+
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_data": lambda data, start, end: events.append(("data", data[start:end])),
+        "on_part_end": lambda: events.append(("end",)),
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+    })
+
+    writer: BlobWriter | None = None
+    capturing = False
+    result: StoredUpload | None = None
+    filename = content_type = ""
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            pending: list[bytes] = []
+            for ev in events:
+                if ev[0] == "begin":
+                    disp, part_type = ev[1], ev[2]
+                    capturing = (
+                        result is None
+                        and disp.get(b"name", b"").decode("utf-8", "replace") == field
+                        and b"filename" in disp
+                    )
+                    if capturing:
+                        if part_type not in allowed_types:
+                            raise HTTPException(status_code=415, detail=f"Unsupported file type: {part_type}")
+                        filename = Path(disp[b"filename"].decode("utf-8", "replace")).name
+                        content_type = part_type
+                        writer = BlobWriter(settings.UPLOAD_MAX_BYTES)
+                elif ev[0] == "data" and capturing:
+                    pending.append(ev[1])
+                elif ev[0] == "end" and capturing:
+                    await run_in_threadpool(writer.write, b"".join(pending))
+                    pending = []
+                    digest, tmp_path = await run_in_threadpool(writer.close)
+                    path = BLOB_DIR / digest[:2] / f"{digest}{Path(filename).suffix.lower()}"
+                    result = StoredUpload(filename, content_type, digest, path, writer.size, tmp_path)
+                    writer, capturing = None, False
+            events.clear()
+            if pending and writer is not None:
+                await run_in_threadpool(writer.write, b"".join(pending))
+        parser.finalize()
+    except UploadTooLarge:
+        raise _too_large()
+    except BaseException:
+        if result is not None:
+            await run_in_threadpool(result.discard)
+        raise
+    finally:
+        if writer is not None:
+            await run_in_threadpool(writer.discard)
+
+    if result is None:
+        raise HTTPException(status_code=422, detail=f"Missing file field '{field}'")
+    return result
+
+
+def release_blob(db: Session, path: str) -> None:
+    """Delete the file at `path` once no Resume row points at it."""
+    with _blob_lock():
+        still_used = db.query(Resume.id).filter(Resume.file_path == path).first()
+        if still_used:
+            return
+        try:
+            Path(path).unlink(missing_ok=True)
+        except OSError:
+            pass
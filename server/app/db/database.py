@@ -1,15 +1,52 @@
 # server/app/db/database.py
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.core.config import settings
+from app.core.metrics import instrument_engine
 
 engine = create_engine(settings.DATABASE_URL, future=True, pool_pre_ping=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 Base = declarative_base()
 
+# async drivers for the same database, used by the async route handlers
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def _async_url(url: str) -> str:
+    u = make_url(url)
+    driver = _ASYNC_DRIVERS.get(u.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"No async driver configured for {u.get_backend_name()}; set ASYNC_DATABASE_URL")
+    return u.set(drivername=f"{u.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or _async_url(settings.DATABASE_URL),
+    pool_pre_ping=True,
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# statement counts / timings for /metrics (async engines emit events on their sync twin)
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+
+def insert_returning(session: Session, model, rows: list[dict]) -> list:
+    """One multi-row INSERT ... RETURNING `model`; the new objects come back in `rows` order."""
+    if session.get_bind().dialect.name == "sqlite":
+        # sort_by_parameter_order would make SQLite fall back to one statement
+        # per row; it hands out rowids in VALUES order, so sorting by id matches
+        return sorted(session.scalars(insert(model).returning(model), rows).all(), key=lambda o: o.id)
+    return session.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows).all()
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
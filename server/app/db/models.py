@@ -1,5 +1,5 @@
 # server/app/db/models.py
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, TIMESTAMP, func
+from sqlalchemy import Column, Index, Integer, String, Text, ForeignKey, TIMESTAMP, func, text
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -20,20 +20,49 @@ class Resume(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     filename = Column(String(255))
     file_path = Column(Text)
+    content_hash = Column(String(64), index=True)  # sha256 of the file, keys resume_texts
     uploaded_at = Column(TIMESTAMP, server_default=func.now())
 
     user = relationship("User", back_populates="resumes")
 
+    # keyset pagination of a user's resumes, newest first
+    __table_args__ = (Index("ix_resumes_user_uploaded", "user_id", "uploaded_at", "id"),)
+
+class ResumeText(Base):
+    """Extracted text cache, shared by every resume with the same file contents."""
+    __tablename__ = "resume_texts"
+    content_hash = Column(String(64), primary_key=True)
+    text = Column(Text, nullable=False)
+    tokens = Column(Text, nullable=False)  # distinct keywords, space-separated
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
 class Job(Base):
     __tablename__ = "jobs"
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     title = Column(String(255))
     description = Column(Text)
+    keyword_count = Column(Integer)  # |description keywords|; NULL until job_terms is filled
+    search_length = Column(Integer)  # tokens in title + description; NULL until job_postings is filled
     created_at = Column(TIMESTAMP, server_default=func.now())
 
     user = relationship("User", back_populates="jobs")
 
+    # keyset pagination of a user's jobs, newest first
+    __table_args__ = (Index("ix_jobs_user_created", "user_id", "created_at", "id"),)
+
+class Term(Base):
+    """Interned keyword; job_terms refers to keywords by id."""
+    __tablename__ = "terms"
+    id = Column(Integer, primary_key=True)
+    term = Column(Text, unique=True, nullable=False)
+
+class JobTerm(Base):
+    """Keyword set of a job description, written once when the job is created."""
+    __tablename__ = "job_terms"
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    term_id = Column(Integer, ForeignKey("terms.id", ondelete="CASCADE"), primary_key=True, index=True)
+
 class Application(Base):
     __tablename__ = "applications"
     id = Column(Integer, primary_key=True)
@@ -44,3 +73,59 @@ class Application(Base):
     created_at = Column(TIMESTAMP, server_default=func.now())
 
     user = relationship("User", back_populates="applications")
+
+    __table_args__ = (
+        Index("ix_applications_user_id", "user_id", "id"),
+        # weekly submissions on the analytics dashboard
+        Index("ix_applications_user_created", "user_id", "created_at"),
+    )
+
+class ApplicationStatusCount(Base):
+    """Per-user number of applications in each status, kept in step with writes to applications."""
+    __tablename__ = "application_status_counts"
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, server_default="0")
+
+class Task(Base):
+    """Deferred score / job-analysis run; state lives here so any worker process can pick it up."""
+    __tablename__ = "tasks"
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    kind = Column(String(50), nullable=False)
+    dedup_key = Column(String(64), nullable=False, index=True)  # sha256 of user + kind + payload
+    payload = Column(Text, nullable=False)  # JSON
+    status = Column(String(20), nullable=False, server_default="queued")  # queued | running | succeeded | failed
+    result = Column(Text)  # JSON
+    error = Column(Text)
+    status_code = Column(Integer)  # HTTP status the inline endpoint would have answered with on failure
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    started_at = Column(TIMESTAMP)
+    heartbeat_at = Column(TIMESTAMP)  # refreshed by the process running it; a stale one means it died
+    finished_at = Column(TIMESTAMP)
+
+    __table_args__ = (
+        # at most one queued/running copy of an identical task
+        Index(
+            "ux_tasks_active_dedup",
+            "user_id",
+            "dedup_key",
+            unique=True,
+            sqlite_where=text("status IN ('queued', 'running')"),
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+class JobPosting(Base):
+    """Inverted index entry for job search: term -> job, with term frequency."""
+    __tablename__ = "job_postings"
+    term_id = Column(Integer, ForeignKey("terms.id", ondelete="CASCADE"), primary_key=True)
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True, index=True)
+    tf = Column(Integer, nullable=False)
+
+class CollectionVersion(Base):
+    """Per-user change counter of a listed collection; list ETags are derived from it."""
+    __tablename__ = "collection_versions"
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    collection = Column(String(50), primary_key=True)  # jobs | resumes | applications
+    version = Column(Integer, nullable=False, server_default="0")
@@ -1,7 +1,8 @@
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.routers import auth, resumes, jobs, analysis, answers, applications, users
+from app.core import answers as answer_cache, auth as auth_cache, compression, extract, fetch, metrics, score_cache, scoring, tasks as task_queue, text_cache
+from app.routers import admin, auth, resumes, jobs, analysis, answers, applications, tasks, users
 
 app = FastAPI(title=settings.APP_NAME)
 
@@ -12,7 +13,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["X-Next-Cursor", "ETag", "Content-Range"],  # keyset pagination, conditional GETs, ranged downloads
 )
+# list payloads compress well; 304s, small bodies and file downloads pass through untouched
+app.add_middleware(compression.GZipMiddleware, minimum_size=settings.GZIP_MIN_BYTES, compresslevel=settings.GZIP_LEVEL)
+# per-route latency / in-flight / SQL tallies for /metrics
+app.add_middleware(metrics.MetricsMiddleware)
+if settings.PROFILE_ENABLED:
+    # signed X-Profile header or PROFILE_SAMPLE_RATE; not installed at all when off
+    from app.core.profiling import ProfilerMiddleware
+    app.add_middleware(ProfilerMiddleware)
 
 @app.get("/favicon.ico", include_in_schema=False)
 def favicon():
@@ -30,6 +40,57 @@ async def root():
 async def health():
     return {"status": "healthy"}
 
+@app.get("/health/extraction")
+async def extraction_health():
+    # queue depth + latency of the document extraction pool
+    return extract.stats()
+
+def _cache_stats() -> dict:
+    return {
+        "scores": score_cache.stats(),
+        "resume_text": text_cache.stats(),
+        "principals": auth_cache.stats(),
+        "fetched_pages": fetch.stats(),
+        "answer_drafts": answer_cache.stats(),
+    }
+
+@app.get("/health/caches")
+async def cache_health():
+    # size + hit rate of the in-process caches
+    return _cache_stats()
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    text = metrics.render({
+        "extraction": [({}, extract.stats())],
+        "cache": [({"cache": name}, stats) for name, stats in _cache_stats().items()],
+        "task_worker": [({}, task_queue.worker.stats())],
+    })
+    return Response(content=text, media_type=metrics.CONTENT_TYPE)
+
+@app.on_event("startup")
+async def start_task_worker():
+    await task_queue.worker.start()
+
+@app.on_event("startup")
+async def warm_up():
+    # off by default: parsers and numpy load on first use, keeping cold starts short
+    if settings.WARM_UP:
+        scoring.warm_up()
+        await extract.warm_up()
+
+@app.on_event("shutdown")
+async def stop_task_worker():
+    await task_queue.worker.stop()
+
+@app.on_event("shutdown")
+def shutdown_extraction_pool():
+    extract.shutdown()
+
+@app.on_event("shutdown")
+async def close_fetch_client():
+    await fetch.aclose()
+
 # Mount API routers
 app.include_router(auth.router, prefix=settings.API_PREFIX)
 app.include_router(resumes.router, prefix=settings.API_PREFIX)
@@ -37,5 +98,7 @@ app.include_router(jobs.router, prefix=settings.API_PREFIX)
 app.include_router(analysis.router, prefix=settings.API_PREFIX)
 app.include_router(answers.router, prefix=settings.API_PREFIX)
 app.include_router(applications.router, prefix=settings.API_PREFIX)
+app.include_router(tasks.router, prefix=settings.API_PREFIX)
 app.include_router(users.router, prefix=settings.API_PREFIX)  # ← add include
+app.include_router(admin.router, prefix=settings.API_PREFIX)
 
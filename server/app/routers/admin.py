@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from app.core import profiling
+from app.core.auth import Principal, require_admin
+from app.core.config import settings
+from app.schemas.admin import ProfileOut, ProfileTokenOut
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/profiles", response_model=list[ProfileOut])
+async def list_profiles(admin: Principal = Depends(require_admin)):
+    """Captured request profiles, newest first."""
+    return await run_in_threadpool(profiling.list_profiles)
+
+
+@router.get("/profiles/{name}")
+def download_profile(name: str, admin: Principal = Depends(require_admin)):
+    """One profile as collapsed stacks (flamegraph.pl / speedscope input)."""
+    path = profiling.profile_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, filename=name, media_type="text/plain")
+
+
+@router.post("/profiles/token", response_model=ProfileTokenOut)
+def profile_token(
+    ttl: int = Query(600, ge=1, le=24 * 3600),
+    admin: Principal = Depends(require_admin),
+):
+    """
+    A signed X-Profile header value; requests carrying it are profiled until
+    it expires (when PROFILE_ENABLED is on).
+    """
+    if not settings.PROFILE_ENABLED:
+        raise HTTPException(status_code=409, detail="Profiling is disabled (PROFILE_ENABLED)")
+    return ProfileTokenOut(value=profiling.sign(ttl), expires_in=ttl)
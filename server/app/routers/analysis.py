@@ -1,83 +1,68 @@
-from pathlib import Path
-import re
-from typing import Iterable
-from docx import Document                 # for .docx
-from pdfminer.high_level import extract_text  # for .pdf
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
-from app.db.models import Resume, Job, User
-from app.core.auth import get_current_user
-from app.schemas.analysis import ScoreIn, ScoreOut
+from app.db.models import Resume, Job
+from app.core.auth import Principal, get_current_principal
+from app.core import score_cache
+from app.core.extract import ExtractionBusy, ExtractionTimeout
+from app.core.terms import job_keywords
+from app.core.scoring import overlap_matrix, score_matrix, top_pairs
+from app.core.text_cache import get_resume_text
+from app.schemas.analysis import ScoreIn, ScoreOut, BatchScoreIn, BatchScoreItem, BatchScoreOut
 
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
-# a tiny stopword list to avoid scoring on very common words
-_STOPWORDS = {
-    "the","and","of","to","a","in","for","on","with","at","by","an","be",
-    "as","is","are","that","this","from","or","it","you","your","our","we",
-    "will","have","has","i","he","she","they","them","their","his","her"
-}
-
-_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9_\-\+\.]*")
-
-
-def _tokenize(text: str) -> list[str]:
-    """Lowercase tokenization; filters short/common words."""
-    words = [w.lower() for w in _WORD_RE.findall(text)]
-    return [w for w in words if len(w) > 2 and w not in _STOPWORDS]
 
-
-def _keywords(text: str) -> set[str]:
-    """Turn text into a keyword set."""
-    return set(_tokenize(text))
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Document extraction is busy, try again shortly",
+        headers={"Retry-After": "5"},
+    )
 
 
-def _read_text_from_path(path: Path) -> str:
+def _score_out(resume_kw: frozenset[str], job_kw: set[str], score: int | None = None) -> ScoreOut:
     """
-    Extract text from a resume at `path`.
-    - .txt   -> UTF-8 text
-    - .docx  -> read with python-docx
-    - .pdf   -> read with pdfminer.six
-    - else   -> best-effort utf-8 decode (may be empty)
+    Build the ScoreOut payload (score + human-readable detail) for one pair.
+    Batch scoring passes the score it already computed for the pair.
     """
-    if not path.exists():
-        return ""
-
-    try:
-        ext = path.suffix.lower()
-
-        if ext == ".txt":
-            return path.read_text(encoding="utf-8", errors="ignore")
-
-        if ext == ".docx":
-            try:
-                doc = Document(str(path))
-                return "\n".join(p.text for p in doc.paragraphs)
-            except Exception:
-                return ""
+    if not job_kw:
+        return ScoreOut(
+            score=0,
+            reasons=["No meaningful keywords detected in the job description."],
+            matched_keywords=[],
+            missing_keywords=[],
+        )
 
-        if ext == ".pdf":
-            try:
-                return extract_text(str(path)) or ""
-            except Exception:
-                return ""
+    overlap = sorted(job_kw & resume_kw)
+    missing = sorted(job_kw - resume_kw)
 
-        # Fallback (rarely useful for binaries)
-        return path.read_bytes().decode("utf-8", errors="ignore")
+    if score is None:
+        score = int(round(len(overlap) / max(1, len(job_kw)) * 100))
 
-    except Exception:
-        return ""
+    # --- reasons (human-readable) ---
+    reasons: list[str] = [
+        f"Matched {len(overlap)} of {len(job_kw)} job keywords.",
+    ]
+    if overlap[:10]:
+        reasons.append("Examples of matched keywords: " + ", ".join(overlap[:10]))
+    if missing[:10]:
+        reasons.append("Missing keywords to consider: " + ", ".join(missing[:10]))
 
+    return ScoreOut(
+        score=score,
+        reasons=reasons,
+        matched_keywords=overlap[:50],   # cap lists so the payload stays small
+        missing_keywords=missing[:50],
+    )
 
 
 @router.post("/score", response_model=ScoreOut, status_code=status.HTTP_200_OK)
 def score_resume(
     body: ScoreIn,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Compute a mock compatibility score between a user's resume and a job.
@@ -100,44 +85,101 @@ def score_resume(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # --- load texts ---
-    resume_text = _read_text_from_path(Path(resume.file_path))
+    # --- same contents scored before (by anyone)? ---
     job_text = job.description or ""
+    job_hash = score_cache.description_hash(job_text)
+    if resume.content_hash:
+        cached = score_cache.get(resume.content_hash, job_hash)
+        if cached is not None:
+            return cached
+
+    # --- load texts (resume side comes from the extracted-text cache) ---
+    try:
+        resume_text = get_resume_text(db, resume)
+    except ExtractionBusy:
+        raise _busy()
+    except ExtractionTimeout:
+        raise HTTPException(status_code=422, detail="Resume took too long to parse")
 
-    if not resume_text.strip():
+    if not resume_text.text:
         raise HTTPException(status_code=400, detail="Resume text could not be read")
     if not job_text.strip():
         raise HTTPException(status_code=400, detail="Job description is empty")
 
-    # --- keyword sets ---
-    resume_kw = _keywords(resume_text)
-    job_kw = _keywords(job_text)
+    # --- keyword sets (job side is precomputed at insert time) ---
+    resume_kw = resume_text.keywords
+    job_kw = job_keywords(db, [job])[job.id]
 
-    if not job_kw:
-        return ScoreOut(
-            score=0,
-            reasons=["No meaningful keywords detected in the job description."],
-            matched_keywords=[],
-            missing_keywords=[],
-        )
+    out = _score_out(resume_kw, job_kw)
+    score_cache.put(resume.content_hash, job_hash, out)
+    return out
 
-    overlap = sorted(job_kw & resume_kw)
-    missing = sorted(job_kw - resume_kw)
 
-    score = int(round(len(overlap) / max(1, len(job_kw)) * 100))
+@router.post("/score/batch", response_model=BatchScoreOut, status_code=status.HTTP_200_OK)
+def score_batch(
+    body: BatchScoreIn,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Score many resumes against many jobs in one request and return the top-k pairs.
+    Omit `resume_ids` / `job_ids` to use all of the current user's resumes / jobs.
+    """
+    resume_q = db.query(Resume).filter(Resume.user_id == current_user.id)
+    if body.resume_ids is not None:
+        resume_q = resume_q.filter(Resume.id.in_(body.resume_ids))
+    resumes = resume_q.order_by(Resume.id).all()
+
+    job_q = db.query(Job).filter(Job.user_id == current_user.id)
+    if body.job_ids is not None:
+        job_q = job_q.filter(Job.id.in_(body.job_ids))
+    jobs = job_q.order_by(Job.id).all()
 
-    # --- reasons (human-readable) ---
-    reasons: list[str] = [
-        f"Matched {len(overlap)} of {len(job_kw)} job keywords.",
-    ]
-    if overlap[:10]:
-        reasons.append("Examples of matched keywords: " + ", ".join(overlap[:10]))
-    if missing[:10]:
-        reasons.append("Missing keywords to consider: " + ", ".join(missing[:10]))
+    if body.resume_ids is not None and len(resumes) != len(set(body.resume_ids)):
+        raise HTTPException(status_code=404, detail="Resume not found")
+    if body.job_ids is not None and len(jobs) != len(set(body.job_ids)):
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    return ScoreOut(
-        score=score,
-        reasons=reasons,
-        matched_keywords=overlap[:50],   # cap lists so the payload stays small
-        missing_keywords=missing[:50],
+    # --- keyword sets; unreadable resumes / empty jobs can't be ranked ---
+    skipped_resume_ids: list[int] = []
+    resume_ids: list[int] = []
+    resume_kws: list[frozenset[str]] = []
+    for resume in resumes:
+        try:
+            cached = get_resume_text(db, resume)
+        except ExtractionBusy:
+            raise _busy()
+        except ExtractionTimeout:
+            skipped_resume_ids.append(resume.id)
+            continue
+        if cached.text:
+            resume_ids.append(resume.id)
+            resume_kws.append(cached.keywords)
+        else:
+            skipped_resume_ids.append(resume.id)
+
+    skipped_job_ids: list[int] = []
+    job_ids: list[int] = []
+    job_kws: list[set[str]] = []
+    stored_kws = job_keywords(db, jobs)
+    for job in jobs:
+        kw = stored_kws[job.id]
+        if kw:
+            job_ids.append(job.id)
+            job_kws.append(kw)
+        else:
+            skipped_job_ids.append(job.id)
+
+    results: list[BatchScoreItem] = []
+    if resume_kws and job_kws:
+        scores = score_matrix(overlap_matrix(resume_kws, job_kws), [len(kw) for kw in job_kws])
+        # highest score first; ties keep (resume, job) id order
+        for r, j in top_pairs(scores, body.top_k):
+            detail = _score_out(resume_kws[r], job_kws[j], score=int(scores[r, j]))
+            results.append(BatchScoreItem(resume_id=resume_ids[r], job_id=job_ids[j], **detail.model_dump()))
+
+    return BatchScoreOut(
+        results=results,
+        skipped_resume_ids=skipped_resume_ids,
+        skipped_job_ids=skipped_job_ids,
     )
@@ -1,53 +1,93 @@
+import asyncio
+import json
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
-from app.db.models import Job, User
-from app.core.auth import get_current_user
+from app.db.database import get_async_db
+from app.db.models import Job
+from app.core.auth import Principal, get_current_principal
+from app.core.answers import GenerationError, JobContext, draft
 from app.schemas.answers import AnswerIn, AnswerDraft, AnswersOut
 
 router = APIRouter(prefix="/answers", tags=["answers"])
 
 
-def _draft_answer(question: str, job_title: str) -> str:
-    """
-    Tiny, deterministic template so we can unit test later.
-    Replace this with a call to your LLM/agent when ready.
-    """
-    return (
-        f"**Question:** {question}\n\n"
-        f"**Draft:** For the {job_title} role, I’d use a concise STAR structure:\n"
-        f"- **Situation/Task:** Briefly set context relevant to the question.\n"
-        f"- **Action:** 2–3 concrete actions I took (tools, frameworks, teamwork).\n"
-        f"- **Result:** Quantify impact if possible (time saved, defects reduced, revenue gained).\n"
-        f"- **Tie-back:** Close by aligning with the {job_title} responsibilities."
-    )
-
-
-@router.post("/draft", response_model=AnswersOut, status_code=status.HTTP_200_OK)
-def draft_answers(
-    body: AnswerIn,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+async def _load_job(body: AnswerIn, db: AsyncSession, user_id: int) -> tuple[JobContext, list[tuple[int, str]]]:
+    """Validate the request; returns the job context and (position, prompt) pairs to draft."""
     if not body.prompts:
         raise HTTPException(status_code=422, detail="prompts cannot be empty")
 
     # Ensure the job exists and belongs to the current user
     job = (
-        db.query(Job)
-        .filter(Job.id == body.job_id, Job.user_id == current_user.id)
-        .first()
-    )
+        await db.execute(select(Job).where(Job.id == body.job_id, Job.user_id == user_id))
+    ).scalar_one_or_none()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    ctx = JobContext(title=job.title or "target", description=job.description or "")
+    # nothing below needs the database; give the connection back before generating
+    await db.close()
 
-    drafts = [
-        AnswerDraft(question=q, draft=_draft_answer(q, job.title or "target"))
-        for q in body.prompts
-        if q and q.strip()
-    ]
-    if not drafts:
+    prompts = [(i, q) for i, q in enumerate(body.prompts) if q and q.strip()]
+    if not prompts:
         raise HTTPException(status_code=422, detail="No valid prompts provided")
+    return ctx, prompts
+
 
+@router.post("/draft", response_model=AnswersOut, status_code=status.HTTP_200_OK)
+async def draft_answers(
+    body: AnswerIn,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    ctx, prompts = await _load_job(body, db, current_user.id)
+    try:
+        results = await asyncio.gather(*(draft(q, ctx) for _, q in prompts))
+    except GenerationError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+
+    drafts = [AnswerDraft(question=q, draft=d) for (_, q), d in zip(prompts, results)]
     return AnswersOut(job_id=body.job_id, answers=drafts)
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/draft/stream")
+async def stream_answers(
+    body: AnswerIn,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Same as /draft, but as Server-Sent Events: one `draft` event per prompt
+    as soon as it is ready (in completion order, tagged with the prompt's
+    `index` in the request), `error` for prompts that failed, then `done`.
+    """
+    ctx, prompts = await _load_job(body, db, current_user.id)
+
+    async def one(index: int, question: str):
+        try:
+            return "draft", {"index": index, "question": question, "draft": await draft(question, ctx)}
+        except GenerationError as e:
+            return "error", {"index": index, "question": question, "detail": str(e)}
+
+    async def events():
+        tasks = [asyncio.ensure_future(one(i, q)) for i, q in prompts]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                event, data = await next_done
+                yield _sse(event, data)
+            yield _sse("done", {"job_id": body.job_id, "count": len(prompts)})
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,10 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.db.database import get_db
-from app.db.models import Application, Job, Resume, User
-from app.core.auth import get_current_user
-from app.schemas.applications import ApplicationCreate, ApplicationOut
+from app.db.database import get_db, insert_returning
+from app.db.models import Application, Job, Resume
+from app.core import funnel, versions
+from app.core.auth import Principal, get_current_principal
+from app.core.pagination import MAX_LIMIT, paginate
+from app.core.projection import columns, json_rows, parse_fields
+from app.schemas.applications import (
+    ApplicationAnalyticsOut,
+    ApplicationBatchCreate,
+    ApplicationBatchResult,
+    ApplicationCreate,
+    ApplicationOut,
+    ApplicationStatusResult,
+    ApplicationStatusUpdate,
+)
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -12,7 +27,7 @@ router = APIRouter(prefix="/applications", tags=["applications"])
 def create_application(
     body: ApplicationCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     # Ensure the job belongs to the current user
     job = (
@@ -40,19 +55,119 @@ def create_application(
         status=body.status,
     )
     db.add(app)
+    funnel.bump(db, current_user.id, {body.status: 1})
+    versions.bump(db, current_user.id, versions.APPLICATIONS)
     db.commit()
     db.refresh(app)
     return app
 
+@router.post("/batch", response_model=list[ApplicationBatchResult])
+def create_applications(
+    body: ApplicationBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Create many applications at once. Ownership of every referenced job and
+    resume is checked with one query each and the rows are written with one
+    INSERT; items pointing at someone else's job or resume fail individually.
+    """
+    job_ids = {item.job_id for item in body.items}
+    resume_ids = {item.resume_id for item in body.items}
+    owned_jobs = set(db.scalars(select(Job.id).where(Job.user_id == current_user.id, Job.id.in_(job_ids))))
+    owned_resumes = set(
+        db.scalars(select(Resume.id).where(Resume.user_id == current_user.id, Resume.id.in_(resume_ids)))
+    )
+
+    results: list[ApplicationBatchResult] = []
+    rows: list[dict] = []
+    for index, item in enumerate(body.items):
+        if item.job_id not in owned_jobs:
+            results.append(ApplicationBatchResult(index=index, error="Job not found"))
+        elif item.resume_id not in owned_resumes:
+            results.append(ApplicationBatchResult(index=index, error="Resume not found"))
+        else:
+            results.append(ApplicationBatchResult(index=index))
+            rows.append({
+                "user_id": current_user.id,
+                "job_id": item.job_id,
+                "resume_id": item.resume_id,
+                "status": item.status,
+            })
+
+    if rows:
+        # one multi-row INSERT; rows come back in input order
+        apps = insert_returning(db, Application, rows)
+        pending = (r for r in results if r.error is None)
+        # serialize before commit expires the returned rows
+        for result, app in zip(pending, apps):
+            result.application = ApplicationOut.model_validate(app)
+        funnel.bump(db, current_user.id, Counter(row["status"] for row in rows))
+        versions.bump(db, current_user.id, versions.APPLICATIONS)
+        db.commit()
+    return results
+
+
+@router.patch("/status", response_model=list[ApplicationStatusResult])
+def update_application_status(
+    body: ApplicationStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Move many of this user's applications to `status` (one UPDATE per status they leave)."""
+    owned = set(
+        db.scalars(
+            select(Application.id).where(Application.user_id == current_user.id, Application.id.in_(set(body.ids)))
+        )
+    )
+    if owned:
+        funnel.move(db, current_user.id, owned, body.status)
+        versions.bump(db, current_user.id, versions.APPLICATIONS)
+        db.commit()
+    return [
+        ApplicationStatusResult(id=i, updated=True) if i in owned
+        else ApplicationStatusResult(id=i, updated=False, error="Application not found")
+        for i in body.ids
+    ]
+
+
 @router.get("", response_model=list[ApplicationOut])
 def list_applications(
+    request: Request,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated subset of fields to return"),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    names = parse_fields(fields, ApplicationOut)
+    unchanged = versions.not_modified(request, response, db, current_user.id, versions.APPLICATIONS)
+    if unchanged is not None:
+        return unchanged
+    sort = (Application.id,)
+    query = db.query(*columns(Application, names, *sort)).filter(Application.user_id == current_user.id)
+    return json_rows(paginate(query, sort, response, limit, cursor), names, response)
+
+
+@router.get("/analytics", response_model=ApplicationAnalyticsOut)
+def application_analytics(
+    weeks: int = Query(12, ge=1, le=104),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    rows = (
-        db.query(Application)
-        .filter(Application.user_id == current_user.id)
-        .order_by(Application.id.desc())
-        .all()
+    """
+    Funnel for the dashboard: counts per status (from the counters table),
+    pipeline conversion, and applications submitted per week over the last
+    `weeks` weeks.
+    """
+    counts = funnel.status_counts(db, current_user.id)
+    since = datetime.combine(date.today() - timedelta(weeks=weeks), datetime.min.time())
+    weekly = funnel.weekly_submissions(db, current_user.id, since)
+    return ApplicationAnalyticsOut(
+        total=sum(counts.values()),
+        status_counts=counts,
+        funnel=funnel.funnel(counts),
+        rejected=counts.get(funnel.REJECTED, 0),
+        weekly_submissions=[{"week_start": week, "count": n} for week, n in weekly],
     )
-    return rows
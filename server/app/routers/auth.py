@@ -1,27 +1,35 @@
 # server/app/routers/auth.py
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.auth import RegisterIn, TokenOut
-from app.core.security import hash_password, verify_password, create_access_token
-from app.db.database import get_db
+from app.core.security import hash_password_async, verify_password_async, create_access_token
+from app.db.database import get_async_db
 from app.db.models import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/register", response_model=TokenOut)
-def register(body: RegisterIn, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.email == body.email).first():
+async def register(body: RegisterIn, db: AsyncSession = Depends(get_async_db)):
+    if (await db.execute(select(User.id).where(User.email == body.email))).first():
         raise HTTPException(400, "Email already registered")
-    user = User(email=body.email, password_hash=hash_password(body.password))
+    user = User(email=body.email, password_hash=await hash_password_async(body.password))
     db.add(user)
-    db.commit()
-    return TokenOut(access_token=create_access_token(sub=user.email))
+    await db.commit()
+    return TokenOut(access_token=create_access_token(sub=user.email, uid=user.id))
 
 @router.post("/login", response_model=TokenOut)
-def login(form: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
     email = form.username
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(form.password, user.password_hash):
+    user = (await db.execute(select(User).where(User.email == email))).scalar_one_or_none()
+    if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    return TokenOut(access_token=create_access_token(sub=user.email))
+    ok, new_hash = await verify_password_async(form.password, user.password_hash)
+    if not ok:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # BCRYPT_ROUNDS changed since this hash was made; upgrade it in place
+        user.password_hash = new_hash
+        await db.commit()
+    return TokenOut(access_token=create_access_token(sub=user.email, uid=user.id))
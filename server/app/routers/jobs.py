@@ -1,29 +1,37 @@
 from __future__ import annotations
 
 import re
-from html import unescape
 from typing import List
 
-import httpx
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.auth import get_current_user
-from app.db.database import get_db
-from app.db.models import Job, User
-from app.schemas.jobs import JobAnalyzeIn, JobOut, JobCreateIn
+from app.core.auth import Principal, get_current_principal
+from app.core import funnel, score_cache, search, versions
+from app.core.config import settings
+from app.core.fetch import FetchError, fetch_page
+from app.core.json_stream import iter_records
+from app.core.pagination import MAX_LIMIT, paginate
+from app.core.projection import columns, json_rows, parse_fields
+from app.core.terms import index_job, index_jobs, unindex_job
+from app.db.database import get_async_db, get_db, insert_returning
+from app.db.models import Application, Job
+from app.schemas.jobs import (
+    JobAnalyzeIn,
+    JobCreateIn,
+    JobImportError,
+    JobImportItem,
+    JobImportOut,
+    JobOut,
+    JobSearchHit,
+    JobSearchOut,
+)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
-
-def _strip_html(html: str) -> str:
-    """Very simple HTML → text conversion (good enough for mock)."""
-    text = unescape(html)
-    text = re.sub(r"<script.*?>.*?</script>", " ", text, flags=re.S | re.I)
-    text = re.sub(r"<style.*?>.*?</style>", " ", text, flags=re.S | re.I)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+DESCRIPTION_MAX_CHARS = 20_000
 
 
 def _guess_title(text: str) -> str:
@@ -43,27 +51,63 @@ def _guess_title(text: str) -> str:
     return "Untitled role"
 
 
+def _index(session: Session, row: Job) -> None:
+    """Scoring keywords + search postings for a new job (sync side of the AsyncSession)."""
+    index_job(session, row)
+    search.index_job(session, row)
+
+
+def _insert_batch(session: Session, rows: list[dict]) -> list[int]:
+    """One multi-row INSERT ... RETURNING plus indexing; ids come back in input order."""
+    jobs = insert_returning(session, Job, rows)
+    index_jobs(session, jobs)
+    search.index_jobs(session, jobs)
+    return [job.id for job in jobs]
+
+
+def _first_error(e: ValidationError) -> str:
+    err = e.errors()[0]
+    loc = ".".join(str(p) for p in err["loc"])
+    return f"{loc}: {err['msg']}" if loc else err["msg"]
+
+
+# the body is parsed incrementally, so describe it for the docs
+_IMPORT_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/x-ndjson": {"schema": {"type": "string", "description": "one JobImportItem per line"}},
+            "application/json": {
+                "schema": {"type": "array", "items": JobImportItem.model_json_schema()},
+            },
+        },
+    }
+}
+
+
 @router.post("", response_model=JobOut, status_code=status.HTTP_201_CREATED)
 async def create_job(
     body: JobCreateIn,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Create a new job posting.
     """
     row = Job(user_id=current_user.id, title=body.title, description=body.description)
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    await db.run_sync(_index, row)
+    await db.run_sync(versions.bump, current_user.id, versions.JOBS)
+    await db.commit()
+    await db.refresh(row)
     return row
 
 
 @router.post("/analyze", response_model=JobOut, status_code=status.HTTP_201_CREATED)
 async def analyze_job(
     body: JobAnalyzeIn,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     - If `url` provided, fetch the page and extract text (very simple parser).
@@ -78,51 +122,119 @@ async def analyze_job(
 
     text = body.jd_text or ""
     if body.url:
+        # don't hold a pooled connection while waiting on someone else's server
+        await db.close()
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.get(str(body.url))
-            if resp.status_code != 200 or not resp.text:
-                raise HTTPException(400, f"Failed to fetch URL (status {resp.status_code})")
-            text = _strip_html(resp.text)
-        except httpx.HTTPError as e:
-            raise HTTPException(400, f"Error fetching URL: {e!s}")
+            page = await fetch_page(str(body.url), DESCRIPTION_MAX_CHARS)
+        except FetchError as e:
+            raise HTTPException(400, str(e))
+        text = page.text
 
     if not text or len(text.strip()) < 5:
         raise HTTPException(400, "Job description appears to be empty")
 
     title = _guess_title(text)
     # Optional: trim description to something reasonable
-    description = text[:20000]
+    description = text[:DESCRIPTION_MAX_CHARS]
 
     row = Job(user_id=current_user.id, title=title, description=description)
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    await db.run_sync(_index, row)
+    await db.run_sync(versions.bump, current_user.id, versions.JOBS)
+    await db.commit()
+    await db.refresh(row)
     return row
 
 
 @router.get("", response_model=List[JobOut])
 def list_jobs(
+    request: Request,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated subset of fields to return"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
-    Return this user's jobs (newest first).
+    Return this user's jobs (newest first). Pass `limit` to page; the cursor
+    for the next page comes back in the X-Next-Cursor header. `fields`
+    (e.g. `id,title,created_at`) trims each item to those keys. Send the
+    ETag back in If-None-Match to get a 304 while the list is unchanged.
     """
-    rows = (
-        db.query(Job)
-        .filter(Job.user_id == current_user.id)
-        .order_by(Job.created_at.desc())
-        .all()
+    names = parse_fields(fields, JobOut)
+    unchanged = versions.not_modified(request, response, db, current_user.id, versions.JOBS)
+    if unchanged is not None:
+        return unchanged
+    sort = (Job.created_at, Job.id)
+    query = db.query(*columns(Job, names, *sort)).filter(Job.user_id == current_user.id)
+    return json_rows(paginate(query, sort, response, limit, cursor), names, response)
+
+
+@router.post("/import", response_model=JobImportOut, openapi_extra=_IMPORT_OPENAPI)
+async def import_jobs(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Bulk-create jobs from an NDJSON or JSON-array body of {title?, description}.
+    Rows are inserted in batches in a single transaction; bad records are
+    reported in `errors` and don't stop the rest of the import.
+    """
+    created: list[int] = []
+    errors: list[JobImportError] = []
+    batch: list[dict] = []
+
+    async for rec in iter_records(request.stream(), settings.JOB_IMPORT_MAX_ITEM_BYTES):
+        if rec.error:
+            errors.append(JobImportError(index=rec.index, error=rec.error))
+            continue
+        try:
+            item = JobImportItem.model_validate(rec.value)
+        except ValidationError as e:
+            errors.append(JobImportError(index=rec.index, error=_first_error(e)))
+            continue
+        title = (item.title or "").strip() or _guess_title(item.description)
+        batch.append({"user_id": current_user.id, "title": title, "description": item.description})
+        if len(batch) >= settings.JOB_IMPORT_BATCH_SIZE:
+            created += await db.run_sync(_insert_batch, batch)
+            batch = []
+
+    if batch:
+        created += await db.run_sync(_insert_batch, batch)
+    if created:
+        await db.run_sync(versions.bump, current_user.id, versions.JOBS)
+    await db.commit()
+    return JobImportOut(created=len(created), job_ids=created, errors=errors)
+
+
+@router.get("/search", response_model=JobSearchOut)
+def search_jobs(
+    q: str = Query(..., min_length=1, max_length=500),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Ranked full-text search over this user's jobs (title + description).
+    """
+    total, hits = search.search_jobs(db, current_user.id, q, limit, offset)
+    return JobSearchOut(
+        total=total,
+        results=[
+            JobSearchHit(**JobOut.model_validate(job).model_dump(), score=round(score, 4))
+            for job, score in hits
+        ],
     )
-    return rows
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_job(
     job_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Delete a job posting.
@@ -134,7 +246,13 @@ def delete_job(
     )
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    
+
+    job_hash = score_cache.description_hash(job.description or "")
+    unindex_job(db, job.id)
+    search.unindex_job(db, job.id)
+    funnel.remove(db, current_user.id, Application.job_id == job.id)
+    versions.bump(db, current_user.id, versions.JOBS, versions.APPLICATIONS)
     db.delete(job)
     db.commit()
+    score_cache.invalidate_job(job_hash)
     return None
@@ -1,84 +1,113 @@
 from pathlib import Path
-from time import time
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.database import get_db
-from app.db.models import Resume, User
+from app.db.database import get_async_db, get_db
+from app.db.models import Application, Resume
 from app.schemas.resumes import ResumeOut
-from app.core.auth import get_current_user  # returns User row
+from app.core.auth import Principal, get_current_principal
+from app.core import funnel, score_cache, text_cache, versions
+from app.core.pagination import MAX_LIMIT, paginate
+from app.core.projection import columns, json_rows, parse_fields
+from app.core.downloads import file_response
+from app.core.extract import ExtractionBusy, ExtractionTimeout, extract_text_async
+from app.core.uploads import receive_file, release_blob
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
-# uploads directory at project root (…/server/uploads)
-UPLOAD_DIR = (Path(__file__).resolve().parents[2] / "uploads").resolve()
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+_ALLOWED_TYPES = {
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
+    "application/msword",  # .doc
+    "text/plain",
+}
+
+# the body is parsed by hand (streamed to disk), so describe it for the docs
+_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
 
 
-@router.post("", response_model=ResumeOut, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=ResumeOut, status_code=status.HTTP_201_CREATED, openapi_extra=_UPLOAD_OPENAPI)
 async def upload_resume(
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),  # already a User row
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    # allow only safe formats
-    allowed = {
-        "application/pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",  # .docx
-        "application/msword",  # .doc
-        "text/plain",
-    }
-    if file.content_type not in allowed:
-        raise HTTPException(
-            status_code=415,
-            detail=f"Unsupported file type: {file.content_type}",
-        )
-
-    # unique filename
-    original = Path(file.filename).name
-    unique = f"{current_user.id}_{int(time())}_{original}"
-    dest_path = UPLOAD_DIR / unique
-
-    # write file
-    data = await file.read()
-    dest_path.write_bytes(data)
-
-    # persist record
+    # stream to a temp file (size-capped, only safe formats); it joins the
+    # content-addressed store once the row is committed
+    upload = await receive_file(request, "file", _ALLOWED_TYPES)
+
+    # persist record; identical files share one blob
     rec = Resume(
         user_id=current_user.id,
-        filename=original,
-        file_path=str(dest_path),
+        filename=upload.filename,
+        file_path=str(upload.path),
+        content_hash=upload.content_hash,
         uploaded_at=datetime.utcnow(),
     )
     db.add(rec)
-    db.commit()
-    db.refresh(rec)
+    await db.run_sync(versions.bump, current_user.id, versions.RESUMES)
+    try:
+        await db.commit()
+    except BaseException:
+        await run_in_threadpool(upload.discard)
+        raise
+    await run_in_threadpool(upload.store)
+    await db.refresh(rec)
+
+    # warm the extracted-text cache so the first score request skips parsing;
+    # if the pool is busy or the file is pathological, scoring deals with it later
+    if await db.run_sync(text_cache.lookup, rec.content_hash) is None:
+        try:
+            raw = await extract_text_async(upload.path)
+        except (ExtractionBusy, ExtractionTimeout):
+            pass
+        else:
+            await db.run_sync(text_cache.store, rec.content_hash, raw)
 
     return rec
 
 
 @router.get("", response_model=list[ResumeOut])
 def list_resumes(
+    request: Request,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
+    fields: str | None = Query(None, description="Comma-separated subset of fields to return"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    rows = (
-        db.query(Resume)
-        .filter(Resume.user_id == current_user.id)
-        .order_by(Resume.uploaded_at.desc())
-        .all()
-    )
-    return rows
+    names = parse_fields(fields, ResumeOut)
+    unchanged = versions.not_modified(request, response, db, current_user.id, versions.RESUMES)
+    if unchanged is not None:
+        return unchanged
+    sort = (Resume.uploaded_at, Resume.id)
+    query = db.query(*columns(Resume, names, *sort)).filter(Resume.user_id == current_user.id)
+    return json_rows(paginate(query, sort, response, limit, cursor), names, response)
 
 
 @router.get("/{resume_id}", response_model=ResumeOut)
 def get_resume(
     resume_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     rec = (
         db.query(Resume)
@@ -93,9 +122,15 @@ def get_resume(
 @router.get("/{resume_id}/download")
 def download_resume(
     resume_id: int,
+    request: Request,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
+    """
+    The uploaded file. Carries a strong ETag (the content hash) and
+    Last-Modified; conditional requests get 304s and `Range` requests 206s,
+    several ranges as multipart/byteranges.
+    """
     rec = (
         db.query(Resume)
         .filter(Resume.id == resume_id, Resume.user_id == current_user.id)
@@ -105,17 +140,20 @@ def download_resume(
         raise HTTPException(status_code=404, detail="Resume not found")
 
     path = Path(rec.file_path)
-    if not path.exists():
+    try:
+        if not rec.content_hash:
+            rec.content_hash = text_cache.file_hash(path)
+            db.commit()
+        return file_response(request, path, f'"{rec.content_hash}"', filename=rec.filename)
+    except FileNotFoundError:
         raise HTTPException(status_code=410, detail="File on disk is missing")
 
-    return FileResponse(path, filename=rec.filename, media_type="application/octet-stream")
-
 
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_resume(
     resume_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     rec = (
         db.query(Resume)
@@ -125,12 +163,16 @@ def delete_resume(
     if not rec:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    # try deleting file
-    try:
-        Path(rec.file_path).unlink(missing_ok=True)
-    except Exception:
-        pass
-
+    path, content_hash = rec.file_path, rec.content_hash
+    funnel.remove(db, current_user.id, Application.resume_id == rec.id)
+    versions.bump(db, current_user.id, versions.RESUMES, versions.APPLICATIONS)
     db.delete(rec)
     db.commit()
+
+    # blob + cached text go once no other resume shares them
+    release_blob(db, path)
+    if content_hash:
+        text_cache.evict(db, content_hash)
+        db.commit()
+        score_cache.invalidate_resume(content_hash)
     return None
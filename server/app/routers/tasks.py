@@ -0,0 +1,66 @@
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.db.database import AsyncSessionLocal, SessionLocal
+from app.db.models import Task
+from app.core import tasks
+from app.core.auth import Principal, get_current_principal
+from app.routers.analysis import score_resume
+from app.routers.jobs import analyze_job
+from app.schemas.analysis import ScoreIn
+from app.schemas.jobs import JobAnalyzeIn, JobOut
+from app.schemas.tasks import TaskOut
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@tasks.handler("score")
+async def _score(payload: dict, principal: Principal) -> dict:
+    # same code path as POST /analysis/score, on a threadpool thread
+    def run() -> dict:
+        with SessionLocal() as db:
+            return score_resume(ScoreIn(**payload), db=db, current_user=principal).model_dump()
+    return await run_in_threadpool(run)
+
+
+@tasks.handler("analyze_job")
+async def _analyze_job(payload: dict, principal: Principal) -> dict:
+    async with AsyncSessionLocal() as db:
+        row = await analyze_job(JobAnalyzeIn(**payload), db=db, current_user=principal)
+        return JobOut.model_validate(row).model_dump(mode="json")
+
+
+def _out(task: Task) -> TaskOut:
+    return TaskOut(
+        id=task.id,
+        kind=task.kind,
+        status=task.status,
+        result=json.loads(task.result) if task.result else None,
+        error=task.error,
+        status_code=task.status_code,
+        created_at=task.created_at,
+        started_at=task.started_at,
+        finished_at=task.finished_at,
+    )
+
+
+@router.post("/score", response_model=TaskOut, status_code=status.HTTP_202_ACCEPTED)
+async def submit_score(body: ScoreIn, current_user: Principal = Depends(get_current_principal)):
+    """Queue POST /analysis/score; poll GET /tasks/{id} for the ScoreOut."""
+    return _out(await tasks.submit(current_user.id, "score", body.model_dump()))
+
+
+@router.post("/analyze-job", response_model=TaskOut, status_code=status.HTTP_202_ACCEPTED)
+async def submit_analyze_job(body: JobAnalyzeIn, current_user: Principal = Depends(get_current_principal)):
+    """Queue POST /jobs/analyze; poll GET /tasks/{id} for the created job."""
+    return _out(await tasks.submit(current_user.id, "analyze_job", body.model_dump(mode="json")))
+
+
+@router.get("/{task_id}", response_model=TaskOut)
+async def get_task(task_id: str, current_user: Principal = Depends(get_current_principal)):
+    task = await tasks.get(task_id, current_user.id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return _out(task)
@@ -1,24 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.database import get_db
+from app.db.database import get_async_db, get_db
 from app.db.models import User
 from app.schemas.users import UserCreate, UserOut
-from app.core.security import hash_password  # you already have this
+from app.core.security import hash_password_async  # runs on the bcrypt pool
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 @router.post("", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def create_user(body: UserCreate, db: Session = Depends(get_db)):
+async def create_user(body: UserCreate, db: AsyncSession = Depends(get_async_db)):
     # Prevent duplicate emails
-    exists = db.query(User).filter(User.email == body.email).first()
+    exists = (await db.execute(select(User.id).where(User.email == body.email))).first()
     if exists:
         raise HTTPException(status_code=400, detail="Email already exists")
 
-    user = User(email=body.email, password_hash=hash_password(body.password))
+    user = User(email=body.email, password_hash=await hash_password_async(body.password))
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 @router.get("/{user_id}", response_model=UserOut)
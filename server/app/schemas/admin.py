@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ProfileOut(BaseModel):
+    name: str
+    size: int
+    created_at: Optional[datetime] = None
+    method: Optional[str] = None
+    path: Optional[str] = None
+    route: Optional[str] = None   # route template, e.g. /api/resumes/{resume_id}
+    status: Optional[int] = None
+    duration_ms: Optional[float] = None
+    samples: Optional[int] = None  # stack snapshots taken while the request ran
+
+
+class ProfileTokenOut(BaseModel):
+    header: str = "X-Profile"
+    value: str
+    expires_in: int
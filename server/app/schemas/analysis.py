@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Optional
+
+from pydantic import BaseModel, Field
 
 class ScoreIn(BaseModel):
     resume_id: int
@@ -9,3 +11,17 @@ class ScoreOut(BaseModel):
     reasons: list[str]           # human-readable notes
     matched_keywords: list[str]  # keywords found in BOTH
     missing_keywords: list[str]  # keywords in job, missing from resume
+
+class BatchScoreIn(BaseModel):
+    resume_ids: Optional[list[int]] = None  # None -> all of the user's resumes
+    job_ids: Optional[list[int]] = None     # None -> all of the user's jobs
+    top_k: int = Field(default=10, ge=1, le=1000)
+
+class BatchScoreItem(ScoreOut):
+    resume_id: int
+    job_id: int
+
+class BatchScoreOut(BaseModel):
+    results: list[BatchScoreItem]    # best pairs first, at most top_k
+    skipped_resume_ids: list[int]    # resume text could not be read
+    skipped_job_ids: list[int]       # no meaningful keywords in the description
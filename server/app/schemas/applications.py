@@ -1,5 +1,7 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date, datetime
 
 # Allowed statuses for your simple pipeline (feel free to expand)
 _ALLOWED = {
@@ -31,3 +33,43 @@ class ApplicationOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+# most items accepted by the batch endpoints in one request
+_BATCH_MAX = 200
+
+class ApplicationBatchCreate(BaseModel):
+    items: list[ApplicationCreate] = Field(min_length=1, max_length=_BATCH_MAX)
+
+class ApplicationBatchResult(BaseModel):
+    index: int  # position in the request's items
+    application: Optional[ApplicationOut] = None
+    error: Optional[str] = None
+
+class ApplicationStatusUpdate(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=_BATCH_MAX)
+    status: str
+
+    def model_post_init(self, __context):
+        if self.status not in _ALLOWED:
+            raise ValueError(f"status must be one of: {', '.join(sorted(_ALLOWED))}")
+
+class ApplicationStatusResult(BaseModel):
+    id: int
+    updated: bool
+    error: Optional[str] = None
+
+class WeeklyCount(BaseModel):
+    week_start: date
+    count: int
+
+class FunnelStage(BaseModel):
+    stage: str
+    reached: int  # applications at this stage or further along
+    conversion: Optional[float] = None  # reached / reached at the previous stage
+
+class ApplicationAnalyticsOut(BaseModel):
+    total: int
+    status_counts: dict[str, int]
+    funnel: list[FunnelStage]
+    rejected: int
+    weekly_submissions: list[WeeklyCount]
@@ -1,11 +1,15 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
+
+
+# Job.title is VARCHAR(255)
+TITLE_MAX_CHARS = 255
 
 
 class JobCreateIn(BaseModel):
-    title: str
+    title: str = Field(max_length=TITLE_MAX_CHARS)
     description: str
 
 
@@ -26,3 +30,29 @@ class JobOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class JobSearchHit(JobOut):
+    score: float
+
+
+class JobSearchOut(BaseModel):
+    total: int
+    results: list[JobSearchHit]
+
+
+class JobImportItem(BaseModel):
+    """One record of a bulk import; the title is guessed from the description when missing."""
+    title: Optional[str] = Field(None, max_length=TITLE_MAX_CHARS)
+    description: str = Field(min_length=1)
+
+
+class JobImportError(BaseModel):
+    index: int  # NDJSON line number or array position (1-based)
+    error: str
+
+
+class JobImportOut(BaseModel):
+    created: int
+    job_ids: list[int]
+    errors: list[JobImportError]
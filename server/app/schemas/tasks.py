@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class TaskOut(BaseModel):
+    id: str
+    kind: str
+    status: str  # queued | running | succeeded | failed
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None  # on failure: what the inline endpoint would have returned
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
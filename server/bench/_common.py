@@ -0,0 +1,69 @@
+# server/bench/_common.py
+"""
+Shared setup for the benchmark scripts: a throwaway SQLite database and
+upload directory (unless DATABASE_URL / UPLOAD_DIR are already set), the
+schema, and an in-process ASGI client.
+Import this before anything from `app`.
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+_SERVER_DIR = Path(__file__).resolve().parents[1]
+if str(_SERVER_DIR) not in sys.path:
+    sys.path.insert(0, str(_SERVER_DIR))
+
+_TMP_DIR = Path(tempfile.mkdtemp(prefix="jobs-bench-"))
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR / 'bench.db'}"
+# uploaded fixtures stay out of the source tree (inherited by --serve's uvicorn too)
+os.environ.setdefault("UPLOAD_DIR", str(_TMP_DIR / "uploads"))
+
+import httpx  # noqa: E402
+
+from app.db import models  # noqa: E402,F401  (registers tables)
+from app.db.database import Base, engine  # noqa: E402
+
+
+def create_schema() -> None:
+    Base.metadata.create_all(engine)
+    if engine.dialect.name == "sqlite":
+        # readers must not block the writer, or concurrent requests just trade "database is locked"
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+
+def percentiles(samples: list[float]) -> dict:
+    """p50/p95/p99/max in milliseconds for a list of durations in seconds."""
+    if not samples:
+        return {"n": 0}
+    ms = sorted(s * 1000 for s in samples)
+    q = statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else [ms[0]] * 99
+    return {
+        "n": len(ms),
+        "p50": round(q[49], 3),
+        "p95": round(q[94], 3),
+        "p99": round(q[98], 3),
+        "max": round(ms[-1], 3),
+    }
+
+
+def asgi_client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+
+async def register(client: httpx.AsyncClient, email: str, password: str = "bench-password") -> dict:
+    """Create a user and return Authorization headers for it."""
+    r = await client.post("/api/auth/register", json={"email": email, "password": password})
+    r.raise_for_status()
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def emit(result: dict, out: str | None) -> None:
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if out:
+        Path(out).write_text(text + "\n")
+    print(text)
@@ -0,0 +1,77 @@
+# server/bench/auth_throughput.py
+"""
+Login-storm benchmark for the auth routes.
+
+Fires concurrent POST /api/auth/login requests while a second client keeps
+polling GET /api/jobs, then reports login throughput, how many logins were
+shed with 503, and the latency the job listing saw during the storm.
+
+    cd server && python -m bench.auth_throughput --logins 300 --concurrency 64
+"""
+import argparse
+import asyncio
+import time
+
+from bench._common import asgi_client, create_schema, emit, percentiles, register
+
+from app.core.config import settings
+from app.main import app
+
+
+async def main(args) -> None:
+    create_schema()
+    email = f"storm-{time.time_ns()}@example.com"
+    async with asgi_client(app) as client:
+        headers = await register(client, email, "storm-password")
+
+        sem = asyncio.Semaphore(args.concurrency)
+        login_latency: list[float] = []
+        shed = 0
+        done = asyncio.Event()
+
+        async def login():
+            nonlocal shed
+            async with sem:
+                t0 = time.perf_counter()
+                r = await client.post("/api/auth/login", data={"username": email, "password": "storm-password"})
+                if r.status_code == 503:
+                    shed += 1
+                    return
+                r.raise_for_status()
+                login_latency.append(time.perf_counter() - t0)
+
+        list_latency: list[float] = []
+
+        async def poll_jobs():
+            while not done.is_set():
+                t0 = time.perf_counter()
+                (await client.get("/api/jobs", headers=headers)).raise_for_status()
+                list_latency.append(time.perf_counter() - t0)
+                await asyncio.sleep(0.005)
+
+        poller = asyncio.create_task(poll_jobs())
+        t0 = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - t0
+        done.set()
+        await poller
+
+    emit({
+        "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+        "hash_workers": settings.HASH_WORKERS,
+        "hash_max_queue": settings.HASH_MAX_QUEUE,
+        "concurrency": args.concurrency,
+        "logins_ok": len(login_latency),
+        "logins_shed_503": shed,
+        "login_throughput_rps": round(len(login_latency) / elapsed, 1),
+        "login_latency_ms": percentiles(login_latency),
+        "list_jobs_during_storm_ms": percentiles(list_latency),
+    }, args.json)
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--logins", type=int, default=300)
+    p.add_argument("--concurrency", type=int, default=64)
+    p.add_argument("--json", help="also write the result to this file")
+    asyncio.run(main(p.parse_args()))
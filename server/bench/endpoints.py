@@ -0,0 +1,332 @@
+# server/bench/endpoints.py
+"""
+Per-endpoint load test.
+
+Seeds --users users, each with --jobs jobs (NDJSON import), --resumes
+resumes (TXT/DOCX/PDF fixtures uploaded through the API) and --applications
+applications, then drives every router's endpoints one at a time at a fixed
+--concurrency and reports throughput, p50/p95/p99 latency of the successful
+requests and a count per status code.
+
+By default requests go through an in-process ASGI transport against a
+throwaway SQLite database (set DATABASE_URL for e.g. a scratch Postgres).
+With --serve the app is started under uvicorn in a subprocess instead, so
+the HTTP stack and the server's event loop are part of the measurement.
+
+    cd server && python -m bench.endpoints --users 4 --jobs 200 --requests 200 --concurrency 16
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from bench._common import _SERVER_DIR, asgi_client, create_schema, emit, percentiles, register
+from bench.fixtures import CONTENT_TYPES, job_description, make_resumes
+
+import httpx
+from sqlalchemy import select
+
+from app.db.database import async_engine, engine
+from app.db.models import User
+from app.main import app
+
+PASSWORD = "bench-password"
+PROMPTS = ["Why do you want this role?", "Describe a hard bug you fixed.", "How do you handle disagreement?"]
+
+
+@dataclass
+class BenchUser:
+    id: int
+    email: str
+    headers: dict
+    job_ids: list[int] = field(default_factory=list)
+    resume_ids: list[int] = field(default_factory=list)
+    application_ids: list[int] = field(default_factory=list)
+    task_id: str | None = None
+    # created during the run, deleted by the matching DELETE scenario
+    new_job_ids: list[int] = field(default_factory=list)
+    new_resume_ids: list[int] = field(default_factory=list)
+
+
+@dataclass
+class Scenario:
+    name: str
+    build: Callable[[int, BenchUser], tuple]  # (i, user) -> (method, url, request kwargs)
+    after: Callable[[httpx.Response, BenchUser], None] | None = None
+    share: float = 1.0  # fraction of --requests to send (bcrypt-bound routes are slow)
+
+
+def _ndjson(items: list[dict]) -> bytes:
+    return b"".join(json.dumps(item).encode() + b"\n" for item in items)
+
+
+async def seed(client: httpx.AsyncClient, args, fixtures: list[Path]) -> list[BenchUser]:
+    users = []
+    for n in range(args.users):
+        email = f"bench-{time.time_ns()}-{n}@example.com"
+        headers = await register(client, email, PASSWORD)
+        with engine.connect() as conn:
+            user_id = conn.execute(select(User.id).where(User.email == email)).scalar_one()
+        user = BenchUser(id=user_id, email=email, headers=headers)
+
+        body = _ndjson([
+            {"title": f"Engineer {n}-{i}", "description": job_description(n * args.jobs + i)}
+            for i in range(args.jobs)
+        ])
+        r = await client.post(
+            "/api/jobs/import", content=body, headers={**headers, "Content-Type": "application/x-ndjson"}
+        )
+        r.raise_for_status()
+        user.job_ids = r.json()["job_ids"]
+
+        for path in fixtures[: args.resumes]:
+            files = {"file": (path.name, path.read_bytes(), CONTENT_TYPES[path.suffix])}
+            r = await client.post("/api/resumes", files=files, headers=headers)
+            r.raise_for_status()
+            user.resume_ids.append(r.json()["id"])
+
+        pairs = [
+            {"job_id": user.job_ids[i % len(user.job_ids)], "resume_id": user.resume_ids[i % len(user.resume_ids)]}
+            for i in range(args.applications)
+        ]
+        for lo in range(0, len(pairs), 200):
+            r = await client.post("/api/applications/batch", json={"items": pairs[lo:lo + 200]}, headers=headers)
+            r.raise_for_status()
+            user.application_ids += [item["application"]["id"] for item in r.json() if item["application"]]
+
+        r = await client.post(
+            "/api/tasks/score", json={"job_id": user.job_ids[0], "resume_id": user.resume_ids[0]}, headers=headers
+        )
+        r.raise_for_status()
+        user.task_id = r.json()["id"]
+        users.append(user)
+    return users
+
+
+def scenarios(args, fixtures: list[Path], rng: random.Random) -> list[Scenario]:
+    def pick(ids: list) -> int:
+        return ids[rng.randrange(len(ids))]
+
+    def upload(i: int, u: BenchUser):
+        path = fixtures[i % len(fixtures)]
+        return "POST", "/api/resumes", {"files": {"file": (path.name, path.read_bytes(), CONTENT_TYPES[path.suffix])}}
+
+    return [
+        Scenario("GET /health", lambda i, u: ("GET", "/health", {})),
+        Scenario(
+            "POST /api/auth/login",
+            lambda i, u: ("POST", "/api/auth/login", {"data": {"username": u.email, "password": PASSWORD}}),
+            share=0.1,
+        ),
+        Scenario("GET /api/users/{id}", lambda i, u: ("GET", f"/api/users/{u.id}", {})),
+        Scenario("GET /api/jobs?limit=50", lambda i, u: ("GET", "/api/jobs", {"params": {"limit": 50}})),
+        Scenario(
+            "GET /api/jobs?limit=50&fields=id,title,created_at",
+            lambda i, u: ("GET", "/api/jobs", {"params": {"limit": 50, "fields": "id,title,created_at"}}),
+        ),
+        Scenario(
+            "GET /api/jobs/search",
+            lambda i, u: ("GET", "/api/jobs/search", {"params": {"q": " ".join(rng.sample(["python", "kafka", "aws", "react", "spark", "redis"], 2))}}),
+        ),
+        Scenario(
+            "POST /api/jobs",
+            lambda i, u: ("POST", "/api/jobs", {"json": {"title": f"New {i}", "description": job_description(10_000 + i)}}),
+            after=lambda r, u: u.new_job_ids.append(r.json()["id"]),
+        ),
+        Scenario(
+            "DELETE /api/jobs/{id}",
+            lambda i, u: ("DELETE", f"/api/jobs/{u.new_job_ids.pop() if u.new_job_ids else 0}", {}),
+        ),
+        Scenario(
+            "POST /api/jobs/analyze",
+            lambda i, u: ("POST", "/api/jobs/analyze", {"json": {"jd_text": job_description(20_000 + i)}}),
+        ),
+        Scenario(
+            "POST /api/jobs/import (20 rows)",
+            lambda i, u: ("POST", "/api/jobs/import", {
+                "content": _ndjson([{"description": job_description(30_000 + i * 20 + k)} for k in range(20)]),
+                "headers": {"Content-Type": "application/x-ndjson"},
+            }),
+            share=0.25,
+        ),
+        Scenario("GET /api/resumes", lambda i, u: ("GET", "/api/resumes", {})),
+        Scenario("GET /api/resumes/{id}", lambda i, u: ("GET", f"/api/resumes/{pick(u.resume_ids)}", {})),
+        Scenario("GET /api/resumes/{id}/download", lambda i, u: ("GET", f"/api/resumes/{pick(u.resume_ids)}/download", {})),
+        Scenario("POST /api/resumes", upload, after=lambda r, u: u.new_resume_ids.append(r.json()["id"]), share=0.25),
+        Scenario(
+            "DELETE /api/resumes/{id}",
+            lambda i, u: ("DELETE", f"/api/resumes/{u.new_resume_ids.pop() if u.new_resume_ids else 0}", {}),
+            share=0.25,
+        ),
+        Scenario("GET /api/applications?limit=50", lambda i, u: ("GET", "/api/applications", {"params": {"limit": 50}})),
+        Scenario(
+            "POST /api/applications",
+            lambda i, u: ("POST", "/api/applications", {"json": {"job_id": pick(u.job_ids), "resume_id": pick(u.resume_ids)}}),
+        ),
+        Scenario(
+            "PATCH /api/applications/status",
+            lambda i, u: ("PATCH", "/api/applications/status", {"json": {
+                "ids": rng.sample(u.application_ids, min(10, len(u.application_ids))),
+                "status": rng.choice(["submitted", "received", "interview_requested"]),
+            }}),
+        ),
+        Scenario("GET /api/applications/analytics", lambda i, u: ("GET", "/api/applications/analytics", {})),
+        Scenario(
+            "POST /api/analysis/score",
+            lambda i, u: ("POST", "/api/analysis/score", {"json": {"job_id": pick(u.job_ids), "resume_id": pick(u.resume_ids)}}),
+        ),
+        Scenario(
+            "POST /api/analysis/score/batch",
+            lambda i, u: ("POST", "/api/analysis/score/batch", {"json": {"top_k": 10}}),
+            share=0.25,
+        ),
+        Scenario(
+            "POST /api/answers/draft",
+            lambda i, u: ("POST", "/api/answers/draft", {"json": {"job_id": pick(u.job_ids), "prompts": PROMPTS}}),
+        ),
+        Scenario(
+            "POST /api/tasks/score",
+            lambda i, u: ("POST", "/api/tasks/score", {"json": {"job_id": pick(u.job_ids), "resume_id": pick(u.resume_ids)}}),
+        ),
+        Scenario("GET /api/tasks/{id}", lambda i, u: ("GET", f"/api/tasks/{u.task_id}", {})),
+    ]
+
+
+async def drive(client: httpx.AsyncClient, scenario: Scenario, users: list[BenchUser], n: int, concurrency: int) -> dict:
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    codes: Counter = Counter()
+
+    async def one(i: int):
+        user = users[i % len(users)]
+        async with sem:
+            method, url, kwargs = scenario.build(i, user)
+            headers = {**user.headers, **kwargs.pop("headers", {})}
+            t0 = time.perf_counter()
+            r = await client.request(method, url, headers=headers, **kwargs)
+            elapsed = time.perf_counter() - t0
+        codes[r.status_code] += 1
+        if r.is_success:
+            latencies.append(elapsed)
+            if scenario.after:
+                scenario.after(r, user)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n)))
+    elapsed = time.perf_counter() - t0
+    return {
+        "requests": n,
+        "throughput_rps": round(n / elapsed, 1),
+        "latency_ms": percentiles(latencies),
+        "status": {str(code): count for code, count in sorted(codes.items())},
+    }
+
+
+async def cleanup(client: httpx.AsyncClient, users: list[BenchUser]) -> None:
+    # resumes own content-addressed blobs under uploads/; deleting the rows releases them
+    for user in users:
+        for rid in user.resume_ids + user.new_resume_ids:
+            await client.delete(f"/api/resumes/{rid}", headers=user.headers)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _serve() -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=_SERVER_DIR,
+        env=os.environ.copy(),
+    )
+    base = f"http://127.0.0.1:{port}"
+    async with httpx.AsyncClient(base_url=base) as probe:
+        for _ in range(200):
+            try:
+                if (await probe.get("/health")).status_code == 200:
+                    return proc, base
+            except httpx.TransportError:
+                pass
+            if proc.poll() is not None:
+                break
+            await asyncio.sleep(0.05)
+    proc.terminate()
+    raise RuntimeError("uvicorn did not come up")
+
+
+async def run(args) -> dict:
+    create_schema()
+    rng = random.Random(args.seed)
+    proc = None
+    if args.serve:
+        proc, base = await _serve()
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        client = httpx.AsyncClient(base_url=base, limits=limits, timeout=60)
+    else:
+        await app.router.startup()  # the ASGI transport doesn't send lifespan events
+        client = asgi_client(app)
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="jobs-fixtures-") as tmp:
+            fixtures = make_resumes(Path(tmp), max(args.resumes, 3))
+            async with client:
+                users = await seed(client, args, fixtures)
+                results = {}
+                for sc in scenarios(args, fixtures, rng):
+                    n = max(len(users), int(args.requests * sc.share))
+                    results[sc.name] = await drive(client, sc, users, n, args.concurrency)
+                await cleanup(client, users)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+        else:
+            await app.router.shutdown()
+            await async_engine.dispose()
+
+    return {
+        "config": {
+            "mode": "uvicorn" if args.serve else "asgi",
+            "database": engine.dialect.name,
+            "users": args.users,
+            "jobs_per_user": args.jobs,
+            "resumes_per_user": args.resumes,
+            "applications_per_user": args.applications,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "seed": args.seed,
+        },
+        "endpoints": results,
+    }
+
+
+def add_arguments(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--users", type=int, default=4)
+    p.add_argument("--jobs", type=int, default=200, help="jobs per user")
+    p.add_argument("--resumes", type=int, default=6, help="resumes per user (TXT/DOCX/PDF in turn)")
+    p.add_argument("--applications", type=int, default=100, help="applications per user")
+    p.add_argument("--requests", type=int, default=200, help="requests per endpoint")
+    p.add_argument("--concurrency", type=int, default=16)
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--serve", action="store_true", help="run the app under uvicorn instead of in-process")
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    add_arguments(p)
+    p.add_argument("--json", help="also write the result to this file")
+    args = p.parse_args()
+    emit(asyncio.run(run(args)), args.json)
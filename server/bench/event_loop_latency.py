@@ -0,0 +1,105 @@
+# server/bench/event_loop_latency.py
+"""
+Event-loop latency while jobs are being created concurrently.
+
+Drives POST /api/jobs (AsyncSession) and, for comparison, the previous
+pattern -- the same handler doing sync Session commits inside `async def`,
+mounted here on a side route. A probe task asks for 1 ms sleeps the whole
+time and records how late it wakes up; that lag is what every other request
+on the worker pays.
+
+    cd server && python -m bench.event_loop_latency --requests 400 --concurrency 32
+"""
+import argparse
+import asyncio
+import time
+
+from bench._common import asgi_client, create_schema, emit, percentiles, register
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.core import search
+from app.core.auth import Principal, get_current_principal
+from app.core.terms import index_job
+from app.db.database import get_db
+from app.db.models import Job
+from app.main import app
+from app.schemas.jobs import JobCreateIn
+
+
+@app.post("/bench/legacy-jobs", status_code=201, include_in_schema=False)
+async def legacy_create_job(
+    body: JobCreateIn,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    # blocking commit/refresh on the event loop, as create_job used to do
+    row = Job(user_id=current_user.id, title=body.title, description=body.description)
+    db.add(row)
+    index_job(db, row)
+    search.index_job(db, row)
+    db.commit()
+    db.refresh(row)
+    return {"id": row.id}
+
+
+_DESCRIPTION = (
+    "We are hiring a backend engineer to build Python services with FastAPI, "
+    "PostgreSQL, Redis and Kubernetes. You will own APIs end to end, write tests, "
+    "review code and improve observability across the platform. "
+) * 8
+
+
+async def _probe(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(max(0.0, time.perf_counter() - t0 - 0.001))
+
+
+async def _run(client, headers, path: str, n: int, concurrency: int) -> dict:
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def one(i: int):
+        async with sem:
+            t0 = time.perf_counter()
+            r = await client.post(path, json={"title": f"Job {i}", "description": _DESCRIPTION}, headers=headers)
+            r.raise_for_status()
+            latencies.append(time.perf_counter() - t0)
+
+    probe = asyncio.create_task(_probe(stop, lags))
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n)))
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    await probe
+    return {
+        "requests": n,
+        "throughput_rps": round(n / elapsed, 1),
+        "request_latency_ms": percentiles(latencies),
+        "loop_lag_ms": percentiles(lags),
+    }
+
+
+async def main(args) -> None:
+    create_schema()
+    async with asgi_client(app) as client:
+        headers = await register(client, f"loop-{time.time_ns()}@example.com")
+        result = {
+            "concurrency": args.concurrency,
+            "sync_session_on_loop": await _run(client, headers, "/bench/legacy-jobs", args.requests, args.concurrency),
+            "async_session": await _run(client, headers, "/api/jobs", args.requests, args.concurrency),
+        }
+    emit(result, args.json)
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--requests", type=int, default=400)
+    p.add_argument("--concurrency", type=int, default=32)
+    p.add_argument("--json", help="also write the result to this file")
+    asyncio.run(main(p.parse_args()))
@@ -0,0 +1,121 @@
+# server/bench/fixtures.py
+"""
+Synthetic resumes and job descriptions for the benchmarks.
+
+Files are generated on the fly (nothing binary is checked in): plain text,
+DOCX written with python-docx, and a small hand-assembled PDF with one text
+page per ~45 lines that pdfminer can parse. Content is deterministic for a
+given seed, and different seeds give different bytes so uploads don't all
+collapse into one content-addressed blob.
+"""
+import random
+from pathlib import Path
+
+from docx import Document
+
+SKILLS = (
+    "python fastapi django flask sqlalchemy postgresql mysql redis kafka rabbitmq "
+    "docker kubernetes terraform aws gcp azure linux bash git ci/cd jenkins "
+    "react typescript javascript graphql rest grpc pandas numpy pytorch tensorflow "
+    "spark airflow dbt snowflake observability prometheus grafana elasticsearch"
+).split()
+
+_VERBS = ("Built", "Designed", "Led", "Migrated", "Optimized", "Automated", "Shipped", "Maintained")
+_NOUNS = ("service", "pipeline", "platform", "API", "dashboard", "data model", "deployment", "test suite")
+
+
+def resume_lines(seed: int, lines: int = 60) -> list[str]:
+    rng = random.Random(seed)
+    out = [f"Candidate {seed}", "Senior Software Engineer", "", "Experience"]
+    while len(out) < lines:
+        skills = ", ".join(rng.sample(SKILLS, 3))
+        out.append(
+            f"{rng.choice(_VERBS)} a {rng.choice(_NOUNS)} using {skills}; "
+            f"cut latency by {rng.randint(10, 80)}% for {rng.randint(2, 40)}k users."
+        )
+    out += ["", "Skills", ", ".join(rng.sample(SKILLS, 12))]
+    return out
+
+
+def job_description(seed: int, sentences: int = 12) -> str:
+    rng = random.Random(seed * 7919 + 1)
+    parts = [f"We are hiring engineer #{seed} to join a product team."]
+    for _ in range(sentences):
+        parts.append(
+            f"You will work with {', '.join(rng.sample(SKILLS, 4))} to "
+            f"{rng.choice(_VERBS).lower()} our {rng.choice(_NOUNS)}."
+        )
+    return " ".join(parts)
+
+
+def write_txt(path: Path, seed: int) -> Path:
+    path.write_text("\n".join(resume_lines(seed)) + "\n", encoding="utf-8")
+    return path
+
+
+def write_docx(path: Path, seed: int) -> Path:
+    doc = Document()
+    for line in resume_lines(seed):
+        doc.add_paragraph(line)
+    doc.save(str(path))
+    return path
+
+
+def _pdf_escape(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: Path, seed: int, lines_per_page: int = 45) -> Path:
+    lines = resume_lines(seed)
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+    # object numbers: 1 catalog, 2 pages, 3 font, then (page, contents) pairs
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # pages tree, filled in once the kids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page in pages:
+        text = "BT /F1 10 Tf 12 TL 50 800 Td " + " ".join(f"({_pdf_escape(l)}) '" for l in page) + " ET"
+        stream = text.encode("latin-1", "replace")
+        page_no, contents_no = len(objects) + 1, len(objects) + 2
+        kids.append(f"{page_no} 0 R")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {contents_no} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+    return path
+
+
+WRITERS = {".txt": write_txt, ".docx": write_docx, ".pdf": write_pdf}
+
+CONTENT_TYPES = {
+    ".txt": "text/plain",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".pdf": "application/pdf",
+}
+
+
+def make_resumes(directory: Path, count: int, start_seed: int = 0) -> list[Path]:
+    """`count` resumes cycling through TXT, DOCX and PDF."""
+    directory.mkdir(parents=True, exist_ok=True)
+    exts = list(WRITERS)
+    paths = []
+    for i in range(count):
+        seed = start_seed + i
+        ext = exts[i % len(exts)]
+        paths.append(WRITERS[ext](directory / f"resume-{seed}{ext}", seed))
+    return paths
@@ -0,0 +1,138 @@
+# server/bench/html_extract.py
+"""
+HTML → text benchmark for job URL ingestion.
+
+Runs the streaming extractor (app.core.html_text) and the regex stripper it
+replaced over a corpus of job pages, reporting throughput and peak Python
+memory for each. The corpus is generated to mirror the shape of the pages
+users paste: a server-rendered Greenhouse-style board, a Lever-style page,
+and a LinkedIn/Workday-style SPA shell that carries the posting inside
+megabytes of inline script and JSON state.
+
+    cd server && python -m bench.html_extract --repeat 5
+"""
+import argparse
+import json
+import random
+import re
+import time
+import tracemalloc
+from html import unescape
+
+from bench._common import emit
+
+from app.core.html_text import HTMLTextExtractor
+
+_WORDS = (
+    "python backend engineer distributed systems postgres kubernetes team "
+    "customers product design ownership remote hybrid benefits equity salary "
+    "experience years api services cloud aws latency reliability mentoring"
+).split()
+
+
+def _para(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n)).capitalize() + "."
+
+
+def greenhouse(rng: random.Random) -> str:
+    body = "".join(
+        f"<h3>{_para(rng, 3)}</h3><ul>" + "".join(f"<li>{_para(rng, 14)}</li>" for _ in range(8)) + "</ul>"
+        for _ in range(12)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Senior Backend Engineer at Acme &amp; Co</title>"
+        "<style>" + ".c{color:#333}" * 400 + "</style></head><body>"
+        '<div id="app_body"><h1 class="app-title">Senior Backend Engineer</h1>'
+        f'<div class="location">Remote &ndash; EU</div><div id="content">{body}</div></div>'
+        "<script>window.dataLayer=[];</script></body></html>"
+    )
+
+
+def lever(rng: random.Random) -> str:
+    sections = "".join(
+        f'<div class="section page-centered"><h3>{_para(rng, 4)}</h3>'
+        f'<div class="content">' + "<br>".join(_para(rng, 20) for _ in range(10)) + "</div></div>"
+        for _ in range(15)
+    )
+    scripts = "".join(f'<script src="/static/chunk-{i}.js"></script>' for i in range(40))
+    return (
+        "<html><head><title>Platform Engineer - Example</title>" + scripts + "</head>"
+        f'<body><div class="posting-headline"><h2>Platform Engineer</h2></div>{sections}'
+        "<noscript><img src=x></noscript></body></html>"
+    )
+
+
+def spa(rng: random.Random) -> str:
+    state = {
+        "jobPosting": {"title": "Staff Software Engineer", "description": " ".join(_para(rng, 30) for _ in range(60))},
+        "recommendations": [{"id": i, "title": _para(rng, 4), "blurb": _para(rng, 25)} for i in range(3000)],
+    }
+    # many small inline scripts: each `<script.*?>.*?</script>` attempt scans ahead
+    inline = "".join(f"<script>var a{i}='<div>'+{i};</script>" for i in range(2000))
+    return (
+        "<html><head><title>Staff Software Engineer | LinkedIn</title>"
+        "<style>" + "@media(min-width:1px){.x{margin:0}}" * 3000 + "</style></head><body>"
+        f'<main><h1>Staff Software Engineer</h1><section class="description">{_para(rng, 200)}</section></main>'
+        f"{inline}"
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(state)}</script>'
+        "</body></html>"
+    )
+
+
+def regex_strip(html: str) -> str:
+    """The implementation the streaming extractor replaced, kept for comparison."""
+    text = unescape(html)
+    text = re.sub(r"<script.*?>.*?</script>", " ", text, flags=re.S | re.I)
+    text = re.sub(r"<style.*?>.*?</style>", " ", text, flags=re.S | re.I)
+    text = re.sub(r"<[^>]+>", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text[:20000]
+
+
+def streaming(html: str, chunk: int = 16 * 1024) -> str:
+    parser = HTMLTextExtractor(20000)
+    for i in range(0, len(html), chunk):
+        parser.feed(html[i : i + chunk])
+        if parser.done:
+            break
+    parser.close()
+    return parser.text
+
+
+def measure(fn, html: str, repeat: int) -> dict:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(html)
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    fn(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best = min(times)
+    return {
+        "best_ms": round(best * 1000, 2),
+        "mb_per_s": round(len(html.encode()) / best / 1e6, 1),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def main(args) -> None:
+    rng = random.Random(args.seed)
+    corpus = {"greenhouse": greenhouse(rng), "lever": lever(rng), "spa": spa(rng)}
+    result = {}
+    for name, html in corpus.items():
+        result[name] = {
+            "bytes": len(html.encode()),
+            "regex": measure(regex_strip, html, args.repeat),
+            "streaming": measure(streaming, html, args.repeat),
+        }
+    emit(result, args.out)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", help="write the JSON result here as well")
+    main(parser.parse_args())
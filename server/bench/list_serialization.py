@@ -0,0 +1,117 @@
+# server/bench/list_serialization.py
+"""
+List-endpoint serialization benchmark.
+
+Seeds one user with --rows jobs carrying realistic descriptions, then times
+full-page GET /api/jobs?limit=N three ways: the previous path (ORM entities
+validated through `response_model` and encoded with the stdlib json module,
+mounted here on a side route), the projected orjson path with every field,
+and the same with `?fields=id,title,created_at`.
+
+    cd server && python -m bench.list_serialization --rows 2000 --limit 200 --requests 200
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from bench._common import asgi_client, create_schema, emit, percentiles, register
+
+from fastapi import Depends, Query, Response
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core.auth import Principal, get_current_principal
+from app.core.pagination import MAX_LIMIT, paginate
+from app.db.database import engine, get_db
+from app.db.models import Job, User
+from app.main import app
+from app.schemas.jobs import JobOut
+
+
+@app.get("/bench/legacy-jobs", response_model=List[JobOut], include_in_schema=False)
+def legacy_list_jobs(
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_LIMIT),
+    cursor: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    # whole ORM rows, validated and encoded by FastAPI, as list_jobs used to do
+    query = db.query(Job).filter(Job.user_id == current_user.id)
+    return paginate(query, (Job.created_at, Job.id), response, limit, cursor)
+
+
+_DESCRIPTION = (
+    "We are hiring a backend engineer to build Python services with FastAPI, "
+    "PostgreSQL, Redis and Kubernetes. You will own APIs end to end, write tests, "
+    "review code and improve observability across the platform. "
+) * 20
+
+
+def seed(user_id: int, rows: int) -> None:
+    start = datetime(2024, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Job), [
+            {
+                "user_id": user_id,
+                "title": f"Job {i}",
+                "description": _DESCRIPTION,
+                "created_at": start + timedelta(seconds=i, microseconds=1),
+            }
+            for i in range(rows)
+        ])
+
+
+async def _run(client, headers, path: str, n: int) -> dict:
+    latencies: list[float] = []
+    size = 0
+    t0 = time.perf_counter()
+    for _ in range(n):
+        s = time.perf_counter()
+        r = await client.get(path, headers=headers)
+        r.raise_for_status()
+        latencies.append(time.perf_counter() - s)
+        size = len(r.content)
+    elapsed = time.perf_counter() - t0
+    return {
+        "requests": n,
+        "throughput_rps": round(n / elapsed, 1),
+        "latency_ms": percentiles(latencies),
+        "response_bytes": size,
+    }
+
+
+async def main(args) -> None:
+    create_schema()
+    async with asgi_client(app) as client:
+        email = f"serialize-{time.time_ns()}@example.com"
+        headers = await register(client, email)
+        with engine.connect() as conn:
+            user_id = conn.execute(select(User.id).where(User.email == email)).scalar_one()
+        seed(user_id, args.rows)
+
+        q = f"limit={args.limit}"
+        paths = {
+            "orm_pydantic_json": f"/bench/legacy-jobs?{q}",
+            "projected_orjson": f"/api/jobs?{q}",
+            "projected_orjson_sparse": f"/api/jobs?{q}&fields=id,title,created_at",
+        }
+        for path in paths.values():  # warm up imports and statement caches
+            (await client.get(path, headers=headers)).raise_for_status()
+        result = {
+            "rows": args.rows,
+            "limit": args.limit,
+            **{name: await _run(client, headers, path, args.requests) for name, path in paths.items()},
+        }
+    emit(result, args.json)
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--rows", type=int, default=2000)
+    p.add_argument("--limit", type=int, default=200)
+    p.add_argument("--requests", type=int, default=200)
+    p.add_argument("--json", help="also write the result to this file")
+    asyncio.run(main(p.parse_args()))
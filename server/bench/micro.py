@@ -0,0 +1,77 @@
+# server/bench/micro.py
+"""
+Micro-benchmarks for the hot helpers behind the endpoints: tokenization,
+resume text extraction per format, HTML-to-text for job pages, and bcrypt
+hash/verify at the configured cost.
+
+Each case runs for --repeat rounds of a fixed number of calls and reports
+per-call latency percentiles, so runs from two versions can be diffed.
+
+    cd server && python -m bench.micro --repeat 30 --json micro.json
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from bench._common import emit, percentiles
+from bench.fixtures import WRITERS, job_description, resume_lines
+
+from app.core.config import settings
+from app.core.html_text import html_to_text
+from app.core.security import hash_password, verify_password
+from app.core.text import read_text_from_path, tokenize
+
+
+def _page_html(seed: int, sections: int = 40) -> str:
+    body = "".join(
+        f"<section><h2>Section {i}</h2><p>{job_description(seed + i)}</p>"
+        f"<ul>{''.join(f'<li>item {j}</li>' for j in range(5))}</ul></section>"
+        for i in range(sections)
+    )
+    scripts = "<script>var state = {" + ",".join(f'"k{i}": {i}' for i in range(2000)) + "};</script>"
+    return f"<html><head><style>body{{margin:0}}</style>{scripts}</head><body>{body}</body></html>"
+
+
+def bench(fn: Callable[[], object], repeat: int, number: int) -> dict:
+    """Per-call latency over `repeat` rounds of `number` calls each."""
+    fn()  # warm up
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+    return {"calls_per_round": number, "per_call_ms": percentiles(samples)}
+
+
+def run(repeat: int) -> dict:
+    resume_text = "\n".join(resume_lines(1, lines=400))
+    html = _page_html(1)
+    pw_hash = hash_password("bench-password")
+
+    with tempfile.TemporaryDirectory(prefix="jobs-micro-") as tmp:
+        files = {ext: write(Path(tmp) / f"resume{ext}", 1) for ext, write in WRITERS.items()}
+        return {
+            "tokenize": bench(lambda: tokenize(resume_text), repeat, 50),
+            **{
+                f"read_text_from_path[{ext}]": bench(lambda p=path: read_text_from_path(p), repeat, 5)
+                for ext, path in files.items()
+            },
+            "html_to_text": bench(lambda: html_to_text(html), repeat, 10),
+            f"bcrypt_hash[rounds={settings.BCRYPT_ROUNDS}]": bench(
+                lambda: hash_password("bench-password"), max(3, repeat // 5), 1
+            ),
+            f"bcrypt_verify[rounds={settings.BCRYPT_ROUNDS}]": bench(
+                lambda: verify_password("bench-password", pw_hash), max(3, repeat // 5), 1
+            ),
+        }
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--repeat", type=int, default=30)
+    p.add_argument("--json", help="also write the result to this file")
+    args = p.parse_args()
+    emit(run(args.repeat), args.json)
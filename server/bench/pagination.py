@@ -0,0 +1,127 @@
+# server/bench/pagination.py
+"""
+Deep-page benchmark for the keyset-paginated list endpoints.
+
+Seeds one user with --rows jobs, then times GET /api/jobs?limit=N&cursor=...
+for pages starting at several depths, and the same pages fetched with
+LIMIT/OFFSET directly against the database for comparison. Keyset latency
+should stay flat with depth; OFFSET grows linearly.
+
+    cd server && python -m bench.pagination --rows 100000 --limit 50
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from bench._common import asgi_client, create_schema, emit, percentiles, register
+
+from sqlalchemy import insert, select
+
+from app.core.pagination import cursor_for
+from app.db.database import SessionLocal, engine
+from app.db.models import Job, User
+from app.main import app
+
+
+def seed(user_id: int, rows: int) -> None:
+    """
+    Jobs created through the API take created_at from the server default, so
+    most seeded rows do too (and share whole seconds, exercising the id
+    tie-break); every tenth row gets an ORM-written timestamp, which SQLite
+    stores with a fraction, so both stored shapes are interleaved.
+    """
+    start = datetime.utcnow()
+    batch = 5000
+    with engine.begin() as conn:
+        for lo in range(0, rows, batch):
+            conn.execute(insert(Job), [
+                {"user_id": user_id, "title": f"Job {i}", "description": "seeded for the pagination benchmark"}
+                for i in range(lo, min(lo + batch, rows)) if i % 10
+            ])
+            conn.execute(insert(Job), [
+                {
+                    "user_id": user_id,
+                    "title": f"Job {i}",
+                    "description": "seeded for the pagination benchmark",
+                    "created_at": start + timedelta(milliseconds=i),
+                }
+                for i in range(lo, min(lo + batch, rows)) if not i % 10
+            ])
+
+
+def cursor_at(user_id: int, depth: int) -> str | None:
+    """Cursor whose next page starts at row `depth` of the newest-first listing."""
+    if depth == 0:
+        return None
+    columns = (Job.created_at, Job.id)
+    with SessionLocal() as db:
+        row = db.execute(
+            select(*columns)
+            .where(Job.user_id == user_id)
+            .order_by(Job.created_at.desc(), Job.id.desc())
+            .offset(depth - 1)
+            .limit(1)
+        ).one()
+        return cursor_for(db, columns, row)
+
+
+def offset_page(user_id: int, depth: int, limit: int) -> list:
+    with SessionLocal() as db:
+        return db.execute(
+            select(Job)
+            .where(Job.user_id == user_id)
+            .order_by(Job.created_at.desc(), Job.id.desc())
+            .offset(depth)
+            .limit(limit)
+        ).scalars().all()
+
+
+async def main(args) -> None:
+    create_schema()
+    async with asgi_client(app) as client:
+        email = f"pages-{time.time_ns()}@example.com"
+        headers = await register(client, email)
+        with SessionLocal() as db:
+            user_id = db.execute(select(User.id).where(User.email == email)).scalar_one()
+
+        t0 = time.perf_counter()
+        seed(user_id, args.rows)
+        seeded_s = time.perf_counter() - t0
+
+        depths = sorted({d for d in (0, 10_000, 50_000, args.rows - args.limit) if 0 <= d < args.rows})
+        result = {"rows": args.rows, "limit": args.limit, "seed_s": round(seeded_s, 2), "keyset": {}, "offset": {}}
+        for depth in depths:
+            cursor = cursor_at(user_id, depth)
+            params = {"limit": args.limit}
+            if cursor:
+                params["cursor"] = cursor
+
+            samples = []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                r = await client.get("/api/jobs", params=params, headers=headers)
+                samples.append(time.perf_counter() - t)
+                r.raise_for_status()
+            result["keyset"][str(depth)] = percentiles(samples)
+
+            samples = []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                page = offset_page(user_id, depth, args.limit)
+                samples.append(time.perf_counter() - t)
+            result["offset"][str(depth)] = percentiles(samples)
+            # the keyset page must be the same rows OFFSET finds
+            if [j["id"] for j in r.json()] != [j.id for j in page]:
+                raise SystemExit(f"keyset page at depth {depth} differs from the OFFSET page")
+
+    emit(result, args.out)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--out", help="write the JSON result here as well")
+    asyncio.run(main(parser.parse_args()))
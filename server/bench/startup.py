@@ -0,0 +1,151 @@
+# server/bench/startup.py
+"""
+Worker cold-start report with a budget check.
+
+Measures, each in a fresh interpreter:
+- how long `import app.main` takes (wall clock, median of --runs),
+- where that time goes (`python -X importtime`, heaviest modules by
+  cumulative and by self time),
+- which of the lazily loaded libraries (document parsers, numpy, httpx) got
+  imported anyway,
+- time from spawning `uvicorn app.main:app` to the first answered request.
+
+Exits non-zero when a budget is exceeded or a lazy library loads at boot.
+
+    cd server && python -m bench.startup --budget-import-ms 2000 --budget-first-request-ms 4000
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from bench._common import _SERVER_DIR, create_schema, emit
+
+import httpx
+
+# must not be imported by `import app.main`; they load on first use
+LAZY_MODULES = ("docx", "pdfminer", "numpy", "httpx")
+
+_IMPORT_PROBE = (
+    "import sys, time; t = time.perf_counter(); import app.main; "
+    "print(round((time.perf_counter() - t) * 1000, 1)); "
+    f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+)
+
+
+def _python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=_SERVER_DIR, env=os.environ.copy(), capture_output=True, text=True, check=True
+    )
+
+
+def import_times(runs: int) -> tuple[list[float], list[str]]:
+    samples, eager = [], set()
+    for _ in range(runs):
+        lines = _python("-c", _IMPORT_PROBE).stdout.splitlines()
+        samples.append(float(lines[0]))
+        eager.update(m for m in (lines[1] if len(lines) > 1 else "").split(",") if m)
+    return samples, sorted(eager)
+
+
+def import_profile(top: int) -> dict:
+    """Heaviest modules under `import app.main` according to -X importtime (microseconds)."""
+    err = _python("-X", "importtime", "-c", "import app.main").stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header row
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+
+    def ms(us: int) -> float:
+        return round(us / 1000, 1)
+
+    app_main = next((r for r in rows if r[0] == "app.main"), None)
+    children = [r for r in rows if r[1] == 1]
+    app_rows = sorted((r for r in rows if r[0].startswith("app.") and r[0] != "app.main"), key=lambda r: -r[3])
+    return {
+        "total_ms": ms(app_main[3]) if app_main else None,
+        "by_cumulative": {r[0]: ms(r[3]) for r in sorted(children, key=lambda r: -r[3])[:top]},
+        "by_self": {r[0]: ms(r[2]) for r in sorted(rows, key=lambda r: -r[2])[:top]},
+        "app_modules": {r[0]: ms(r[3]) for r in app_rows[:top]},
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def first_request_ms() -> float:
+    """Spawn uvicorn and poll /health until it answers; milliseconds from spawn."""
+    port = _free_port()
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=_SERVER_DIR,
+        env=os.environ.copy(),
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1.0) as client:
+            while time.perf_counter() - t0 < 60:
+                try:
+                    if client.get("/health").status_code == 200:
+                        return round((time.perf_counter() - t0) * 1000, 1)
+                except httpx.TransportError:
+                    pass
+                if proc.poll() is not None:
+                    break
+                time.sleep(0.01)
+        raise RuntimeError("uvicorn did not come up")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def run(args) -> dict:
+    create_schema()
+    imports, eager = import_times(args.runs)
+    first = [first_request_ms() for _ in range(args.runs)]
+    result = {
+        "import_ms": {"median": round(statistics.median(imports), 1), "runs": imports},
+        "first_request_ms": {"median": round(statistics.median(first), 1), "runs": first},
+        "lazy_modules_loaded_at_boot": eager,
+        "import_profile": import_profile(args.top),
+        "budget": {"import_ms": args.budget_import_ms, "first_request_ms": args.budget_first_request_ms},
+    }
+    failures = []
+    if result["import_ms"]["median"] > args.budget_import_ms:
+        failures.append(f"import {result['import_ms']['median']} ms > {args.budget_import_ms} ms")
+    if result["first_request_ms"]["median"] > args.budget_first_request_ms:
+        failures.append(f"first request {result['first_request_ms']['median']} ms > {args.budget_first_request_ms} ms")
+    if eager:
+        failures.append(f"imported at boot: {', '.join(eager)}")
+    result["failures"] = failures
+    result["ok"] = not failures
+    return result
+
+
+def add_arguments(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--runs", type=int, default=3, help="fresh interpreters per measurement")
+    p.add_argument("--top", type=int, default=15, help="modules listed in the import profile")
+    p.add_argument("--budget-import-ms", type=float, default=2000.0)
+    p.add_argument("--budget-first-request-ms", type=float, default=4000.0)
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    add_arguments(p)
+    p.add_argument("--json", help="also write the result to this file")
+    args = p.parse_args()
+    result = run(args)
+    emit(result, args.json)
+    if not result["ok"]:
+        sys.exit("startup budget exceeded: " + "; ".join(result["failures"]))
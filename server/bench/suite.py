@@ -0,0 +1,83 @@
+# server/bench/suite.py
+"""
+Run the startup report, the micro-benchmarks and the per-endpoint load test
+and write one JSON document, tagged with the git revision, for diffing two
+versions:
+
+    cd server && python -m bench.suite --json before.json
+    git checkout <other> && python -m bench.suite --json after.json
+    python -m bench.suite --compare before.json after.json
+
+Takes the same options as bench.endpoints and bench.startup, and exits
+non-zero when the startup budget check fails.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+
+from bench._common import _SERVER_DIR, emit
+
+from bench import endpoints, micro, startup
+
+
+def _revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=_SERVER_DIR, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(before: dict, after: dict) -> dict:
+    """p50/p99 (ms) and throughput per case, old -> new, with the relative change."""
+    def delta(a, b):
+        return {"before": a, "after": b, "change": f"{(b - a) / a:+.1%}" if a and b is not None else None}
+
+    out = {}
+    for key in ("import_ms", "first_request_ms"):
+        old, new = before.get("startup", {}).get(key), after.get("startup", {}).get(key)
+        if old and new:
+            out[f"startup: {key}"] = {"median": delta(old["median"], new["median"])}
+    for name, new in after.get("micro", {}).items():
+        old = before.get("micro", {}).get(name)
+        if old:
+            out[f"micro: {name}"] = {"p50_ms": delta(old["per_call_ms"]["p50"], new["per_call_ms"]["p50"])}
+    for name, new in after.get("endpoints", {}).get("endpoints", {}).items():
+        old = before.get("endpoints", {}).get("endpoints", {}).get(name)
+        if old:
+            out[name] = {
+                "throughput_rps": delta(old["throughput_rps"], new["throughput_rps"]),
+                "p50_ms": delta(old["latency_ms"].get("p50"), new["latency_ms"].get("p50")),
+                "p99_ms": delta(old["latency_ms"].get("p99"), new["latency_ms"].get("p99")),
+            }
+    return out
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    endpoints.add_arguments(p)
+    startup.add_arguments(p)
+    p.add_argument("--repeat", type=int, default=30, help="micro-benchmark rounds")
+    p.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="diff two result files and exit")
+    p.add_argument("--json", help="also write the result to this file")
+    args = p.parse_args()
+
+    if args.compare:
+        before, after = (json.loads(open(path).read()) for path in args.compare)
+        emit(compare(before, after), args.json)
+    else:
+        result = {
+            "revision": _revision(),
+            "python": platform.python_version(),
+            "startup": startup.run(args),
+            "micro": micro.run(args.repeat),
+            "endpoints": asyncio.run(endpoints.run(args)),
+        }
+        emit(result, args.json)
+        if not result["startup"]["ok"]:
+            sys.exit("startup budget exceeded: " + "; ".join(result["startup"]["failures"]))
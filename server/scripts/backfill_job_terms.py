@@ -0,0 +1,21 @@
+# server/scripts/backfill_job_terms.py
+"""
+Fill job_terms for jobs created before keywords were precomputed.
+
+    cd server && python -m scripts.backfill_job_terms
+"""
+from app.core.terms import backfill
+from app.db.database import SessionLocal
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        n = backfill(db)
+    finally:
+        db.close()
+    print(f"indexed {n} jobs")
+
+
+if __name__ == "__main__":
+    main()
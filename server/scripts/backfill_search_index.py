@@ -0,0 +1,22 @@
+# server/scripts/backfill_search_index.py
+"""
+Add jobs created before job search existed to the BM25 inverted index.
+No-op when the Postgres full-text backend is in use.
+
+    cd server && python -m scripts.backfill_search_index
+"""
+from app.core.search import backfill
+from app.db.database import SessionLocal
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        n = backfill(db)
+    finally:
+        db.close()
+    print(f"indexed {n} jobs")
+
+
+if __name__ == "__main__":
+    main()
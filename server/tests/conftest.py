@@ -0,0 +1,48 @@
+# server/tests/conftest.py
+"""
+Tests run the app in-process against a throwaway SQLite database and upload
+directory, set up here before anything from `app` is imported.
+
+    cd server && python -m pytest -q
+"""
+import itertools
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_SERVER_DIR = Path(__file__).resolve().parents[1]
+if str(_SERVER_DIR) not in sys.path:
+    sys.path.insert(0, str(_SERVER_DIR))
+
+_TMP_DIR = Path(tempfile.mkdtemp(prefix="jobs-tests-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR / 'test.db'}"
+os.environ["UPLOAD_DIR"] = str(_TMP_DIR / "uploads")
+os.environ["TASK_WORKER"] = "manual"
+os.environ["BCRYPT_ROUNDS"] = "4"  # the minimum; hashing cost isn't what these tests are about
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.db import models  # noqa: E402,F401  (registers tables)
+from app.db.database import Base, engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+Base.metadata.create_all(engine)
+
+_emails = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def auth(client):
+    """Authorization headers for a freshly registered user."""
+    r = client.post("/api/auth/register", json={"email": f"user{next(_emails)}@example.com", "password": "pw123456"})
+    assert r.status_code == 200, r.text
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
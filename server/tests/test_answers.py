@@ -0,0 +1,56 @@
+# server/tests/test_answers.py
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import answers
+from app.core.answers import JobContext
+from app.core.config import settings
+from app.main import app
+
+
+class SlowGenerator:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, question: str, job: JobContext) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.3)
+        return f"draft for {question}"
+
+
+@pytest.fixture
+def slow_generator(monkeypatch):
+    monkeypatch.setattr(settings, "ANSWER_CONCURRENCY", 1)
+    generator = SlowGenerator()
+    answers.set_generator(generator)
+    yield generator
+    answers.set_generator(None)
+
+
+def test_drafting_works_across_event_loops(client, auth, slow_generator):
+    """Each TestClient runs its own event loop, like a restarted lifespan or a second worker thread."""
+    job = client.post("/api/jobs", json={"title": "Engineer", "description": "python"}, headers=auth).json()
+    results = {}
+
+    def run(name, prompts):
+        with TestClient(app) as c:
+            r = c.post("/api/answers/draft", json={"job_id": job["id"], "prompts": prompts}, headers=auth)
+            results[name] = (r.status_code, [a["draft"] for a in r.json().get("answers", [])])
+
+    # same question on both loops while the first call is still in flight, and
+    # enough prompts that each loop has to wait for a concurrency slot
+    threads = [
+        threading.Thread(target=run, args=("a", ["shared", "a1", "a2"])),
+        threading.Thread(target=run, args=("b", ["shared", "b1"])),
+    ]
+    threads[0].start()
+    threading.Event().wait(0.1)
+    threads[1].start()
+    for t in threads:
+        t.join(timeout=30)
+
+    assert results["a"] == (200, ["draft for shared", "draft for a1", "draft for a2"])
+    assert results["b"] == (200, ["draft for shared", "draft for b1"])
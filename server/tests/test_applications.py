@@ -0,0 +1,31 @@
+# server/tests/test_applications.py
+
+
+def _job(client, auth, title):
+    return client.post("/api/jobs", json={"title": title, "description": "python"}, headers=auth).json()["id"]
+
+
+def _resume(client, auth, body: bytes):
+    r = client.post("/api/resumes", files={"file": ("r.txt", body, "text/plain")}, headers=auth)
+    return r.json()["id"]
+
+
+def test_batch_results_match_their_items(client, auth):
+    jobs = [_job(client, auth, f"Job {i}") for i in range(3)]
+    resume = _resume(client, auth, b"python developer")
+    items = [
+        {"job_id": jobs[2], "resume_id": resume, "status": "draft"},
+        {"job_id": 10**9, "resume_id": resume},
+        {"job_id": jobs[0], "resume_id": resume, "status": "submitted"},
+        {"job_id": jobs[1], "resume_id": resume, "status": "offer"},
+    ]
+    r = client.post("/api/applications/batch", json={"items": items}, headers=auth)
+    assert r.status_code == 200, r.text
+    results = r.json()
+    assert [res["index"] for res in results] == [0, 1, 2, 3]
+    assert results[1]["error"] == "Job not found"
+    for item, res in zip(items, results):
+        if res.get("error"):
+            continue
+        app = res["application"]
+        assert (app["job_id"], app["status"]) == (item["job_id"], item["status"])
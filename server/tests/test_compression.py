@@ -0,0 +1,86 @@
+# server/tests/test_compression.py
+import asyncio
+import time
+
+import pytest
+
+from app.core import answers
+from app.core.answers import JobContext
+from app.main import app
+
+
+class SlowGenerator:
+    """Answers "q<n>" after n * 0.2 s, so drafts finish one at a time."""
+
+    async def generate(self, question: str, job: JobContext) -> str:
+        await asyncio.sleep(int(question[1:]) * 0.2)
+        return f"draft for {question}"
+
+
+@pytest.fixture
+def slow_generator():
+    answers.set_generator(SlowGenerator())
+    yield
+    answers.set_generator(None)
+
+
+async def _call(path: str, headers: dict, body: bytes) -> list[tuple[float, dict]]:
+    """Run one request straight through the ASGI app, timestamping every message it sends."""
+    messages = []
+    t0 = time.perf_counter()
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            await asyncio.Event().wait()  # no disconnect until the response is done
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append((time.perf_counter() - t0, message))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+    return messages
+
+
+def test_streamed_drafts_are_not_gzipped(client, auth, slow_generator):
+    job = client.post("/api/jobs", json={"title": "Engineer", "description": "python " * 500}, headers=auth).json()
+    body = f'{{"job_id": {job["id"]}, "prompts": ["q1", "q2", "q3"]}}'.encode()
+    headers = {**auth, "Accept-Encoding": "gzip", "Content-Type": "application/json"}
+
+    messages = client.portal.call(_call, "/api/answers/draft/stream", headers, body)
+
+    start = next(m for _, m in messages if m["type"] == "http.response.start")
+    assert start["status"] == 200
+    assert b"content-encoding" not in dict(start["headers"])
+
+    drafts = [(t, m["body"]) for t, m in messages if m["type"] == "http.response.body" and b"event: draft" in m["body"]]
+    assert [b"q1" in b for _, b in drafts] == [True, False, False]
+    assert [b"q3" in b for _, b in drafts] == [False, False, True]
+    # each draft leaves as soon as it is ready, not all together at the end
+    times = [t for t, _ in drafts]
+    assert times[1] - times[0] > 0.1 and times[2] - times[1] > 0.1
+
+
+def test_list_responses_are_gzipped(client, auth):
+    for i in range(5):
+        client.post("/api/jobs", json={"title": f"Job {i}", "description": "python developer " * 100}, headers=auth)
+    r = client.get("/api/jobs", headers={**auth, "Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers["content-encoding"] == "gzip"
+    assert len(r.json()) == 5
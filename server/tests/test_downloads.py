@@ -0,0 +1,91 @@
+# server/tests/test_downloads.py
+import pytest
+
+# byte i is i % 251, so a slice taken from the wrong offset never matches
+FIXTURE = bytes(i % 251 for i in range(10 * 1024))
+
+
+@pytest.fixture
+def download(client, auth):
+    r = client.post("/api/resumes", files={"file": ("resume.txt", FIXTURE, "text/plain")}, headers=auth)
+    assert r.status_code == 201, r.text
+    url = f"/api/resumes/{r.json()['id']}/download"
+
+    def get(**headers):
+        return client.get(url, headers={**auth, **headers})
+    return get
+
+
+def test_full_download_has_validators(download):
+    r = download()
+    assert r.status_code == 200
+    assert r.content == FIXTURE
+    assert r.headers["etag"].startswith('"') and not r.headers["etag"].startswith("W/")
+    assert r.headers["accept-ranges"] == "bytes"
+    assert "last-modified" in r.headers
+    assert "content-encoding" not in r.headers
+
+
+def test_repeated_download_is_304(download):
+    first = download()
+    r = download(**{"If-None-Match": first.headers["etag"]})
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["etag"] == first.headers["etag"]
+
+    r = download(**{"If-Modified-Since": first.headers["last-modified"]})
+    assert r.status_code == 304
+
+    # If-None-Match wins over If-Modified-Since
+    r = download(**{"If-None-Match": '"stale"', "If-Modified-Since": first.headers["last-modified"]})
+    assert r.status_code == 200
+    assert r.content == FIXTURE
+
+
+def test_single_range(download):
+    r = download(Range="bytes=100-199")
+    assert r.status_code == 206
+    assert r.headers["content-range"] == f"bytes 100-199/{len(FIXTURE)}"
+    assert r.content == FIXTURE[100:200]
+
+    r = download(Range="bytes=-10")
+    assert r.status_code == 206
+    assert r.headers["content-range"] == f"bytes {len(FIXTURE) - 10}-{len(FIXTURE) - 1}/{len(FIXTURE)}"
+    assert r.content == FIXTURE[-10:]
+
+
+def test_multiple_ranges(download):
+    r = download(Range="bytes=0-9,5-19,1000-1099")
+    assert r.status_code == 206
+    ctype = r.headers["content-type"]
+    assert ctype.startswith("multipart/byteranges; boundary=")
+    boundary = ctype.split("boundary=")[1].encode()
+    assert int(r.headers["content-length"]) == len(r.content)
+
+    parts = []
+    for chunk in r.content.split(b"--" + boundary)[1:-1]:
+        head, _, body = chunk.partition(b"\r\n\r\n")
+        parts.append((head, body[:-2]))  # the CRLF before the next delimiter
+    # overlapping ranges are merged
+    assert [h.split(b"Content-Range: ")[1] for h, _ in parts] == [
+        f"bytes 0-19/{len(FIXTURE)}".encode(),
+        f"bytes 1000-1099/{len(FIXTURE)}".encode(),
+    ]
+    assert [b for _, b in parts] == [FIXTURE[0:20], FIXTURE[1000:1100]]
+
+
+def test_unsatisfiable_range(download):
+    r = download(Range=f"bytes={len(FIXTURE)}-")
+    assert r.status_code == 416
+    assert r.headers["content-range"] == f"bytes */{len(FIXTURE)}"
+
+
+def test_if_range(download):
+    etag = download().headers["etag"]
+    r = download(Range="bytes=0-9", **{"If-Range": etag})
+    assert r.status_code == 206
+    assert r.content == FIXTURE[:10]
+
+    r = download(Range="bytes=0-9", **{"If-Range": '"changed"'})
+    assert r.status_code == 200
+    assert r.content == FIXTURE
@@ -0,0 +1,73 @@
+# server/tests/test_extract.py
+import asyncio
+import time
+
+import pytest
+from docx import Document
+
+from app.core import extract
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+
+@pytest.fixture
+def one_worker(monkeypatch):
+    """A fresh single-worker pool, so one slow job keeps the next one queued."""
+    monkeypatch.setattr(settings, "EXTRACT_WORKERS", 1)
+    extract.shutdown()
+    yield extract._get_pool()
+    extract.shutdown()
+
+
+@pytest.fixture
+def resume(tmp_path):
+    doc = Document()
+    doc.add_paragraph("python")
+    path = tmp_path / "resume.docx"
+    doc.save(path)
+    return path
+
+
+def _settle():
+    deadline = time.monotonic() + 10
+    while extract.stats()["in_flight"] and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return extract.stats()["in_flight"]
+
+
+def test_time_in_the_queue_does_not_count_against_the_deadline(one_worker, resume, monkeypatch):
+    monkeypatch.setattr(extract, "_grace", lambda: 2.0)
+    busy = one_worker.submit(time.sleep, 3)
+
+    assert extract.extract_text(resume).strip() == "python"
+    assert busy.done()
+    # neither remembered as a timeout nor cut off by a pool reset
+    assert extract.extract_text(resume).strip() == "python"
+
+
+def test_timed_out_path_is_retried_once_its_entry_expires(one_worker, resume, monkeypatch):
+    assert extract._poisoned.ttl == settings.EXTRACT_POISON_TTL_S
+    monkeypatch.setattr(extract, "_poisoned", LRUCache(16, ttl=0.2))
+    extract._poisoned.set(str(resume), True)
+
+    with pytest.raises(extract.ExtractionTimeout):
+        extract.extract_text(resume)
+    time.sleep(0.3)
+    assert extract.extract_text(resume).strip() == "python"
+
+
+def test_cancelled_waiter_gives_its_slot_back(one_worker, resume):
+    one_worker.submit(time.sleep, 1)
+
+    async def main():
+        task = asyncio.create_task(extract.extract_text_async(resume))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert extract.stats()["in_flight"] == 1  # still queued in the pool
+    assert _settle() == 0
+    assert extract._slots.acquire(blocking=False)
+    extract._slots.release()
@@ -0,0 +1,31 @@
+# server/tests/test_funnel.py
+
+
+def _setup(client, auth, n):
+    job = client.post("/api/jobs", json={"title": "Engineer", "description": "python"}, headers=auth).json()["id"]
+    resume = client.post(
+        "/api/resumes", files={"file": ("r.txt", b"python", "text/plain")}, headers=auth
+    ).json()["id"]
+    items = [{"job_id": job, "resume_id": resume, "status": "draft"} for _ in range(n)]
+    results = client.post("/api/applications/batch", json={"items": items}, headers=auth).json()
+    return [r["application"]["id"] for r in results]
+
+
+def _counts(client, auth):
+    return client.get("/api/applications/analytics", headers=auth).json()["status_counts"]
+
+
+def test_repeated_moves_are_counted_once(client, auth):
+    ids = _setup(client, auth, 4)
+    assert _counts(client, auth) == {"draft": 4}
+
+    body = {"ids": ids[:3], "status": "submitted"}
+    for _ in range(2):  # the second request finds nothing left to move
+        r = client.patch("/api/applications/status", json=body, headers=auth)
+        assert all(res["updated"] for res in r.json())
+    assert _counts(client, auth) == {"draft": 1, "submitted": 3}
+
+    client.patch("/api/applications/status", json={"ids": ids, "status": "rejected"}, headers=auth)
+    assert _counts(client, auth) == {"rejected": 4}
+    statuses = {a["status"] for a in client.get("/api/applications", headers=auth).json()}
+    assert statuses == {"rejected"}
@@ -0,0 +1,29 @@
+# server/tests/test_job_import.py
+import json
+
+
+def _ndjson(records) -> bytes:
+    return "".join(json.dumps(r) + "\n" for r in records).encode()
+
+
+def test_import_reports_bad_lines_and_keeps_order(client, auth):
+    records = [
+        {"title": "First", "description": "python"},
+        {"title": "x" * 256, "description": "too long a title"},
+        {"description": "Title: Guessed\nrust"},
+        {"title": "Last", "description": "go"},
+    ]
+    r = client.post(
+        "/api/jobs/import",
+        content=_ndjson(records),
+        headers={**auth, "Content-Type": "application/x-ndjson"},
+    )
+    assert r.status_code == 200, r.text
+    out = r.json()
+    assert out["created"] == 3
+    assert [e["index"] for e in out["errors"]] == [2]
+    assert "title" in out["errors"][0]["error"]
+
+    # job_ids line up with the accepted records
+    jobs = {j["id"]: j["title"] for j in client.get("/api/jobs", headers=auth).json()}
+    assert [jobs[i] for i in out["job_ids"]] == ["First", "Guessed", "Last"]
@@ -0,0 +1,39 @@
+# server/tests/test_pagination.py
+from datetime import timedelta
+
+from app.db.database import SessionLocal
+from app.db.models import Job
+
+
+def test_pages_cover_both_sqlite_timestamp_formats(client, auth):
+    # through the API: created_at is CURRENT_TIMESTAMP, stored without a fraction
+    first = client.post("/api/jobs", json={"title": "Server 0", "description": "x"}, headers=auth).json()["id"]
+    for i in range(1, 4):
+        client.post("/api/jobs", json={"title": f"Server {i}", "description": "x"}, headers=auth)
+    with SessionLocal() as db:
+        job = db.get(Job, first)
+        user_id, second = job.user_id, job.created_at
+        # written by the ORM, stored with a fraction, in and around the same second
+        db.add_all(
+            Job(user_id=user_id, title=f"ORM {i}", description="x", created_at=second + timedelta(microseconds=us))
+            for i, us in enumerate((0, 0, 1, 500_000, -1, 1_000_000))
+        )
+        db.commit()
+
+    expected = [j["id"] for j in client.get("/api/jobs", headers=auth).json()]
+    assert len(expected) == 10
+
+    seen, params = [], {"limit": 1}  # every row ends a page
+    while True:
+        r = client.get("/api/jobs", params=params, headers=auth)
+        assert r.status_code == 200, r.text
+        seen += [j["id"] for j in r.json()]
+        if "X-Next-Cursor" not in r.headers:
+            break
+        params["cursor"] = r.headers["X-Next-Cursor"]
+    assert seen == expected
+
+
+def test_malformed_cursor_is_rejected(client, auth):
+    r = client.get("/api/jobs", params={"cursor": "bm90LWpzb24"}, headers=auth)
+    assert r.status_code == 400
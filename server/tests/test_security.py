@@ -0,0 +1,35 @@
+# server/tests/test_security.py
+import asyncio
+import threading
+
+import pytest
+
+from app.core import security
+
+
+def test_cancelled_hash_keeps_its_slot_until_the_job_finishes():
+    started, finish = threading.Event(), threading.Event()
+
+    def job():
+        started.set()
+        finish.wait(5)
+        return "hash"
+
+    async def main():
+        free = security._hash_slots._value
+        task = asyncio.create_task(security._run_hashing(job))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # the request is gone but bcrypt is still busy with it
+        assert security._hash_slots._value == free - 1
+
+        finish.set()
+        for _ in range(500):
+            if security._hash_slots._value == free:
+                break
+            await asyncio.sleep(0.01)
+        assert security._hash_slots._value == free
+
+    asyncio.run(main())
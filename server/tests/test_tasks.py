@@ -0,0 +1,87 @@
+# server/tests/test_tasks.py
+from datetime import datetime, timedelta
+
+from app.core import tasks
+from app.db.database import SessionLocal
+from app.db.models import Task
+
+
+def _drain(client) -> int:
+    # TASK_WORKER=manual: nothing runs until the queue is drained on the app's loop
+    return client.portal.call(tasks.worker.drain)
+
+
+def _analyze(client, auth, text="Title: Backend\npython"):
+    r = client.post("/api/tasks/analyze-job", json={"jd_text": text}, headers=auth)
+    assert r.status_code == 202, r.text
+    return r.json()
+
+
+def _task(client, auth, task_id):
+    return client.get(f"/api/tasks/{task_id}", headers=auth).json()
+
+
+def test_submitted_task_runs_when_drained(client, auth):
+    task = _analyze(client, auth)
+    assert task["status"] == "queued"
+
+    assert _drain(client) >= 1
+    done = _task(client, auth, task["id"])
+    assert done["status"] == "succeeded"
+    jobs = client.get("/api/jobs", headers=auth).json()
+    assert [j["id"] for j in jobs] == [done["result"]["id"]]
+
+
+def test_identical_active_task_is_returned(client, auth):
+    first = _analyze(client, auth)
+    assert _analyze(client, auth)["id"] == first["id"]
+    assert _analyze(client, auth, "Title: Other\ngo")["id"] != first["id"]
+
+    _drain(client)
+    assert _analyze(client, auth)["id"] != first["id"]  # the first one has finished
+    _drain(client)
+
+
+def test_racing_identical_submit_gets_the_winners_row(client, auth, monkeypatch):
+    first = _analyze(client, auth)
+    lookup, calls = tasks._active, []
+
+    async def racing(db, user_id, key):
+        # the first lookup runs before the other submit commits
+        calls.append(key)
+        return None if len(calls) == 1 else await lookup(db, user_id, key)
+
+    monkeypatch.setattr(tasks, "_active", racing)
+    assert _analyze(client, auth)["id"] == first["id"]
+    assert len(calls) == 2
+    _drain(client)
+
+
+def test_failing_handler_records_its_error(client, auth):
+    r = client.post("/api/tasks/score", json={"resume_id": 10**9, "job_id": 10**9}, headers=auth)
+    assert r.status_code == 202, r.text
+
+    _drain(client)
+    failed = _task(client, auth, r.json()["id"])
+    assert failed["status"] == "failed"
+    assert failed["status_code"] == 404
+    assert failed["error"]
+
+
+def test_only_silent_running_tasks_are_requeued(client, auth):
+    orphaned = _analyze(client, auth, "Title: Orphaned\npython")["id"]
+    alive = _analyze(client, auth, "Title: Alive\npython")["id"]
+    long_ago = datetime.utcnow() - timedelta(hours=1)
+    with SessionLocal() as db:
+        for task_id, heartbeat in ((orphaned, long_ago), (alive, datetime.utcnow())):
+            task = db.get(Task, task_id)
+            task.status, task.started_at, task.heartbeat_at = "running", long_ago, heartbeat
+        db.commit()
+
+    assert client.portal.call(tasks.requeue_stale) == 1
+    assert _task(client, auth, orphaned)["status"] == "queued"
+    assert _task(client, auth, alive)["status"] == "running"
+
+    _drain(client)
+    assert _task(client, auth, orphaned)["status"] == "succeeded"
+    assert _task(client, auth, alive)["status"] == "running"
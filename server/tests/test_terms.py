@@ -0,0 +1,22 @@
+# server/tests/test_terms.py
+import pytest
+
+from app.core import terms
+from app.db.database import SessionLocal
+
+
+def test_intern_terms_returns_every_word():
+    with SessionLocal() as db:
+        ids = terms.intern_terms(db, ["kubernetes", "terraform", "kubernetes"])
+        assert set(ids) == {"kubernetes", "terraform"}
+        assert terms.intern_terms(db, ["terraform"]) == {"terraform": ids["terraform"]}
+        db.rollback()
+
+
+def test_intern_terms_raises_when_words_stay_missing(monkeypatch):
+    # a lookup that never sees the rows, as if another writer kept winning
+    monkeypatch.setattr(terms, "lookup_terms", lambda db, words: {})
+    with SessionLocal() as db:
+        with pytest.raises(terms.TermInternError):
+            terms.intern_terms(db, ["haskell"])
+        db.rollback()